@@ -87,6 +87,25 @@ def build_pool_tool_specs() -> List[Dict[str, Any]]:
                 "required": [],
             },
         },
+        {
+            "type": "function",
+            "name": "get_pool_metrics",
+            "description": (
+                "Get agent pool instrumentation: acquire wait and creation latency "
+                "histograms, time in each state, reuse ratio and task durations per expert."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "prometheus"],
+                        "description": "Structured JSON (default) or Prometheus exposition text"
+                    },
+                },
+                "required": [],
+            },
+        },
     ]
 
 
@@ -145,6 +164,22 @@ def build_workflow_tool_specs() -> List[Dict[str, Any]]:
                                 "agent_id": {"type": "string"},
                                 "duration": {"type": "number"},
                                 "dependencies": {"type": "array", "items": {"type": "string"}},
+                                "cacheable": {
+                                    "type": "boolean",
+                                    "description": "Reuse result of an identical earlier run (read-only tasks only)",
+                                },
+                                "idempotent": {
+                                    "type": "boolean",
+                                    "description": "Safe to run twice; slow runs may get a duplicate attempt",
+                                },
+                                "timeout": {
+                                    "type": "number",
+                                    "description": "Seconds before the task is cancelled and marked timed out",
+                                },
+                                "stream_chunks": {
+                                    "type": "boolean",
+                                    "description": "In a pipeline, process upstream output chunk by chunk (one agent call per chunk)",
+                                },
                             },
                             "required": ["description", "agent_id"],
                         },
@@ -158,6 +193,48 @@ def build_workflow_tool_specs() -> List[Dict[str, Any]]:
                 "required": ["goal", "tasks"],
             },
         },
+        {
+            "type": "function",
+            "name": "plan_template_workflow",
+            "description": (
+                "Create a workflow plan from a predefined template such as "
+                "feature_development, bug_fix or code_review. Read-only steps "
+                "reuse results of identical earlier runs."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "template": {
+                        "type": "string",
+                        "description": "Template name"
+                    },
+                    "goal": {
+                        "type": "string",
+                        "description": "What the workflow should achieve"
+                    },
+                },
+                "required": ["template", "goal"],
+            },
+        },
+        {
+            "type": "function",
+            "name": "resume_workflow",
+            "description": (
+                "Resume an interrupted or failed workflow execution from its "
+                "checkpoint. Completed tasks are kept and not run again. "
+                "Call without execution_id to list resumable executions."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "execution_id": {
+                        "type": "string",
+                        "description": "Execution identifier to resume"
+                    },
+                },
+                "required": [],
+            },
+        },
         {
             "type": "function",
             "name": "get_workflow_status",
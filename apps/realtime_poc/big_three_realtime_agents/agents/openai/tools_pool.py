@@ -20,6 +20,7 @@ class PoolTools:
         - list_expert_pool: List available expert agents
         - create_pool_agent: Create agent from pool
         - get_pool_status: Get pool instance status
+        - get_pool_metrics: Get pool utilization and latency metrics
     """
 
     def __init__(self, pool_integration):
@@ -118,6 +119,25 @@ class PoolTools:
             self.logger.error(f"Failed to get pool status: {exc}")
             return {"ok": False, "error": str(exc)}
 
+    def get_pool_metrics(self, format: str = "json") -> Dict[str, Any]:
+        """
+        Get pool utilization and latency metrics.
+
+        Args:
+            format: "json" for structured metrics, "prometheus" for exposition text
+
+        Returns:
+            Dict with metrics snapshot (or Prometheus text under "text")
+        """
+        try:
+            if format == "prometheus":
+                return {"ok": True, "text": self.pool.get_pool_metrics("prometheus")}
+            return {"ok": True, "metrics": self.pool.get_pool_metrics("json")}
+
+        except Exception as exc:
+            self.logger.error(f"Failed to get pool metrics: {exc}")
+            return {"ok": False, "error": str(exc)}
+
     def search_experts(self, query: str) -> Dict[str, Any]:
         """
         Search expert pool by keyword.
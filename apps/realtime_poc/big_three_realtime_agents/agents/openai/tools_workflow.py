@@ -5,7 +5,8 @@ Provides tools for planning and executing multi-agent workflows.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
 
 from ...workflow.workflow_models import ExecutionStrategy
 
@@ -20,11 +21,15 @@ class WorkflowTools:
 
     Tools:
         - plan_simple_workflow: Create simple workflow
+        - plan_template_workflow: Create workflow from a predefined template
         - execute_workflow: Execute planned workflow
+        - resume_workflow: Continue an interrupted execution from its checkpoint
         - get_workflow_status: Check workflow status
     """
 
-    def __init__(self, workflow_planner, execution_engine, memory_manager):
+    def __init__(
+        self, workflow_planner, execution_engine, memory_manager, template_registry=None
+    ):
         """
         Initialize workflow tools.
 
@@ -32,13 +37,27 @@ class WorkflowTools:
             workflow_planner: WorkflowPlanner instance
             execution_engine: ExecutionEngine instance
             memory_manager: MemoryManager instance
+            template_registry: WorkflowTemplateRegistry for template workflows
         """
         self.planner = workflow_planner
         self.engine = execution_engine
         self.memory = memory_manager
+        self.templates = template_registry
         self.active_workflows: Dict[str, Any] = {}
+        self.workflow_events: Dict[str, Deque[Dict[str, Any]]] = {}
         self.logger = logger
 
+        # Keep recent progress of active workflows for get_workflow_status
+        self.engine.events.subscribe(self._record_event)
+
+    def _record_event(self, event) -> None:
+        """Remember a progress event of an active workflow."""
+        if event.plan_id not in self.active_workflows:
+            return
+        entry = event.to_dict()
+        entry["data"] = {k: v for k, v in event.data.items() if k != "result"}
+        self.workflow_events.setdefault(event.plan_id, deque(maxlen=20)).append(entry)
+
     def plan_simple_workflow(
         self,
         task: str,
@@ -51,7 +70,7 @@ class WorkflowTools:
         Args:
             task: Task description
             agent_id: Expert agent to use
-            strategy: "sequential" or "parallel"
+            strategy: "sequential", "parallel" or "pipeline"
 
         Returns:
             Dict with plan details
@@ -72,6 +91,7 @@ class WorkflowTools:
                 "goal": plan.goal,
                 "tasks": len(plan.get_all_tasks()),
                 "estimated_duration": plan.estimated_total_duration,
+                "duration_estimates": plan.metadata.get("duration_estimates", {}),
                 "visualization": visualization,
             }
 
@@ -112,6 +132,7 @@ class WorkflowTools:
                 "goal": plan.goal,
                 "tasks": len(plan.get_all_tasks()),
                 "estimated_duration": plan.estimated_total_duration,
+                "duration_estimates": plan.metadata.get("duration_estimates", {}),
                 "visualization": self.planner.visualize_plan(plan),
             }
 
@@ -119,12 +140,59 @@ class WorkflowTools:
             self.logger.error(f"Failed to plan multi-task workflow: {exc}")
             return {"ok": False, "error": str(exc)}
 
-    async def execute_workflow(self, plan_id: str) -> Dict[str, Any]:
+    def plan_template_workflow(self, template: str, goal: str) -> Dict[str, Any]:
+        """
+        Create workflow from a predefined template.
+
+        Args:
+            template: Template name (e.g. "code_review")
+            goal: What the workflow should achieve
+
+        Returns:
+            Dict with plan details
+        """
+        workflow_template = self.templates.get(template) if self.templates else None
+        if workflow_template is None:
+            return {"ok": False, "error": f"Workflow template '{template}' not found"}
+
+        try:
+            plan = self.planner.create_template_plan(workflow_template, goal)
+
+            # Store plan
+            self.active_workflows[plan.plan_id] = plan
+
+            # Store in memory
+            self.memory.store(f"workflow_plan_{plan.plan_id}", plan.goal)
+
+            return {
+                "ok": True,
+                "plan_id": plan.plan_id,
+                "goal": plan.goal,
+                "template": template,
+                "tasks": len(plan.get_all_tasks()),
+                "estimated_duration": plan.estimated_total_duration,
+                "duration_estimates": plan.metadata.get("duration_estimates", {}),
+                "visualization": self.planner.visualize_plan(plan),
+            }
+
+        except Exception as exc:
+            self.logger.error(f"Failed to plan template workflow: {exc}")
+            return {"ok": False, "error": str(exc)}
+
+    async def execute_workflow(
+        self,
+        plan_id: str,
+        mode: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a planned workflow.
 
         Args:
             plan_id: Plan identifier
+            mode: "stages" (default) or "dag" to start tasks as soon as
+                their dependencies complete
+            deadline_seconds: Time limit for the whole workflow
 
         Returns:
             Dict with execution result
@@ -137,11 +205,14 @@ class WorkflowTools:
             }
 
         try:
-            result = await self.engine.execute_plan(plan)
+            result = await self.engine.execute_plan(
+                plan, mode=mode, deadline_seconds=deadline_seconds
+            )
 
             # Clean up completed plan
-            if result["status"] in ("completed", "failed"):
+            if result["status"] in ("completed", "failed", "timed_out"):
                 self.active_workflows.pop(plan_id, None)
+                self.workflow_events.pop(plan_id, None)
 
             return {
                 "ok": True,
@@ -152,6 +223,35 @@ class WorkflowTools:
             self.logger.error(f"Failed to execute workflow: {exc}")
             return {"ok": False, "error": str(exc)}
 
+    async def resume_workflow(self, execution_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Resume an interrupted or failed workflow execution.
+
+        Completed tasks are not run again.
+
+        Args:
+            execution_id: Execution to resume (omit to list resumable executions)
+
+        Returns:
+            Dict with execution result, or resumable executions
+        """
+        if not execution_id:
+            return {
+                "ok": True,
+                "resumable": self.memory.workflow.list_checkpoints(),
+            }
+
+        try:
+            result = await self.engine.resume_execution(execution_id)
+            return {
+                "ok": True,
+                **result
+            }
+
+        except Exception as exc:
+            self.logger.error(f"Failed to resume workflow: {exc}")
+            return {"ok": False, "error": str(exc)}
+
     def get_workflow_status(self, plan_id: str) -> Dict[str, Any]:
         """
         Get status of active workflow.
@@ -169,19 +269,22 @@ class WorkflowTools:
                 "error": f"Workflow '{plan_id}' not found or completed"
             }
 
+        tasks = plan.get_all_tasks()
         return {
             "ok": True,
             "plan_id": plan.plan_id,
             "goal": plan.goal,
             "is_complete": plan.is_complete(),
             "has_failures": plan.has_failures(),
-            "total_tasks": len(plan.get_all_tasks()),
+            "total_tasks": len(tasks),
+            "finished_tasks": sum(1 for t in tasks if t.status.value not in ("pending", "running")),
             "tasks": [
                 {
                     "task_id": t.task_id,
                     "status": t.status.value,
                     "agent_id": t.agent_id,
                 }
-                for t in plan.get_all_tasks()
+                for t in tasks
             ],
+            "recent_events": list(self.workflow_events.get(plan_id, [])),
         }
@@ -8,6 +8,9 @@ Modules:
     agent_loader: Parse and load agent definitions from markdown
     pool_manager: Manage agent instances and lifecycle
     agent_selector: AI-powered agent selection
+    trigger_index: Inverted index backing selector scoring
+    expert_ranker: Vectorized TF-IDF/BM25 expert ranking
+    selection_cache: Memoized selections keyed by normalized task
     expert_definition: Agent template data structures
 
 Example:
@@ -19,12 +22,20 @@ Example:
 from .agent_loader import AgentDefinitionLoader
 from .pool_manager import AgentPoolManager
 from .agent_selector import IntelligentAgentSelector
-from .expert_definition import ExpertDefinition, AgentInstance
+from .expert_ranker import ExpertRankingMatrix, RankingMode
+from .selection_cache import SelectionCache, task_fingerprint, task_tokens
+from .expert_definition import ExpertDefinition, ExpertSections, AgentInstance
 
 __all__ = [
     "AgentDefinitionLoader",
     "AgentPoolManager",
     "IntelligentAgentSelector",
+    "ExpertRankingMatrix",
+    "RankingMode",
+    "SelectionCache",
+    "task_fingerprint",
+    "task_tokens",
     "ExpertDefinition",
+    "ExpertSections",
     "AgentInstance",
 ]
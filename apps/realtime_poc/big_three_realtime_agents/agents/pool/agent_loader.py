@@ -2,15 +2,17 @@
 Agent definition loader from markdown files.
 
 Parses agent definition markdown files from agentpool directory
-and converts them to ExpertDefinition objects.
+and converts them to ExpertDefinition objects. Only the summary needed
+for selection (frontmatter, triggers, focus areas) is kept eagerly;
+heavy sections are parsed on demand.
 """
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Any
 import logging
 
-from .expert_definition import ExpertDefinition, AgentTier
+from .expert_definition import ExpertDefinition, ExpertSections, AgentTier
 
 logger = logging.getLogger(__name__)
 
@@ -77,9 +79,35 @@ class AgentDefinitionLoader:
                 experts.append(expert)
                 self._cache[expert.agent_id] = expert
 
-        logger.info(f"Loaded {len(experts)} agent definitions from pool")
+        stats = self.get_memory_stats()
+        logger.info(
+            f"Loaded {len(experts)} agent definitions from pool "
+            f"(summary {stats['summary_bytes'] // 1024} KB, "
+            f"deferred {stats['deferred_bytes'] // 1024} KB)"
+        )
         return experts
 
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """
+        Report resident memory of cached definitions.
+
+        Returns:
+            Dict with summary bytes, resident section bytes, and the
+            source bytes deferred by not loading sections eagerly
+        """
+        experts = list(self._cache.values())
+        summary_bytes = sum(e.summary_size() for e in experts)
+        section_bytes = sum(e.sections_size() for e in experts)
+        deferred_bytes = sum(e.source_bytes for e in experts if not e.sections_loaded)
+
+        return {
+            "experts": len(experts),
+            "sections_loaded": sum(1 for e in experts if e.sections_loaded),
+            "summary_bytes": summary_bytes,
+            "section_bytes": section_bytes,
+            "deferred_bytes": deferred_bytes,
+        }
+
     def _find_agent_file(self, agent_id: str) -> Optional[Path]:
         """Find markdown file for agent ID."""
         # Try exact match
@@ -95,7 +123,10 @@ class AgentDefinitionLoader:
 
     def _parse_markdown(self, file_path: Path) -> Optional[ExpertDefinition]:
         """
-        Parse markdown file to ExpertDefinition.
+        Parse markdown file to summary ExpertDefinition.
+
+        Heavy sections are not retained; they are loaded through
+        ``_load_sections`` the first time they are accessed.
 
         Args:
             file_path: Path to markdown file
@@ -117,10 +148,10 @@ class AgentDefinitionLoader:
         # Determine tier from path
         tier = self._determine_tier(file_path)
 
-        # Parse sections
-        sections = self._parse_sections(content)
+        # Parse only the sections needed for selection
+        sections = self._parse_sections(content, only=("Triggers", "Focus Areas"))
 
-        # Build ExpertDefinition
+        # Build summary ExpertDefinition
         expert = ExpertDefinition(
             agent_id=frontmatter.get("name", file_path.stem),
             name=frontmatter.get("name", file_path.stem).replace("-", " ").title(),
@@ -128,16 +159,41 @@ class AgentDefinitionLoader:
             category=frontmatter.get("category", "general"),
             tier=tier,
             triggers=self._parse_list_section(sections.get("Triggers", "")),
-            behavioral_mindset=sections.get("Behavioral Mindset", "").strip(),
             focus_areas=self._parse_list_section(sections.get("Focus Areas", "")),
-            key_actions=self._parse_list_section(sections.get("Key Actions", "")),
-            outputs=self._parse_list_section(sections.get("Outputs", "")),
-            boundaries=self._parse_boundaries(sections.get("Boundaries", "")),
             file_path=str(file_path),
+            source_bytes=len(content.encode("utf-8")),
+            section_loader=self._load_sections,
         )
 
         return expert
 
+    def _load_sections(self, expert: ExpertDefinition) -> ExpertSections:
+        """
+        Load heavy sections for an expert from its markdown file.
+
+        Args:
+            expert: Summary definition whose sections to load
+
+        Returns:
+            ExpertSections (empty if the file can no longer be read)
+        """
+        try:
+            content = Path(expert.file_path).read_text(encoding="utf-8")
+        except Exception as exc:
+            logger.error(f"Failed to load sections for {expert.agent_id}: {exc}")
+            return ExpertSections()
+
+        sections = self._parse_sections(content)
+
+        logger.debug(f"Loaded sections for {expert.agent_id}")
+
+        return ExpertSections(
+            behavioral_mindset=sections.get("Behavioral Mindset", "").strip(),
+            key_actions=self._parse_list_section(sections.get("Key Actions", "")),
+            outputs=self._parse_list_section(sections.get("Outputs", "")),
+            boundaries=self._parse_boundaries(sections.get("Boundaries", "")),
+        )
+
     def _parse_frontmatter(self, content: str) -> Optional[Dict[str, str]]:
         """Extract YAML frontmatter from markdown."""
         match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
@@ -152,22 +208,32 @@ class AgentDefinitionLoader:
 
         return frontmatter
 
-    def _parse_sections(self, content: str) -> Dict[str, str]:
-        """Parse markdown sections (## Headers)."""
+    def _parse_sections(
+        self,
+        content: str,
+        only: Optional[tuple] = None
+    ) -> Dict[str, str]:
+        """
+        Parse markdown sections (## Headers).
+
+        Args:
+            content: Markdown content
+            only: Optional section names to keep (others are skipped)
+        """
         sections = {}
         current_section = None
         current_content = []
 
         for line in content.split('\n'):
             if line.startswith('## '):
-                if current_section:
+                if current_section and (only is None or current_section in only):
                     sections[current_section] = '\n'.join(current_content).strip()
                 current_section = line[3:].strip()
                 current_content = []
             elif current_section:
                 current_content.append(line)
 
-        if current_section:
+        if current_section and (only is None or current_section in only):
             sections[current_section] = '\n'.join(current_content).strip()
 
         return sections
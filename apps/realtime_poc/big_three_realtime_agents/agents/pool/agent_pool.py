@@ -7,12 +7,20 @@ Manages expert agent instances with dynamic allocation, reuse, and lifecycle man
 import logging
 import threading
 import asyncio
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Deque, Dict, FrozenSet, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from datetime import datetime, timezone
 import json
+import time
+from collections import OrderedDict, deque
+
+from .context_window import ContextWindow
+from .pool_metrics import PoolMetrics
+from .selection_cache import task_tokens
+from .coordination import GRANTED, OWNED
+from ...exceptions import PoolCapacityError
 
 
 logger = logging.getLogger(__name__)
@@ -52,23 +60,85 @@ class AgentInstance:
     last_used_at: Optional[datetime]
     current_task: Optional[str]
     task_history: List[str]
-    accumulated_context: str      # Context from previous tasks
+    context_window: ContextWindow = field(default_factory=ContextWindow)  # Bounded context from previous tasks
+
+    @property
+    def accumulated_context(self) -> str:
+        """Rendered context from previous tasks."""
+        return self.context_window.render()
+
+    @accumulated_context.setter
+    def accumulated_context(self, text: str) -> None:
+        self.context_window.reset(text)
+
+
+# Waiter result granting a free instance slot (caller creates the instance)
+_SLOT = object()
+
+# Attempt result: the coordinator denied a lease (expert at its global cap)
+_GLOBAL_CAPACITY = object()
+
+
+@dataclass
+class _AcquireWaiter:
+    """Caller queued for an expert until an instance or slot frees up."""
+    expert_id: str
+    future: asyncio.Future
+    task_description: str
+    enqueued_at: float
 
 
 class AgentPoolManager:
     """Expert agent pool manager with instance lifecycle management."""
 
-    def __init__(self, pool_definition_path: str = None, logger_instance=None):
+    def __init__(
+        self,
+        pool_definition_path: str = None,
+        logger_instance=None,
+        context_max_entries: int = 8,
+        context_token_budget: int = 2000,
+        context_summarizer=None,
+        affinity_routing: bool = True,
+        affinity_min_score: float = 0.2,
+        affinity_history: int = 4,
+        coordinator=None,
+    ):
         """
         Initialize agent pool manager.
 
         Args:
             pool_definition_path: Path to expert definitions JSON
             logger_instance: Logger instance
+            context_max_entries: Recent task summaries kept per instance
+            context_token_budget: Token budget of per-instance context
+            context_summarizer: Optional async (texts) -> summary used to
+                condense older context in the background
+            affinity_routing: Route tasks to the idle instance whose recent
+                work overlaps most with the task (False = least recently used)
+            affinity_min_score: Minimum fraction of task tokens an instance
+                must share to count as an affinity match
+            affinity_history: Recent tasks per instance used for matching
+            coordinator: Optional PoolCoordinator enforcing ``max_instances``
+                across processes/hosts through a shared lease table
         """
         self.logger = logger_instance or logger
         self.pool_lock = threading.Lock()
 
+        self.context_max_entries = context_max_entries
+        self.context_token_budget = context_token_budget
+        self.context_summarizer = context_summarizer
+
+        self.affinity_routing = affinity_routing
+        self.affinity_min_score = affinity_min_score
+        self.affinity_history = affinity_history
+
+        self.coordinator = coordinator
+
+        # Busy instances whose lease was lost: terminated on release
+        self._lease_lost: set = set()
+        if coordinator is not None:
+            coordinator.on_leases_lost = self.handle_lost_leases
+
         # Load expert definitions
         self.expert_definitions: Dict[str, ExpertDefinition] = {}
         if pool_definition_path:
@@ -82,6 +152,58 @@ class AgentPoolManager:
         # Instance counters
         self.instance_counters: Dict[str, int] = {}
 
+        # Incrementally maintained indexes (guarded by pool_lock): idle
+        # instances per expert ordered by release time, and live
+        # (non-terminated) instance counts per expert
+        self._idle_instances: Dict[str, "OrderedDict[str, AgentInstance]"] = {}
+        self._live_counts: Dict[str, int] = {}
+
+        # FIFO of callers waiting per expert when max_instances is reached
+        self._waiters: Dict[str, "deque[_AcquireWaiter]"] = {}
+        self._wait_stats = {
+            "waits": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "timeouts": 0,
+            "cancellations": 0,
+        }
+
+        # Terminated instances awaiting removal, and totals reclaimed by reap()
+        self._terminated: set = set()
+        self._reclaimed = {
+            "idle_expired": 0,
+            "memory_evicted": 0,
+            "terminated_removed": 0,
+            "bytes_reclaimed": 0,
+        }
+
+        # Token sets of recent tasks per instance, and their union (for
+        # context-affinity routing of idle instances)
+        self._affinity_recent: Dict[str, Deque[FrozenSet[str]]] = {}
+        self._affinity_tokens: Dict[str, FrozenSet[str]] = {}
+        self._affinity_stats = {
+            "lookups": 0,
+            "hits": 0,
+            "fallbacks": 0,
+            "hit_score_total": 0.0,
+        }
+
+        # Instances restored from a snapshot, revived on first use
+        self._dormant: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dormant_counts: Dict[str, int] = {}
+        self._restore_stats = {"loaded": 0, "revived": 0, "skipped": 0}
+
+        # Latency, utilization and reuse instrumentation
+        self.metrics = PoolMetrics()
+
+        # Demand counters (read by WarmPoolController)
+        self._acquisition_counts: Dict[str, int] = {}
+        self._warm_hits = 0
+        self._cold_starts = 0
+
+        # Bumped whenever the expert catalog changes (selection caches key on it)
+        self.catalog_version = 0
+
         self.logger.info(
             f"AgentPoolManager initialized with {len(self.expert_definitions)} expert types"
         )
@@ -130,6 +252,16 @@ class AgentPoolManager:
 
         self.logger.info(f"Loaded {len(self.expert_definitions)} agents from markdown")
 
+    def register_expert(self, definition: ExpertDefinition) -> None:
+        """
+        Add or replace expert type in catalog.
+
+        Args:
+            definition: Expert definition
+        """
+        self.expert_definitions[definition.expert_id] = definition
+        self.catalog_version += 1
+
     def list_expert_types(self) -> List[Dict[str, Any]]:
         """List all available expert types."""
         return [
@@ -157,85 +289,482 @@ class AgentPoolManager:
                         inst.last_used_at.isoformat() if inst.last_used_at else None
                     ),
                     "task_count": len(inst.task_history),
+                    "context_bytes": inst.context_window.size_bytes(),
+                    "time_in_state": self.metrics.instance_state_seconds(inst.instance_id),
                 }
                 for inst in self.active_instances.values()
             ]
 
     async def acquire_expert(
-        self, expert_id: str, task_description: str, prefer_reuse: bool = True
+        self,
+        expert_id: str,
+        task_description: str,
+        prefer_reuse: bool = True,
+        timeout: Optional[float] = 0,
     ) -> Optional[AgentInstance]:
         """
         Acquire expert instance (reuse or create).
 
+        When ``max_instances`` is reached the caller can wait for an
+        instance to be released (or a slot to free up). Waiters are served
+        in FIFO order: a released instance is handed directly to the
+        oldest waiter, so later callers cannot overtake it. Cancelling the
+        awaiting task removes it from the queue. When the expert is at its
+        global cap (leases held by other nodes), the caller retries every
+        coordinator heartbeat within the same timeout.
+
         Args:
             expert_id: Expert type (e.g., "BackendExpert")
             task_description: Task description
             prefer_reuse: True to reuse idle instances
+            timeout: Seconds to wait when the expert is at capacity
+                (0 = fail immediately, None = wait indefinitely)
 
         Returns:
-            AgentInstance or None if allocation failed
+            AgentInstance or None if allocation failed or timed out
+        """
+        started = time.monotonic()
+        with self.pool_lock:
+            self._acquisition_counts[expert_id] = self._acquisition_counts.get(expert_id, 0) + 1
+
+        while True:
+            remaining = (
+                None if timeout is None
+                else max(0.0, timeout - (time.monotonic() - started))
+            )
+            instance = await self._try_acquire(
+                expert_id, task_description, prefer_reuse, remaining, started
+            )
+            if instance is not _GLOBAL_CAPACITY:
+                return instance
+
+            # Other nodes release leases on their heartbeat: retry after one
+            delay = self.coordinator.heartbeat_seconds
+            if remaining is not None:
+                delay = min(delay, remaining)
+            self.logger.debug(f"{expert_id} at global capacity, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _try_acquire(
+        self,
+        expert_id: str,
+        task_description: str,
+        prefer_reuse: bool,
+        timeout: Optional[float],
+        started: float,
+    ):
+        """
+        One acquisition attempt of acquire_expert().
+
+        Returns:
+            AgentInstance, None if allocation failed or timed out, or
+            _GLOBAL_CAPACITY if a lease was denied and the caller may wait
         """
         with self.pool_lock:
             # 1. Find idle instance
             if prefer_reuse:
-                idle_instance = self._find_idle_instance(expert_id)
+                idle_instance = self._find_idle_instance(expert_id, task_description)
                 if idle_instance:
+                    self._warm_hits += 1
                     self.logger.info(f"Reusing idle instance: {idle_instance.instance_id}")
-                    idle_instance.status = AgentStatus.RESERVED
+                    self._set_status(idle_instance, AgentStatus.RESERVED)
                     idle_instance.current_task = task_description
+                    self.metrics.record_acquire(expert_id, time.monotonic() - started, True)
                     return idle_instance
 
-            # 2. Check if can create new instance
-            if not self._can_create_instance(expert_id):
+            # 2. Reserve a slot for a new instance, or queue behind capacity
+            if self._can_create_instance(expert_id):
+                self._live_counts[expert_id] = self._live_counts.get(expert_id, 0) + 1
+                waiter = None
+            elif expert_id not in self.expert_definitions or timeout == 0:
                 self.logger.warning(
                     f"Cannot create new instance for {expert_id}: max instances reached"
                 )
+                self.metrics.record_acquire(expert_id, time.monotonic() - started, None)
                 return None
+            else:
+                waiter = _AcquireWaiter(
+                    expert_id=expert_id,
+                    future=asyncio.get_running_loop().create_future(),
+                    task_description=task_description,
+                    enqueued_at=time.monotonic(),
+                )
+                self._waiters.setdefault(expert_id, deque()).append(waiter)
+
+        if waiter is not None:
+            granted = await self._wait_for_grant(expert_id, waiter, timeout)
+            if granted is None or isinstance(granted, AgentInstance):
+                self.metrics.record_acquire(
+                    expert_id, time.monotonic() - started, None if granted is None else True
+                )
+                return granted
 
-            # 3. Create new instance
-            instance = await self._create_new_instance(expert_id, task_description)
-            self.logger.info(f"Created new instance: {instance.instance_id}")
-            return instance
+        # 3. Revive a snapshot instance or create a new one (slot already
+        #    counted, lock not held)
+        try:
+            instance, revived = await self._provision_instance(
+                expert_id, task_description, revive=prefer_reuse
+            )
+        except PoolCapacityError as exc:
+            with self.pool_lock:
+                self._free_slot(expert_id)
+            if timeout != 0:
+                return _GLOBAL_CAPACITY
+            self.logger.warning(str(exc))
+            self.metrics.record_acquire(expert_id, time.monotonic() - started, None)
+            return None
+        except BaseException:
+            with self.pool_lock:
+                self._free_slot(expert_id)
+            raise
+
+        with self.pool_lock:
+            if revived:
+                self._warm_hits += 1
+            else:
+                self._cold_starts += 1
+
+        self.metrics.record_acquire(expert_id, time.monotonic() - started, revived)
+        self.logger.info(
+            f"{'Revived' if revived else 'Created new'} instance: {instance.instance_id}"
+        )
+        return instance
 
-    def _find_idle_instance(self, expert_id: str) -> Optional[AgentInstance]:
-        """Find idle instance of given expert type."""
-        for inst in self.active_instances.values():
-            if inst.expert_id == expert_id and inst.status == AgentStatus.IDLE:
-                return inst
+    async def _wait_for_grant(
+        self, expert_id: str, waiter: _AcquireWaiter, timeout: Optional[float]
+    ):
+        """Wait for a handed-off instance or slot; None on timeout."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self.pool_lock:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # Granted while timing out: give it back to the next waiter
+                    self._return_grant(expert_id, waiter.future.result())
+                else:
+                    waiter.future.cancel()
+                    try:
+                        self._waiters[expert_id].remove(waiter)
+                    except ValueError:
+                        pass
+
+                if isinstance(exc, asyncio.TimeoutError):
+                    self._wait_stats["timeouts"] += 1
+                else:
+                    self._wait_stats["cancellations"] += 1
+
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.logger.warning(
+                f"Timed out after {timeout}s waiting for {expert_id} instance"
+            )
+            return None
+        finally:
+            waited = time.monotonic() - waiter.enqueued_at
+            with self.pool_lock:
+                self._wait_stats["waits"] += 1
+                self._wait_stats["wait_seconds_total"] += waited
+                self._wait_stats["wait_seconds_max"] = max(
+                    self._wait_stats["wait_seconds_max"], waited
+                )
+
+    def _next_waiter(self, expert_id: str) -> Optional[_AcquireWaiter]:
+        """Pop oldest live waiter (``pool_lock`` held)."""
+        waiters = self._waiters.get(expert_id)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.future.done():
+                return waiter
         return None
 
+    def _grant(self, waiter: _AcquireWaiter, grant) -> None:
+        """Resolve waiter future from any thread (``pool_lock`` held)."""
+        loop = waiter.future.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            waiter.future.set_result(grant)
+        else:
+            loop.call_soon_threadsafe(self._deliver, waiter, grant)
+
+    def _deliver(self, waiter: _AcquireWaiter, grant) -> None:
+        """Complete cross-thread grant on the waiter's loop."""
+        with self.pool_lock:
+            if waiter.future.done():
+                self._return_grant(waiter.expert_id, grant)
+            else:
+                waiter.future.set_result(grant)
+
+    def _hand_off(self, instance: AgentInstance) -> bool:
+        """Give released instance to the oldest waiter (``pool_lock`` held)."""
+        waiter = self._next_waiter(instance.expert_id)
+        if waiter is None:
+            return False
+
+        self._set_status(instance, AgentStatus.RESERVED)
+        instance.current_task = waiter.task_description
+        self._grant(waiter, instance)
+        return True
+
+    def _free_slot(self, expert_id: str) -> None:
+        """Release reserved instance slot (``pool_lock`` held)."""
+        self._live_counts[expert_id] -= 1
+        self._offer_slot(expert_id)
+
+    def _offer_slot(self, expert_id: str) -> None:
+        """Grant free instance slot to the oldest waiter (``pool_lock`` held)."""
+        waiter = self._next_waiter(expert_id)
+        if waiter is not None:
+            self._live_counts[expert_id] += 1
+            self._grant(waiter, _SLOT)
+
+    def _return_grant(self, expert_id: str, grant) -> None:
+        """Re-queue grant whose waiter went away (``pool_lock`` held)."""
+        if isinstance(grant, AgentInstance):
+            if not self._hand_off(grant):
+                self._set_status(grant, AgentStatus.IDLE)
+                grant.current_task = None
+        else:
+            self._free_slot(expert_id)
+
+    async def prewarm(self, expert_id: str, count: int = 1) -> int:
+        """
+        Create idle instances ahead of demand.
+
+        Only uses free capacity: never exceeds ``max_instances`` and hands
+        new instances to queued callers first.
+
+        Args:
+            expert_id: Expert type
+            count: Instances to create
+
+        Returns:
+            Number of instances created
+        """
+        created = 0
+        for _ in range(count):
+            with self.pool_lock:
+                if not self._can_create_instance(expert_id):
+                    break
+                self._live_counts[expert_id] = self._live_counts.get(expert_id, 0) + 1
+
+            try:
+                instance = await self._create_new_instance(expert_id, None)
+            except PoolCapacityError:
+                with self.pool_lock:
+                    self._free_slot(expert_id)
+                break
+            except BaseException:
+                with self.pool_lock:
+                    self._free_slot(expert_id)
+                raise
+
+            with self.pool_lock:
+                instance.last_used_at = datetime.now(timezone.utc)
+                if not self._hand_off(instance):
+                    self._set_status(instance, AgentStatus.IDLE)
+            created += 1
+
+        return created
+
+    def get_acquisition_counts(self) -> Dict[str, int]:
+        """Cumulative acquire_expert calls per expert."""
+        with self.pool_lock:
+            return dict(self._acquisition_counts)
+
+    def get_idle_count(self, expert_id: str) -> int:
+        """Number of idle instances of expert."""
+        with self.pool_lock:
+            return len(self._idle_instances.get(expert_id, ()))
+
+    def _find_idle_instance(
+        self, expert_id: str, task_description: Optional[str] = None
+    ) -> Optional[AgentInstance]:
+        """
+        Find idle instance of given expert type.
+
+        With affinity routing, idle instances are scored by the fraction of
+        task tokens found in their recent tasks and results; the best match
+        at or above ``affinity_min_score`` wins, so follow-up tasks land on
+        the instance that already holds the relevant context. Otherwise
+        (and on ties) the least recently used instance is returned.
+
+        Must be called with ``pool_lock`` held.
+        """
+        idle = self._idle_instances.get(expert_id)
+        if not idle:
+            return None
+
+        if self.affinity_routing and task_description:
+            best, best_score = self._best_affinity(idle, task_description)
+            if best_score is not None:
+                self._affinity_stats["lookups"] += 1
+                if best is not None:
+                    self._affinity_stats["hits"] += 1
+                    self._affinity_stats["hit_score_total"] += best_score
+                    return idle[best]
+                self._affinity_stats["fallbacks"] += 1
+
+        return next(iter(idle.values()))
+
+    def _best_affinity(self, instance_ids, task_description: str):
+        """
+        Best affinity match among instance IDs (``pool_lock`` held).
+
+        Returns:
+            (instance_id or None if below ``affinity_min_score``, best score),
+            or (None, None) when the task has no content tokens
+        """
+        wanted = task_tokens(task_description)
+        if not wanted:
+            return None, None
+
+        best, best_score = None, 0.0
+        for instance_id in instance_ids:
+            shared = self._affinity_tokens.get(instance_id)
+            if not shared:
+                continue
+            score = len(wanted & shared) / len(wanted)
+            if score > best_score:
+                best, best_score = instance_id, score
+
+        if best_score < self.affinity_min_score:
+            best = None
+        return best, best_score
+
+    def _remember_affinity(self, instance: AgentInstance, task_result: str) -> None:
+        """Add finished task to instance's affinity tokens (``pool_lock`` held)."""
+        text = f"{instance.current_task or ''} {task_result[:2000]}"
+        tokens = task_tokens(text)
+        if not tokens:
+            return
+
+        recent = self._affinity_recent.get(instance.instance_id)
+        if recent is None:
+            recent = self._affinity_recent[instance.instance_id] = deque(
+                maxlen=self.affinity_history
+            )
+        recent.append(tokens)
+        self._affinity_tokens[instance.instance_id] = frozenset().union(*recent)
+
     def _can_create_instance(self, expert_id: str) -> bool:
         """Check if new instance can be created."""
         expert_def = self.expert_definitions.get(expert_id)
         if not expert_def:
             return False
 
-        # Count current instances
-        current_count = sum(
-            1
-            for inst in self.active_instances.values()
-            if inst.expert_id == expert_id and inst.status != AgentStatus.TERMINATED
-        )
+        return self._live_counts.get(expert_id, 0) < expert_def.max_instances
+
+    def _set_status(self, instance: AgentInstance, status: AgentStatus) -> None:
+        """
+        Change instance status and keep idle queues and counters in sync.
+
+        Must be called with ``pool_lock`` held.
+        """
+        previous = instance.status
+        if previous == status:
+            return
 
-        return current_count < expert_def.max_instances
+        expert_id = instance.expert_id
+
+        if previous == AgentStatus.IDLE:
+            self._idle_instances[expert_id].pop(instance.instance_id, None)
+        elif status == AgentStatus.IDLE:
+            self._idle_instances.setdefault(expert_id, OrderedDict())[
+                instance.instance_id
+            ] = instance
+
+        if status == AgentStatus.TERMINATED:
+            self._live_counts[expert_id] -= 1
+            self._terminated.add(instance.instance_id)
+            if self.coordinator is not None:
+                self.coordinator.forget(instance.instance_id)
+        elif previous == AgentStatus.TERMINATED:
+            self._live_counts[expert_id] += 1
+            self._terminated.discard(instance.instance_id)
+
+        instance.status = status
+        self.metrics.record_state(instance.instance_id, status.value)
 
     async def _create_new_instance(
-        self, expert_id: str, task_description: str
+        self, expert_id: str, task_description: Optional[str]
     ) -> AgentInstance:
-        """Create new agent instance."""
-        expert_def = self.expert_definitions[expert_id]
-
-        # Generate instance ID
-        counter = self.instance_counters.get(expert_id, 0) + 1
-        self.instance_counters[expert_id] = counter
-        instance_id = f"{expert_id}#{counter}"
-
-        # Load system prompt
-        prompt_path = Path(expert_def.system_prompt_template)
-        if prompt_path.exists():
-            system_prompt = prompt_path.read_text(encoding="utf-8")
-        else:
-            system_prompt = f"You are {expert_def.name}. {expert_def.description}"
+        """
+        Create new agent instance (or revive one restored from a snapshot).
+
+        Called without ``pool_lock`` held; the caller has already counted
+        the instance against ``max_instances``.
+        """
+        instance, _ = await self._provision_instance(expert_id, task_description)
+        return instance
+
+    async def _provision_instance(
+        self, expert_id: str, task_description: Optional[str], revive: bool = True
+    ) -> Tuple[AgentInstance, bool]:
+        """
+        Create instance, or revive a dormant snapshot instance of the expert.
+
+        With a coordinator, the instance is leased first: IDs leased by
+        another node are skipped, and a denied lease raises
+        PoolCapacityError (the expert is at its global cap).
+
+        Called without ``pool_lock`` held; the caller has already counted
+        the instance against ``max_instances``.
+
+        Returns:
+            (instance, True if revived from a snapshot)
+        """
+        started = time.monotonic()
+
+        while True:
+            record = None
+            with self.pool_lock:
+                if revive and self._dormant_counts.get(expert_id):
+                    record = self._take_dormant_locked(
+                        self._pick_dormant(expert_id, task_description)
+                    )
+                    instance_id = record["instance_id"]
+                else:
+                    counter = self.instance_counters.get(expert_id, 0) + 1
+                    self.instance_counters[expert_id] = counter
+                    instance_id = f"{expert_id}#{counter}"
+
+            if self.coordinator is None:
+                break
+
+            try:
+                outcome = await self.coordinator.claim(
+                    expert_id, instance_id, self.expert_definitions[expert_id].max_instances
+                )
+            except BaseException:
+                if record is not None:
+                    with self.pool_lock:
+                        self._put_dormant_locked(record)
+                raise
+
+            if outcome == GRANTED:
+                break
+            if outcome == OWNED:
+                # Live on another node: drop stale snapshot record / skip ID
+                continue
+
+            if record is not None:
+                with self.pool_lock:
+                    self._put_dormant_locked(record)
+            raise PoolCapacityError(
+                f"Cannot create new instance for {expert_id}: global max instances reached"
+            )
+
+        if record is not None:
+            with self.pool_lock:
+                instance = self._revive_dormant_locked(record, AgentStatus.RESERVED)
+                instance.current_task = task_description
+            return instance, True
+
+        # System prompt is resolved at execution time, not per instance
 
         # Generate session ID (simplified - would use Claude SDK in production)
         session_id = f"session_{instance_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -250,17 +779,24 @@ class AgentPoolManager:
             last_used_at=None,
             current_task=task_description,
             task_history=[],
-            accumulated_context="",
+            context_window=ContextWindow(
+                max_entries=self.context_max_entries,
+                token_budget=self.context_token_budget,
+                summarizer=self.context_summarizer,
+            ),
         )
 
-        self.active_instances[instance_id] = instance
-        return instance
+        with self.pool_lock:
+            self.active_instances[instance_id] = instance
+        self.metrics.record_state(instance_id, AgentStatus.RESERVED.value)
+        self.metrics.record_creation(time.monotonic() - started)
+        return instance, False
 
     def mark_working(self, instance_id: str):
         """Mark instance as working."""
         with self.pool_lock:
             if instance_id in self.active_instances:
-                self.active_instances[instance_id].status = AgentStatus.WORKING
+                self._set_status(self.active_instances[instance_id], AgentStatus.WORKING)
 
     def release_instance(self, instance_id: str, task_result: str = ""):
         """
@@ -275,30 +811,65 @@ class AgentPoolManager:
                 return
 
             instance = self.active_instances[instance_id]
+            if instance.status == AgentStatus.TERMINATED:
+                return
 
             # Update task history
             if instance.current_task:
                 instance.task_history.append(instance.current_task)
 
-            # Accumulate context
+            # Accumulate context (bounded, older entries condensed)
             if task_result:
-                instance.accumulated_context += f"\n---\n{task_result}"
+                instance.context_window.add(task_result)
+
+            if self.affinity_routing:
+                self._remember_affinity(instance, task_result)
 
             # Change status
-            instance.status = AgentStatus.IDLE
             instance.last_used_at = datetime.now(timezone.utc)
             instance.current_task = None
+            if instance_id in self._lease_lost:
+                # Another node may own this ID now: never hand it out again
+                self._lease_lost.discard(instance_id)
+                self._terminate_locked(instance_id)
+                return
+            if not self._hand_off(instance):
+                self._set_status(instance, AgentStatus.IDLE)
 
             self.logger.info(
                 f"Released instance {instance_id} (now IDLE, tasks: {len(instance.task_history)})"
             )
 
+    def handle_lost_leases(self, instance_ids: List[str]) -> None:
+        """
+        Stop using instances whose coordination lease was lost.
+
+        Idle instances are terminated now; busy ones finish their current
+        task and are terminated on release instead of returning to idle.
+        """
+        with self.pool_lock:
+            for instance_id in instance_ids:
+                instance = self.active_instances.get(instance_id)
+                if instance is None or instance.status == AgentStatus.TERMINATED:
+                    continue
+                if instance.status == AgentStatus.IDLE:
+                    self._terminate_locked(instance_id)
+                else:
+                    self._lease_lost.add(instance_id)
+
     def terminate_instance(self, instance_id: str):
         """Permanently terminate instance."""
         with self.pool_lock:
-            if instance_id in self.active_instances:
-                self.active_instances[instance_id].status = AgentStatus.TERMINATED
-                self.logger.info(f"Terminated instance {instance_id}")
+            self._terminate_locked(instance_id)
+
+    def _terminate_locked(self, instance_id: str):
+        """Terminate instance (``pool_lock`` held)."""
+        self._lease_lost.discard(instance_id)
+        instance = self.active_instances.get(instance_id)
+        if instance and instance.status != AgentStatus.TERMINATED:
+            self._set_status(instance, AgentStatus.TERMINATED)
+            self.logger.info(f"Terminated instance {instance_id}")
+            self._offer_slot(instance.expert_id)
 
     def cleanup_idle_instances(self, max_idle_time_seconds: int = 3600) -> int:
         """
@@ -311,36 +882,350 @@ class AgentPoolManager:
             Number of instances cleaned up
         """
         with self.pool_lock:
-            now = datetime.now(timezone.utc)
-            to_terminate = []
+            return self._expire_idle_locked(max_idle_time_seconds)
+
+    @staticmethod
+    def _instance_bytes(instance: AgentInstance) -> int:
+        """Approximate memory held by instance context and history."""
+        return instance.context_window.size_bytes() + sum(
+            len(task) for task in instance.task_history
+        )
+
+    def reap(
+        self,
+        max_idle_time_seconds: Optional[float] = None,
+        max_pool_bytes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Reclaim pool memory.
+
+        1. Terminates instances idle longer than ``max_idle_time_seconds``
+        2. While context + history of live instances exceeds
+           ``max_pool_bytes``, terminates least recently used idle instances
+        3. Removes terminated instances from ``active_instances``
+
+        Args:
+            max_idle_time_seconds: Idle TTL (None = no TTL)
+            max_pool_bytes: Memory cap for live instances (None = no cap)
+
+        Returns:
+            Counts reclaimed by this call
+        """
+        result = {
+            "idle_expired": 0,
+            "memory_evicted": 0,
+            "terminated_removed": 0,
+            "bytes_reclaimed": 0,
+        }
+
+        with self.pool_lock:
+            if max_idle_time_seconds is not None:
+                result["idle_expired"] = self._expire_idle_locked(max_idle_time_seconds)
 
-            for inst_id, inst in self.active_instances.items():
-                if inst.status == AgentStatus.IDLE and inst.last_used_at:
-                    idle_duration = (now - inst.last_used_at).total_seconds()
-                    if idle_duration > max_idle_time_seconds:
-                        to_terminate.append(inst_id)
+            if max_pool_bytes is not None:
+                result["memory_evicted"] = self._enforce_memory_cap_locked(max_pool_bytes)
 
-            for inst_id in to_terminate:
-                self.terminate_instance(inst_id)
-                self.logger.info(f"Cleaned up idle instance: {inst_id}")
+            for instance_id in self._terminated:
+                instance = self.active_instances.pop(instance_id, None)
+                if instance:
+                    result["terminated_removed"] += 1
+                    result["bytes_reclaimed"] += self._instance_bytes(instance)
+                    self.metrics.forget_instance(instance_id)
+                    self._affinity_recent.pop(instance_id, None)
+                    self._affinity_tokens.pop(instance_id, None)
+            self._terminated.clear()
 
-            return len(to_terminate)
+            for key, value in result.items():
+                self._reclaimed[key] += value
+
+        if any(result.values()):
+            self.logger.info(f"Pool reaped: {result}")
+        return result
+
+    def _expire_idle_locked(self, max_idle_time_seconds: float) -> int:
+        """Terminate idle instances past TTL (``pool_lock`` held)."""
+        now = datetime.now(timezone.utc)
+        expired = [
+            inst_id
+            for idle in self._idle_instances.values()
+            for inst_id, inst in idle.items()
+            if inst.last_used_at
+            and (now - inst.last_used_at).total_seconds() > max_idle_time_seconds
+        ]
+        for inst_id in expired:
+            self._terminate_locked(inst_id)
+            self.logger.info(f"Cleaned up idle instance: {inst_id}")
+        return len(expired)
+
+    def _enforce_memory_cap_locked(self, max_pool_bytes: int) -> int:
+        """Terminate LRU idle instances until under cap (``pool_lock`` held)."""
+        total = sum(
+            self._instance_bytes(inst)
+            for inst in self.active_instances.values()
+            if inst.status != AgentStatus.TERMINATED
+        )
+        if total <= max_pool_bytes:
+            return 0
+
+        oldest_first = sorted(
+            (inst for idle in self._idle_instances.values() for inst in idle.values()),
+            key=lambda inst: inst.last_used_at or inst.created_at,
+        )
+        evicted = 0
+        for inst in oldest_first:
+            if total <= max_pool_bytes:
+                break
+            total -= self._instance_bytes(inst)
+            self._terminate_locked(inst.instance_id)
+            evicted += 1
+
+        if total > max_pool_bytes:
+            self.logger.warning(
+                f"Pool memory {total} bytes over cap {max_pool_bytes} with no idle instances left"
+            )
+        return evicted
 
     def get_instance(self, instance_id: str) -> Optional[AgentInstance]:
-        """Get instance by ID."""
-        return self.active_instances.get(instance_id)
+        """Get instance by ID (revives it if it was restored from a snapshot)."""
+        instance = self.active_instances.get(instance_id)
+        # Coordinated pools only revive through acquire (needs a lease)
+        if instance is None and instance_id in self._dormant and self.coordinator is None:
+            with self.pool_lock:
+                instance = self.active_instances.get(instance_id)
+                record = self._dormant.get(instance_id)
+                if (
+                    instance is None
+                    and record is not None
+                    and self._can_create_instance(record["expert_id"])
+                ):
+                    expert_id = record["expert_id"]
+                    self._live_counts[expert_id] = self._live_counts.get(expert_id, 0) + 1
+                    instance = self._revive_dormant_locked(
+                        self._take_dormant_locked(instance_id), AgentStatus.IDLE
+                    )
+        return instance
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def export_state(self, max_history: int = 50) -> Dict[str, Any]:
+        """
+        Serializable pool state: live instances plus not yet revived ones.
+
+        Args:
+            max_history: Most recent task history entries kept per instance
+
+        Returns:
+            JSON-serializable snapshot dict
+        """
+        with self.pool_lock:
+            records = [
+                {
+                    "instance_id": inst.instance_id,
+                    "expert_id": inst.expert_id,
+                    "session_id": inst.session_id,
+                    "created_at": inst.created_at.isoformat(),
+                    "last_used_at": (
+                        inst.last_used_at.isoformat() if inst.last_used_at else None
+                    ),
+                    "task_history": inst.task_history[-max_history:],
+                    "context": inst.context_window.export_state(),
+                }
+                for inst in self.active_instances.values()
+                if inst.status != AgentStatus.TERMINATED
+            ]
+            records.extend(self._dormant.values())
+
+            return {
+                "version": 1,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "instance_counters": dict(self.instance_counters),
+                "instances": records,
+            }
+
+    def import_state(
+        self, state: Dict[str, Any], max_age_seconds: Optional[float] = None
+    ) -> int:
+        """
+        Load snapshot for lazy restore.
+
+        Instances are kept dormant and only become live when an acquire
+        for their expert finds no idle instance (best affinity match first)
+        or when they are looked up by ID, so a restore costs nothing for
+        experts that are never used again.
+
+        Args:
+            state: Output of ``export_state``
+            max_age_seconds: Skip instances unused for longer (None = keep all)
+
+        Returns:
+            Number of instances available for revival
+        """
+        now = datetime.now(timezone.utc)
+        loaded = 0
+
+        with self.pool_lock:
+            for expert_id, counter in state.get("instance_counters", {}).items():
+                self.instance_counters[expert_id] = max(
+                    self.instance_counters.get(expert_id, 0), counter
+                )
+
+            records = sorted(
+                state.get("instances", []),
+                key=lambda r: r.get("last_used_at") or r.get("created_at") or "",
+            )
+            for record in records:
+                instance_id = record.get("instance_id")
+                expert_id = record.get("expert_id")
+                last_used = record.get("last_used_at") or record.get("created_at")
+                too_old = (
+                    max_age_seconds is not None
+                    and last_used
+                    and (now - datetime.fromisoformat(last_used)).total_seconds() > max_age_seconds
+                )
+                if (
+                    not instance_id
+                    or not record.get("session_id")
+                    or not record.get("created_at")
+                    or expert_id not in self.expert_definitions
+                    or instance_id in self.active_instances
+                    or instance_id in self._dormant
+                    or too_old
+                ):
+                    self._restore_stats["skipped"] += 1
+                    continue
+
+                self._dormant[instance_id] = record
+                self._dormant_counts[expert_id] = self._dormant_counts.get(expert_id, 0) + 1
+                tokens = task_tokens(" ".join(record.get("task_history", [])[-self.affinity_history:]))
+                if tokens:
+                    self._affinity_recent[instance_id] = deque([tokens], maxlen=self.affinity_history)
+                    self._affinity_tokens[instance_id] = tokens
+                loaded += 1
+
+            self._restore_stats["loaded"] += loaded
+
+        if loaded:
+            self.logger.info(f"Loaded {loaded} pool instances from snapshot (lazy restore)")
+        return loaded
+
+    def _pick_dormant(self, expert_id: str, task_description: Optional[str]) -> str:
+        """Dormant instance to revive: best affinity, else most recently used."""
+        candidates = [
+            instance_id
+            for instance_id, record in self._dormant.items()
+            if record["expert_id"] == expert_id
+        ]
+        if self.affinity_routing and task_description:
+            best, _ = self._best_affinity(candidates, task_description)
+            if best is not None:
+                return best
+        return candidates[-1]
+
+    def _take_dormant_locked(self, instance_id: str) -> Dict[str, Any]:
+        """Remove dormant snapshot record (``pool_lock`` held)."""
+        record = self._dormant.pop(instance_id)
+        self._dormant_counts[record["expert_id"]] -= 1
+        return record
+
+    def _put_dormant_locked(self, record: Dict[str, Any]) -> None:
+        """Return snapshot record taken for a revival that did not happen."""
+        self._dormant[record["instance_id"]] = record
+        self._dormant_counts[record["expert_id"]] = self._dormant_counts.get(record["expert_id"], 0) + 1
+
+    def _revive_dormant_locked(self, record: Dict[str, Any], status: AgentStatus) -> AgentInstance:
+        """Turn a taken snapshot record into a live instance (``pool_lock`` held)."""
+        instance_id = record["instance_id"]
+        expert_id = record["expert_id"]
+
+        last_used = record.get("last_used_at")
+        instance = AgentInstance(
+            instance_id=instance_id,
+            expert_id=expert_id,
+            session_id=record["session_id"],
+            status=status,
+            created_at=datetime.fromisoformat(record["created_at"]),
+            last_used_at=datetime.fromisoformat(last_used) if last_used else None,
+            current_task=None,
+            task_history=list(record.get("task_history", [])),
+            context_window=ContextWindow(
+                max_entries=self.context_max_entries,
+                token_budget=self.context_token_budget,
+                summarizer=self.context_summarizer,
+            ),
+        )
+        instance.context_window.restore_state(record.get("context", {}))
+
+        self.active_instances[instance_id] = instance
+        if status == AgentStatus.IDLE:
+            self._idle_instances.setdefault(expert_id, OrderedDict())[instance_id] = instance
+        self.metrics.record_state(instance_id, status.value)
+        self._restore_stats["revived"] += 1
+
+        self.logger.info(f"Restored instance from snapshot: {instance_id}")
+        return instance
 
     def get_stats(self) -> Dict[str, Any]:
         """Get pool statistics."""
         with self.pool_lock:
             by_status = {"idle": 0, "working": 0, "reserved": 0, "terminated": 0}
 
+            context_bytes = []
             for inst in self.active_instances.values():
                 by_status[inst.status.value] += 1
+                if inst.status != AgentStatus.TERMINATED:
+                    context_bytes.append(inst.context_window.size_bytes())
+
+            waiting = {
+                expert_id: depth
+                for expert_id, depth in (
+                    (e, sum(1 for w in q if not w.future.done()))
+                    for e, q in self._waiters.items()
+                )
+                if depth
+            }
+            waits = self._wait_stats["waits"]
+            affinity = self._affinity_stats
+            served = self._warm_hits + self._cold_starts
 
             return {
                 "total_instances": len(self.active_instances),
                 "expert_types": len(self.expert_definitions),
                 "by_status": by_status,
                 "instance_counters": dict(self.instance_counters),
+                "reclaimed": dict(self._reclaimed),
+                "restored": {**self._restore_stats, "dormant": len(self._dormant)},
+                "context_bytes": {
+                    "total": sum(context_bytes),
+                    "max": max(context_bytes, default=0),
+                    "avg": sum(context_bytes) / len(context_bytes) if context_bytes else 0.0,
+                    "token_budget": self.context_token_budget,
+                },
+                "queue_depth": sum(waiting.values()),
+                "waiting_by_expert": waiting,
+                "acquisitions": {
+                    "total": sum(self._acquisition_counts.values()),
+                    "warm_hits": self._warm_hits,
+                    "cold_starts": self._cold_starts,
+                    "warm_hit_ratio": self._warm_hits / served if served else 0.0,
+                },
+                "affinity": {
+                    "enabled": self.affinity_routing,
+                    "lookups": affinity["lookups"],
+                    "hits": affinity["hits"],
+                    "fallbacks": affinity["fallbacks"],
+                    "hit_ratio": (
+                        affinity["hits"] / affinity["lookups"] if affinity["lookups"] else 0.0
+                    ),
+                    "avg_hit_score": (
+                        affinity["hit_score_total"] / affinity["hits"] if affinity["hits"] else 0.0
+                    ),
+                },
+                "acquire_waits": {
+                    **self._wait_stats,
+                    "avg_wait_seconds": (
+                        self._wait_stats["wait_seconds_total"] / waits if waits else 0.0
+                    ),
+                },
             }
@@ -6,10 +6,13 @@ from the pool based on triggers, specialization, and context.
 """
 
 import logging
-from typing import List, Dict, Optional
+import time
+from typing import List, Dict, Optional, Tuple, Union, Any
 import re
 
 from .expert_definition import ExpertDefinition
+from .trigger_index import TriggerIndex
+from .expert_ranker import ExpertRankingMatrix, RankingMode
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,10 @@ class IntelligentAgentSelector:
 
     Analyzes task requirements and selects optimal expert agent
     using keyword matching, trigger patterns, and semantic similarity.
+    Scoring runs against a TriggerIndex built once from the definitions,
+    so only experts sharing vocabulary with the task are touched.
+    BM25/TF-IDF modes rank with a precomputed ExpertRankingMatrix and
+    return calibrated scores in [0, 1].
 
     Example:
         >>> selector = IntelligentAgentSelector(expert_definitions)
@@ -27,14 +34,40 @@ class IntelligentAgentSelector:
         >>> print(agent_id)  # "backend-architect"
     """
 
-    def __init__(self, expert_definitions: Dict[str, ExpertDefinition]):
+    def __init__(
+        self,
+        expert_definitions: Dict[str, ExpertDefinition],
+        ranking: RankingMode = RankingMode.HEURISTIC
+    ):
         """
         Initialize selector.
 
         Args:
             expert_definitions: Available expert definitions
+            ranking: Ranking mode (heuristic, bm25 or tfidf)
         """
         self.experts = expert_definitions
+        self.ranking = RankingMode(ranking)
+
+        # Definitions are fixed once loaded; index them a single time
+        self.index = TriggerIndex(self.experts)
+        self.matrix: Optional[ExpertRankingMatrix] = (
+            ExpertRankingMatrix(self.experts, self.ranking)
+            if self.ranking != RankingMode.HEURISTIC
+            else None
+        )
+
+    def _top(
+        self,
+        task: str,
+        n: int,
+        context: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Top-n (agent_id, score) using the configured ranking mode."""
+        if self.matrix is not None:
+            query = f"{task} {context}" if context else task
+            return self.matrix.top(query, n)
+        return self.index.top(task, n=n, context=context)
 
     def select_best_agent(
         self,
@@ -57,18 +90,14 @@ class IntelligentAgentSelector:
             logger.warning("No expert definitions available")
             return None
 
-        # Score all experts
-        scores = self._score_all_experts(task, context)
-
-        # Sort by score
-        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Score experts sharing vocabulary with task
+        ranked = self._top(task, 1, context)
 
-        if not ranked or ranked[0][1] == 0:
+        if not ranked:
             logger.warning(f"No suitable expert found for task: {task[:50]}")
             return None
 
-        best_agent_id = ranked[0][0]
-        best_score = ranked[0][1]
+        best_agent_id, best_score = ranked[0]
 
         logger.info(f"Selected '{best_agent_id}' with score {best_score:.2f}")
 
@@ -78,70 +107,108 @@ class IntelligentAgentSelector:
         self,
         task: str,
         max_agents: int = 3,
-        min_score: float = 0.3
-    ) -> List[str]:
-        """Select multiple agents for complex tasks."""
+        min_score: float = 0.3,
+        with_scores: bool = False
+    ) -> Union[List[str], List[Tuple[str, float]]]:
+        """
+        Select multiple agents for complex tasks.
+
+        Args:
+            task: Task description
+            max_agents: Maximum agents to return
+            min_score: Minimum score (calibrated 0-1 in bm25/tfidf modes)
+            with_scores: Return (agent_id, score) tuples
+
+        Returns:
+            Agent IDs (or (agent_id, score) tuples), best first
+        """
         if not self.experts:
             return []
 
-        scores = self._score_all_experts(task)
-        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        ranked = self._top(task, max_agents)
+
+        # Unscored experts only qualify when zero is an acceptable score
+        if min_score <= 0 and len(ranked) < max_agents:
+            scored = {agent_id for agent_id, _ in ranked}
+            ranked += [(a, 0.0) for a in self.experts if a not in scored]
 
         # Filter by minimum score and max count
         selected = [
-            agent_id for agent_id, score in ranked[:max_agents]
+            (agent_id, score) for agent_id, score in ranked[:max_agents]
             if score >= min_score
         ]
 
         logger.info(f"Selected {len(selected)} agents for task")
-        return selected
+        if with_scores:
+            return selected
+        return [agent_id for agent_id, _ in selected]
 
     def _score_all_experts(
         self,
         task: str,
         context: Optional[str] = None
     ) -> Dict[str, float]:
-        """Score all experts for task relevance."""
-        scores = {}
-        task_lower = task.lower()
-        context_lower = (context or "").lower()
-
-        for agent_id, expert in self.experts.items():
-            score = 0.0
-
-            # Score trigger keywords (weight: 3.0)
-            for trigger in expert.triggers:
-                trigger_lower = trigger.lower()
-                if trigger_lower in task_lower:
-                    score += 3.0
-                elif any(word in task_lower for word in trigger_lower.split()):
-                    score += 1.0
-
-            # Score description match (weight: 2.0)
-            desc_words = set(expert.description.lower().split())
-            task_words = set(task_lower.split())
-            overlap = len(desc_words & task_words)
-            score += overlap * 0.5
-
-            # Score category match (weight: 1.0)
-            if expert.category.lower() in task_lower:
-                score += 1.0
-
-            # Score focus areas (weight: 2.0)
-            for area in expert.focus_areas:
-                area_lower = area.lower()
-                if area_lower in task_lower:
-                    score += 2.0
-
-            # Context scoring if provided
-            if context:
-                for trigger in expert.triggers:
-                    if trigger.lower() in context_lower:
-                        score += 1.0
-
-            scores[agent_id] = score
-
-        return scores
+        """
+        Score experts for task relevance.
+
+        Weights: trigger phrase 3.0 (single trigger word 1.0), description
+        token 0.5, category 1.0, focus area 2.0, context trigger 1.0.
+
+        Returns:
+            Sparse dict of agent ID -> score; experts absent scored 0
+        """
+        return self.index.score(task, context)
+
+    def compare_ranking_modes(
+        self,
+        labelled_tasks: List[Tuple[str, str]],
+        top_n: int = 3
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Benchmark ranking quality and latency of every mode.
+
+        Args:
+            labelled_tasks: (task, expected agent_id) pairs
+            top_n: Cut-off for recall
+
+        Returns:
+            Dict of mode -> {hit_at_1, recall_at_n, mrr, avg_ms, p95_ms, build_ms}
+        """
+        report = {}
+        for mode in RankingMode:
+            build_start = time.perf_counter()
+            if mode == RankingMode.HEURISTIC:
+                ranker = TriggerIndex(self.experts)
+                rank = lambda task, n, r=ranker: r.top(task, n=n)
+            else:
+                matrix = ExpertRankingMatrix(self.experts, mode)
+                rank = lambda task, n, m=matrix: m.top(task, n)
+            build_ms = (time.perf_counter() - build_start) * 1000
+
+            hits, recalled, reciprocal, latencies = 0, 0, 0.0, []
+            for task, expected in labelled_tasks:
+                start = time.perf_counter()
+                ranked = [agent_id for agent_id, _ in rank(task, top_n)]
+                latencies.append((time.perf_counter() - start) * 1000)
+
+                if ranked[:1] == [expected]:
+                    hits += 1
+                if expected in ranked:
+                    recalled += 1
+                    reciprocal += 1.0 / (ranked.index(expected) + 1)
+
+            total = len(labelled_tasks) or 1
+            latencies.sort()
+            report[mode.value] = {
+                "hit_at_1": hits / total,
+                "recall_at_n": recalled / total,
+                "mrr": reciprocal / total,
+                "avg_ms": sum(latencies) / total,
+                "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+                "build_ms": build_ms,
+            }
+
+        return report
 
     def explain_selection(self, agent_id: str, task: str) -> str:
         """Explain why an agent was selected."""
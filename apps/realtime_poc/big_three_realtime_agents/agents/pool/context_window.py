@@ -0,0 +1,211 @@
+"""
+Context Window - Bounded per-instance context from previous tasks.
+
+Keeps a ring of recent task summaries under a token budget. Entries
+pushed out of the ring are folded into a short digest, so the context
+prepended to each new task stays bounded for long-lived instances.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENTRY_SEPARATOR = "\n---\n"
+
+# Characters kept per entry when folding it into the digest
+DIGEST_LINE_CHARS = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class ContextWindow:
+    """
+    Ring of recent task summaries plus a digest of older ones.
+
+    - ``max_entries`` most recent summaries are kept verbatim
+    - Everything rendered stays within ``token_budget`` tokens
+    - Evicted entries are compacted into a digest line each (first line,
+      truncated); the digest itself is limited to ``digest_budget`` tokens
+    - With a ``summarizer`` (async ``(texts) -> summary``) the digest is
+      rewritten in the background whenever it changed
+
+    Example:
+        >>> window = ContextWindow(max_entries=4, token_budget=1000)
+        >>> window.add("Implemented /users endpoint")
+        >>> window.render()
+        'Implemented /users endpoint'
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 8,
+        token_budget: int = 2000,
+        digest_budget: int = 400,
+        summarizer: Optional[Callable[[List[str]], Awaitable[str]]] = None,
+    ):
+        """
+        Initialize context window.
+
+        Args:
+            max_entries: Recent summaries kept verbatim
+            token_budget: Maximum tokens of rendered context
+            digest_budget: Maximum tokens of the digest of older entries
+            summarizer: Optional async summarizer for the digest
+        """
+        self.max_entries = max_entries
+        self.token_budget = token_budget
+        self.digest_budget = min(digest_budget, token_budget // 2)
+        self.summarizer = summarizer
+
+        self.entries: Deque[str] = deque()
+        self.digest: List[str] = []
+        self.compacted_entries = 0
+        self.summaries_run = 0
+
+        self._rendered: Optional[str] = None
+        self._summary_task: Optional[asyncio.Task] = None
+
+    def add(self, summary: str) -> None:
+        """
+        Append task summary, compacting older entries to stay in budget.
+
+        Args:
+            summary: Task summary text
+        """
+        if not summary:
+            return
+
+        # A single entry never exceeds the verbatim budget
+        max_chars = (self.token_budget - self.digest_budget) * 4
+        self.entries.append(summary[:max_chars])
+
+        evicted = []
+        while len(self.entries) > self.max_entries:
+            evicted.append(self.entries.popleft())
+
+        entry_tokens = sum(estimate_tokens(e) for e in self.entries)
+        while self.entries and entry_tokens > self.token_budget - self.digest_budget:
+            entry = self.entries.popleft()
+            entry_tokens -= estimate_tokens(entry)
+            evicted.append(entry)
+
+        if evicted:
+            self._fold(evicted)
+            self._schedule_summary()
+
+        self._rendered = None
+
+    def _fold(self, evicted: List[str]) -> None:
+        """Compact evicted entries into digest lines."""
+        for entry in evicted:
+            line = entry.strip().splitlines()[0] if entry.strip() else ""
+            if line:
+                self.digest.append(line[:DIGEST_LINE_CHARS])
+        self.compacted_entries += len(evicted)
+        self._trim_digest()
+
+    def _trim_digest(self) -> None:
+        """Drop oldest digest lines beyond the digest budget."""
+        while self.digest and estimate_tokens("\n".join(self.digest)) > self.digest_budget:
+            self.digest.pop(0)
+
+    def _schedule_summary(self) -> None:
+        """Rewrite digest with summarizer on the running loop (if any)."""
+        if not self.summarizer or len(self.digest) < 2:
+            return
+        if self._summary_task and not self._summary_task.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._summary_task = loop.create_task(self.summarize())
+
+    async def summarize(self) -> bool:
+        """
+        Replace digest with a summary from the summarizer.
+
+        Returns:
+            True if the digest was rewritten
+        """
+        if not self.summarizer or not self.digest:
+            return False
+
+        snapshot = list(self.digest)
+        try:
+            summary = (await self.summarizer(snapshot) or "").strip()
+        except Exception as exc:
+            logger.debug(f"Context summarization failed: {exc}")
+            return False
+
+        if not summary:
+            return False
+
+        # Keep lines folded in while the summarizer was running
+        newer = self.digest[len(snapshot):] if self.digest[:len(snapshot)] == snapshot else []
+        self.digest = [summary[:self.digest_budget * 4]] + newer
+        self._trim_digest()
+        self.summaries_run += 1
+        self._rendered = None
+        return True
+
+    def render(self) -> str:
+        """Context text for the next task (cached until changed)."""
+        if self._rendered is None:
+            parts = []
+            if self.digest:
+                parts.append("Earlier work (condensed):\n" + "\n".join(self.digest))
+            parts.extend(self.entries)
+            self._rendered = ENTRY_SEPARATOR.join(parts)
+        return self._rendered
+
+    def reset(self, text: str = "") -> None:
+        """Replace contents with text (empty clears the window)."""
+        self.entries.clear()
+        self.digest = []
+        self._rendered = None
+        if text:
+            self.add(text)
+
+    def export_state(self) -> Dict[str, Any]:
+        """JSON-serializable contents (for pool snapshots)."""
+        return {
+            "entries": list(self.entries),
+            "digest": list(self.digest),
+            "compacted_entries": self.compacted_entries,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with ``export_state`` output."""
+        self.reset()
+        for entry in state.get("entries", []):
+            self.add(entry)
+        self.digest = list(state.get("digest", [])) + self.digest
+        self._trim_digest()
+        self.compacted_entries += state.get("compacted_entries", 0)
+        self._rendered = None
+
+    def size_bytes(self) -> int:
+        """Size of rendered context in bytes."""
+        return len(self.render().encode("utf-8"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get window statistics."""
+        rendered = self.render()
+        return {
+            "entries": len(self.entries),
+            "digest_lines": len(self.digest),
+            "bytes": len(rendered.encode("utf-8")),
+            "tokens": estimate_tokens(rendered),
+            "token_budget": self.token_budget,
+            "compacted_entries": self.compacted_entries,
+            "summaries_run": self.summaries_run,
+        }
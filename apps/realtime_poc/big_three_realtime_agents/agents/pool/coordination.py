@@ -0,0 +1,614 @@
+"""
+Pool Coordination - Shared lease table for multi-node agent pools.
+
+Each live instance holds a lease (instance_id -> node, expert, expiry) in a
+shared backend. A node may only create an instance when the expert's live
+lease count is below its ``max_instances``, so the cap holds across all
+orchestrator processes. Leases are renewed by heartbeats and expire when a
+node dies.
+
+Backends:
+- ``SQLiteCoordinationBackend``: SQLite file, single host / many processes
+- ``RedisCoordinationBackend``: Redis protocol, many hosts (redis-py client
+  or any compatible stand-in)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set
+
+from ...exceptions import PoolCoordinationError
+from ...timeouts import REDIS_COMMAND_TIMEOUT, REDIS_CONNECT_TIMEOUT, REDIS_LOCK_TIMEOUT
+
+
+logger = logging.getLogger(__name__)
+
+# Claim outcomes
+GRANTED = "granted"        # Lease created or renewed for this node
+AT_CAPACITY = "capacity"   # Expert already has max_instances live leases
+OWNED = "owned"            # Instance is leased by another node
+
+
+class CoordinationBackend(ABC):
+    """Shared lease table."""
+
+    @abstractmethod
+    def claim(
+        self, expert_id: str, instance_id: str, node_id: str, max_instances: int, ttl_seconds: float
+    ) -> str:
+        """
+        Atomically lease instance for node if the expert is under its cap.
+
+        Returns:
+            GRANTED, AT_CAPACITY or OWNED
+
+        Raises:
+            PoolCoordinationError: The lease table stayed contended
+        """
+
+    @abstractmethod
+    def renew(self, node_id: str, instance_ids: Iterable[str], ttl_seconds: float) -> List[str]:
+        """
+        Extend node's leases.
+
+        Returns:
+            Instance IDs whose lease was lost (expired or taken over)
+
+        Raises:
+            PoolCoordinationError: The lease table stayed contended
+        """
+
+    @abstractmethod
+    def release(self, node_id: str, instance_ids: Iterable[str]) -> None:
+        """Drop node's leases."""
+
+    @abstractmethod
+    def live_count(self, expert_id: str) -> int:
+        """Unexpired leases of expert across all nodes."""
+
+    @abstractmethod
+    def owner(self, instance_id: str) -> Optional[str]:
+        """Node holding an unexpired lease on instance (None if free)."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class SQLiteCoordinationBackend(CoordinationBackend):
+    """
+    Lease table in a SQLite file (``BEGIN IMMEDIATE`` serializes claims).
+
+    Example:
+        >>> backend = SQLiteCoordinationBackend(storage_dir / "pool" / "leases.db")
+        >>> backend.claim("BackendExpert", "BackendExpert#1", "host-a:123", 3, 30)
+        'granted'
+    """
+
+    def __init__(self, path: Path, busy_timeout_seconds: float = 5.0):
+        """
+        Initialize SQLite backend.
+
+        Args:
+            path: Database file shared by all processes
+            busy_timeout_seconds: Wait for the write lock before failing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pool_leases ("
+            " instance_id TEXT PRIMARY KEY,"
+            " expert_id TEXT NOT NULL,"
+            " node_id TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS pool_leases_expert ON pool_leases (expert_id, expires_at)"
+        )
+
+    def _transaction(self, work):
+        """Run work(cursor) in an immediate (write-locked) transaction."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return result
+
+    def claim(
+        self, expert_id: str, instance_id: str, node_id: str, max_instances: int, ttl_seconds: float
+    ) -> str:
+        def work(cursor):
+            now = time.time()
+            row = cursor.execute(
+                "SELECT node_id, expires_at FROM pool_leases WHERE instance_id = ?",
+                (instance_id,),
+            ).fetchone()
+            if row and row[1] > now and row[0] != node_id:
+                return OWNED
+
+            if not (row and row[1] > now):
+                (live,) = cursor.execute(
+                    "SELECT COUNT(*) FROM pool_leases WHERE expert_id = ? AND expires_at > ?",
+                    (expert_id, now),
+                ).fetchone()
+                if live >= max_instances:
+                    return AT_CAPACITY
+
+            cursor.execute(
+                "INSERT OR REPLACE INTO pool_leases (instance_id, expert_id, node_id, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (instance_id, expert_id, node_id, now + ttl_seconds),
+            )
+            return GRANTED
+
+        return self._transaction(work)
+
+    def renew(self, node_id: str, instance_ids: Iterable[str], ttl_seconds: float) -> List[str]:
+        instance_ids = list(instance_ids)
+
+        def work(cursor):
+            now = time.time()
+            lost = []
+            for instance_id in instance_ids:
+                updated = cursor.execute(
+                    "UPDATE pool_leases SET expires_at = ?"
+                    " WHERE instance_id = ? AND node_id = ? AND expires_at > ?",
+                    (now + ttl_seconds, instance_id, node_id, now),
+                ).rowcount
+                if not updated:
+                    lost.append(instance_id)
+            cursor.execute("DELETE FROM pool_leases WHERE expires_at <= ?", (now,))
+            return lost
+
+        return self._transaction(work)
+
+    def release(self, node_id: str, instance_ids: Iterable[str]) -> None:
+        instance_ids = list(instance_ids)
+
+        def work(cursor):
+            cursor.executemany(
+                "DELETE FROM pool_leases WHERE instance_id = ? AND node_id = ?",
+                [(instance_id, node_id) for instance_id in instance_ids],
+            )
+
+        self._transaction(work)
+
+    def live_count(self, expert_id: str) -> int:
+        with self._lock:
+            (live,) = self._conn.execute(
+                "SELECT COUNT(*) FROM pool_leases WHERE expert_id = ? AND expires_at > ?",
+                (expert_id, time.time()),
+            ).fetchone()
+        return live
+
+    def owner(self, instance_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT node_id FROM pool_leases WHERE instance_id = ? AND expires_at > ?",
+                (instance_id, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCoordinationBackend(CoordinationBackend):
+    """
+    Lease table in Redis.
+
+    Per expert, a sorted set ``<prefix>:expert:<expert_id>`` maps instance
+    IDs to lease expiry; hashes ``<prefix>:owners`` and ``<prefix>:experts``
+    map instance IDs to their node and expert. Claims and renewals use
+    WATCH/MULTI optimistic transactions (no Lua), so any server or
+    stand-in speaking the Redis protocol works. Expired leases are pruned
+    from all three structures by the next claim on their expert.
+
+    Example:
+        >>> backend = RedisCoordinationBackend(url="redis://pool-coord:6379/0")
+        >>> backend.claim("BackendExpert", "BackendExpert#1", "host-a:123", 3, 30)
+        'granted'
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "agent_pool",
+        client=None,
+        max_retries: int = 16,
+    ):
+        """
+        Initialize Redis backend.
+
+        Args:
+            url: Redis URL (ignored when ``client`` is given)
+            prefix: Key prefix shared by all nodes of one pool
+            client: Existing redis-py compatible client
+            max_retries: Optimistic transaction retries under contention
+        """
+        if client is None:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError(
+                    "redis package not installed. Install redis or use the sqlite backend."
+                ) from exc
+
+            client = redis.Redis.from_url(
+                url,
+                socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                socket_timeout=REDIS_COMMAND_TIMEOUT,
+                decode_responses=True,
+            )
+
+        self.client = client
+        self.prefix = prefix
+        self.max_retries = max_retries
+        self.owners_key = f"{prefix}:owners"
+        self.experts_key = f"{prefix}:experts"
+
+    def _expert_key(self, expert_id: str) -> str:
+        """Sorted set of leases of expert."""
+        return f"{self.prefix}:expert:{expert_id}"
+
+    @staticmethod
+    def _text(value) -> Optional[str]:
+        """Decode bytes replies (clients without decode_responses)."""
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    @staticmethod
+    def _is_watch_error(exc: Exception) -> bool:
+        """Whether exc is redis.WatchError (a watched key changed)."""
+        return type(exc).__name__ == "WatchError"
+
+    def claim(
+        self, expert_id: str, instance_id: str, node_id: str, max_instances: int, ttl_seconds: float
+    ) -> str:
+        expert_key = self._expert_key(expert_id)
+        for _ in range(self.max_retries):
+            with self.client.pipeline() as pipe:
+                try:
+                    pipe.watch(expert_key, self.owners_key)
+                    now = time.time()
+
+                    expiry = pipe.zscore(expert_key, instance_id)
+                    current_owner = self._text(pipe.hget(self.owners_key, instance_id))
+                    held = expiry is not None and expiry > now
+                    if held and current_owner not in (None, node_id):
+                        pipe.unwatch()
+                        return OWNED
+
+                    if not held and pipe.zcount(expert_key, f"({now}", "+inf") >= max_instances:
+                        pipe.unwatch()
+                        return AT_CAPACITY
+
+                    # Leases of crashed nodes: drop their hash fields too
+                    expired = [
+                        member for member in map(self._text, pipe.zrangebyscore(expert_key, "-inf", now))
+                        if member != instance_id
+                    ]
+
+                    pipe.multi()
+                    pipe.zremrangebyscore(expert_key, "-inf", now)
+                    if expired:
+                        pipe.hdel(self.owners_key, *expired)
+                        pipe.hdel(self.experts_key, *expired)
+                    pipe.zadd(expert_key, {instance_id: now + ttl_seconds})
+                    pipe.hset(self.owners_key, instance_id, node_id)
+                    pipe.hset(self.experts_key, instance_id, expert_id)
+                    pipe.execute()
+                    return GRANTED
+                except Exception as exc:
+                    # A concurrent claim changed the lease set: retry
+                    if not self._is_watch_error(exc):
+                        raise
+
+        raise PoolCoordinationError(
+            f"Lease claim for {instance_id} contended after {self.max_retries} retries"
+        )
+
+    def _leases(self, instance_ids: List[str]):
+        """(instance_id, expert_key, owner, expiry) of each instance."""
+        owners = self.client.hmget(self.owners_key, instance_ids)
+        experts = self.client.hmget(self.experts_key, instance_ids)
+
+        pipe = self.client.pipeline(transaction=False)
+        keys = []
+        for instance_id, expert_id in zip(instance_ids, experts):
+            key = self._expert_key(self._text(expert_id) or "")
+            keys.append(key)
+            pipe.zscore(key, instance_id)
+        expiries = pipe.execute()
+
+        return [
+            (instance_id, key, self._text(owner), expiry)
+            for instance_id, key, owner, expiry in zip(instance_ids, keys, owners, expiries)
+        ]
+
+    def renew(self, node_id: str, instance_ids: Iterable[str], ttl_seconds: float) -> List[str]:
+        instance_ids = list(instance_ids)
+        if not instance_ids:
+            return []
+
+        for _ in range(self.max_retries):
+            with self.client.pipeline() as pipe:
+                try:
+                    # Same keys a claim writes, so a takeover aborts this renewal
+                    pipe.watch(self.owners_key, self.experts_key)
+                    experts = pipe.hmget(self.experts_key, instance_ids)
+                    keys = [self._expert_key(self._text(e) or "") for e in experts]
+                    pipe.watch(*set(keys))
+
+                    owners = pipe.hmget(self.owners_key, instance_ids)
+                    now = time.time()
+                    lost, renewed = [], []
+                    for instance_id, key, owner in zip(instance_ids, keys, owners):
+                        expiry = pipe.zscore(key, instance_id)
+                        if self._text(owner) != node_id or expiry is None or expiry <= now:
+                            lost.append(instance_id)
+                        else:
+                            renewed.append((instance_id, key))
+
+                    pipe.multi()
+                    for instance_id, key in renewed:
+                        pipe.zadd(key, {instance_id: now + ttl_seconds}, xx=True)
+                    pipe.execute()
+                    return lost
+                except Exception as exc:
+                    if not self._is_watch_error(exc):
+                        raise
+
+        raise PoolCoordinationError(
+            f"Lease renewal of node {node_id} contended after {self.max_retries} retries"
+        )
+
+    def release(self, node_id: str, instance_ids: Iterable[str]) -> None:
+        instance_ids = list(instance_ids)
+        if not instance_ids:
+            return
+
+        pipe = self.client.pipeline(transaction=True)
+        for instance_id, key, owner, _ in self._leases(instance_ids):
+            if owner == node_id:
+                pipe.zrem(key, instance_id)
+                pipe.hdel(self.owners_key, instance_id)
+                pipe.hdel(self.experts_key, instance_id)
+        pipe.execute()
+
+    def live_count(self, expert_id: str) -> int:
+        return self.client.zcount(self._expert_key(expert_id), f"({time.time()}", "+inf")
+
+    def owner(self, instance_id: str) -> Optional[str]:
+        (_, _, owner, expiry), = self._leases([instance_id])
+        if expiry is None or expiry <= time.time():
+            return None
+        return owner
+
+    def close(self) -> None:
+        close = getattr(self.client, "close", None)
+        if close:
+            close()
+
+
+class PoolCoordinator:
+    """
+    Node-side lease manager used by AgentPoolManager.
+
+    Claims a lease before an instance is created or revived, renews all
+    leases of this node on a heartbeat and releases leases of terminated
+    instances.
+
+    Example:
+        >>> coordinator = PoolCoordinator(SQLiteCoordinationBackend(path))
+        >>> pool = AgentPoolManager(coordinator=coordinator)
+        >>> coordinator.start()         # heartbeats on running event loop
+    """
+
+    def __init__(
+        self,
+        backend: CoordinationBackend,
+        node_id: Optional[str] = None,
+        lease_ttl_seconds: float = REDIS_LOCK_TIMEOUT,
+        heartbeat_seconds: Optional[float] = None,
+        logger_instance=None,
+    ):
+        """
+        Initialize coordinator.
+
+        Args:
+            backend: Shared lease table
+            node_id: Unique node identity (default: hostname:pid)
+            lease_ttl_seconds: Lease lifetime without heartbeat
+            heartbeat_seconds: Renewal interval (default: a third of the TTL)
+            logger_instance: Logger instance
+        """
+        self.backend = backend
+        self.node_id = node_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.heartbeat_seconds = heartbeat_seconds or lease_ttl_seconds / 3
+        self.logger = logger_instance or logger
+
+        self._owned: Set[str] = set()
+        self._pending_release: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+        # Called with lost instance IDs so the pool stops handing them out
+        self.on_leases_lost: Optional[Callable[[List[str]], None]] = None
+
+        self.stats = {
+            "granted": 0,
+            "denied_capacity": 0,
+            "denied_owned": 0,
+            "heartbeats": 0,
+            "leases_lost": 0,
+            "errors": 0,
+        }
+
+    async def claim(self, expert_id: str, instance_id: str, max_instances: int) -> str:
+        """
+        Lease instance for this node.
+
+        Returns:
+            GRANTED, AT_CAPACITY or OWNED
+        """
+        outcome = await asyncio.to_thread(
+            self.backend.claim,
+            expert_id,
+            instance_id,
+            self.node_id,
+            max_instances,
+            self.lease_ttl_seconds,
+        )
+        if outcome == GRANTED:
+            self._owned.add(instance_id)
+            self._pending_release.discard(instance_id)
+            self.stats["granted"] += 1
+        elif outcome == OWNED:
+            self.stats["denied_owned"] += 1
+        else:
+            self.stats["denied_capacity"] += 1
+        return outcome
+
+    def forget(self, instance_id: str) -> None:
+        """Instance ended locally; its lease is released on the next heartbeat."""
+        if instance_id in self._owned:
+            self._owned.discard(instance_id)
+            self._pending_release.add(instance_id)
+
+    def heartbeat(self) -> List[str]:
+        """
+        Release ended leases and renew live ones (blocking).
+
+        Lost leases are no longer owned by this node; ``on_leases_lost`` is
+        told so the local instances stop being used.
+
+        Returns:
+            Instance IDs whose lease was lost
+        """
+        if self._pending_release:
+            released = list(self._pending_release)
+            self.backend.release(self.node_id, released)
+            self._pending_release.difference_update(released)
+
+        lost = self.backend.renew(self.node_id, list(self._owned), self.lease_ttl_seconds)
+        self.stats["heartbeats"] += 1
+        if lost:
+            self._owned.difference_update(lost)
+            self.stats["leases_lost"] += len(lost)
+            self.logger.warning(f"Lost pool leases (node {self.node_id}): {lost}")
+            if self.on_leases_lost is not None:
+                self.on_leases_lost(lost)
+        return lost
+
+    async def run(self) -> None:
+        """Heartbeat every ``heartbeat_seconds`` until cancelled."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await asyncio.to_thread(self.heartbeat)
+            except Exception as exc:
+                self.stats["errors"] += 1
+                self.logger.warning(f"Pool lease heartbeat failed: {exc}")
+
+    def start(self) -> bool:
+        """
+        Start heartbeats on the running event loop.
+
+        Returns:
+            True if started (False without a running loop or if already running)
+        """
+        if self._task and not self._task.done():
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop, pool lease heartbeats not started")
+            return False
+
+        self._task = loop.create_task(self.run())
+        self.logger.info(
+            f"Pool coordination started (node {self.node_id}, heartbeat {self.heartbeat_seconds}s)"
+        )
+        return True
+
+    def stop(self, release: bool = True) -> None:
+        """
+        Cancel heartbeats.
+
+        Args:
+            release: Also release all leases of this node
+        """
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+        if release:
+            try:
+                self.backend.release(self.node_id, self._owned | self._pending_release)
+                self._owned.clear()
+                self._pending_release.clear()
+            except Exception as exc:
+                self.logger.warning(f"Failed to release pool leases: {exc}")
+
+    def global_count(self, expert_id: str) -> int:
+        """Live instances of expert across all nodes."""
+        return self.backend.live_count(expert_id)
+
+    def owner(self, instance_id: str) -> Optional[str]:
+        """Node owning instance (None if unleased)."""
+        return self.backend.owner(instance_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coordination statistics."""
+        return {
+            "node_id": self.node_id,
+            "backend": type(self.backend).__name__,
+            "running": bool(self._task and not self._task.done()),
+            "lease_ttl_seconds": self.lease_ttl_seconds,
+            "owned_leases": len(self._owned),
+            "pending_release": len(self._pending_release),
+            **self.stats,
+        }
+
+
+def create_coordination_backend(kind: str, sqlite_path: Path, redis_url: str) -> Optional[CoordinationBackend]:
+    """
+    Build coordination backend from configuration.
+
+    Args:
+        kind: "sqlite", "redis" or "" (process-local pool)
+        sqlite_path: Lease database for the sqlite backend
+        redis_url: Server URL for the redis backend
+
+    Returns:
+        CoordinationBackend or None
+    """
+    kind = (kind or "").lower()
+    if kind == "sqlite":
+        return SQLiteCoordinationBackend(sqlite_path)
+    if kind == "redis":
+        return RedisCoordinationBackend(url=redis_url)
+    if kind:
+        raise ValueError(f"Unknown pool coordination backend: {kind}")
+    return None
@@ -5,8 +5,9 @@ Defines the structure for agent templates loaded from markdown files
 and active agent instances.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 from enum import Enum
 
@@ -26,12 +27,35 @@ class AgentTier(Enum):
     TIER3_EXPERIMENTAL = "tier3-experimental"
 
 
+@dataclass
+class ExpertSections:
+    """
+    Heavy sections of an expert template.
+
+    Not needed for selection, so they are loaded on first access and
+    cached on the owning ExpertDefinition. The system prompt itself is
+    served by ``PromptCache`` at execution time.
+
+    Attributes:
+        behavioral_mindset: Core behavioral principles
+        key_actions: Steps the agent takes
+        outputs: Types of deliverables
+        boundaries: What agent will/won't do
+    """
+    behavioral_mindset: str = ""
+    key_actions: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    boundaries: Dict[str, List[str]] = field(default_factory=dict)
+
+
 @dataclass
 class ExpertDefinition:
     """
     Expert agent template definition.
 
-    Loaded from markdown files in agentpool directory.
+    Loaded from markdown files in agentpool directory. Holds the compact
+    summary used for selection eagerly; heavy sections are resolved
+    through ``section_loader`` on first access and cached once.
 
     Attributes:
         agent_id: Unique identifier (e.g., "backend-architect")
@@ -40,12 +64,10 @@ class ExpertDefinition:
         category: Category (e.g., "engineering", "quality")
         tier: Expertise tier (core/specialized/experimental)
         triggers: List of trigger patterns
-        behavioral_mindset: Core behavioral principles
         focus_areas: List of expertise areas
-        key_actions: Steps the agent takes
-        outputs: Types of deliverables
-        boundaries: What agent will/won't do
         file_path: Source markdown file path
+        source_bytes: Size of the source markdown file
+        section_loader: Callable that loads the heavy sections
     """
     agent_id: str
     name: str
@@ -53,15 +75,76 @@ class ExpertDefinition:
     category: str
     tier: AgentTier
     triggers: List[str] = field(default_factory=list)
-    behavioral_mindset: str = ""
     focus_areas: List[str] = field(default_factory=list)
-    key_actions: List[str] = field(default_factory=list)
-    outputs: List[str] = field(default_factory=list)
-    boundaries: Dict[str, List[str]] = field(default_factory=dict)
     file_path: str = ""
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    source_bytes: int = 0
+    section_loader: Optional[Callable[["ExpertDefinition"], ExpertSections]] = field(
+        default=None, repr=False, compare=False
+    )
+    _sections: Optional[ExpertSections] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def sections(self) -> ExpertSections:
+        """Heavy sections, loaded on first access."""
+        if self._sections is None:
+            if self.section_loader:
+                self._sections = self.section_loader(self)
+            else:
+                self._sections = ExpertSections()
+        return self._sections
+
+    @property
+    def sections_loaded(self) -> bool:
+        """Whether heavy sections are currently resident."""
+        return self._sections is not None
+
+    def unload_sections(self) -> None:
+        """Drop cached heavy sections (reloaded on next access)."""
+        if self.section_loader:
+            self._sections = None
+
+    @property
+    def behavioral_mindset(self) -> str:
+        """Core behavioral principles (lazy)."""
+        return self.sections.behavioral_mindset
+
+    @property
+    def key_actions(self) -> List[str]:
+        """Steps the agent takes (lazy)."""
+        return self.sections.key_actions
+
+    @property
+    def outputs(self) -> List[str]:
+        """Types of deliverables (lazy)."""
+        return self.sections.outputs
+
+    @property
+    def boundaries(self) -> Dict[str, List[str]]:
+        """What agent will/won't do (lazy)."""
+        return self.sections.boundaries
+
+    def summary_size(self) -> int:
+        """Approximate resident bytes of the eager summary record."""
+        return _deep_sizeof([
+            self.agent_id, self.name, self.description, self.category,
+            self.triggers, self.focus_areas, self.file_path,
+        ])
+
+    def sections_size(self) -> int:
+        """Approximate resident bytes of loaded heavy sections (0 if unloaded)."""
+        if self._sections is None:
+            return 0
+        return _deep_sizeof([
+            self._sections.behavioral_mindset,
+            self._sections.key_actions,
+            self._sections.outputs,
+            self._sections.boundaries,
+        ])
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Convert summary fields to dictionary (does not load sections)."""
         return {
             "agent_id": self.agent_id,
             "name": self.name,
@@ -69,14 +152,30 @@ class ExpertDefinition:
             "category": self.category,
             "tier": self.tier.value,
             "triggers": self.triggers,
-            "behavioral_mindset": self.behavioral_mindset,
             "focus_areas": self.focus_areas,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            **self.to_summary_dict(),
+            "behavioral_mindset": self.behavioral_mindset,
             "key_actions": self.key_actions,
             "outputs": self.outputs,
             "boundaries": self.boundaries,
         }
 
 
+def _deep_sizeof(obj: Any) -> int:
+    """Approximate recursive size of str/list/dict structures."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k) + _deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_deep_sizeof(item) for item in obj)
+    return size
+
+
 @dataclass
 class AgentInstance:
     """
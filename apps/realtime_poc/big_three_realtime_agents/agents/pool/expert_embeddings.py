@@ -0,0 +1,260 @@
+"""
+Expert Embeddings - Precomputed vectors for semantic expert selection.
+
+Embeds every expert definition once, persists the vectors next to the
+catalog and answers cosine top-k queries locally, so selection does not
+need an LLM round-trip per task.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .agent_pool import ExpertDefinition
+from .prompt_cache import PromptCache
+
+
+logger = logging.getLogger(__name__)
+
+# Characters of the expert prompt file included in the embedded text
+PROMPT_EXCERPT_CHARS = 1000
+
+
+class ExpertEmbeddingIndex:
+    """
+    Precomputed expert embeddings with cosine top-k lookup.
+
+    Vectors are stored in ``embeddings_path`` (``.npz``) together with a
+    fingerprint of each expert's text and the model name; on load only
+    experts whose fingerprint changed are re-embedded.
+
+    Example:
+        >>> index = ExpertEmbeddingIndex(Path("agentpool/.expert_embeddings.npz"))
+        >>> index.sync(pool_manager.expert_definitions)
+        >>> index.top_k("Add OAuth login to the API", k=3)
+        [('BackendArchitect', 0.62), ('SecurityAuditor', 0.58), ...]
+    """
+
+    def __init__(
+        self,
+        embeddings_path: Optional[Path] = None,
+        embedding_model=None,
+        model_name: str = "all-MiniLM-L6-v2",
+        prompt_cache: Optional[PromptCache] = None,
+        logger_instance=None,
+    ):
+        """
+        Initialize embedding index.
+
+        Args:
+            embeddings_path: File to persist vectors (None = memory only)
+            embedding_model: Optional model with ``encode`` (defaults to
+                sentence-transformers, loaded on first use)
+            model_name: sentence-transformers model name
+            prompt_cache: Shared expert prompt cache (source of prompt excerpts)
+            logger_instance: Logger instance
+        """
+        self.embeddings_path = Path(embeddings_path) if embeddings_path else None
+        self.model_name = model_name
+        self.prompt_cache = prompt_cache or PromptCache()
+        self.logger = logger_instance or logger
+
+        self.expert_ids: List[str] = []
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self._fingerprints: Dict[str, str] = {}
+
+        self.embedding_model = embedding_model
+        self._model_failed = False
+
+    @property
+    def available(self) -> bool:
+        """Whether semantic lookup can be used (False once the model failed to load)."""
+        return not self._model_failed
+
+    def _ensure_model(self) -> bool:
+        """
+        Load the embedding model on first use (blocking).
+
+        Any failure (package missing, offline host, corrupt model cache)
+        disables semantic selection instead of raising.
+        """
+        if self.embedding_model is not None:
+            return True
+        if self._model_failed:
+            return False
+
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            self.embedding_model = SentenceTransformer(self.model_name)
+            self.logger.info(f"Loaded sentence-transformers model: {self.model_name}")
+            return True
+        except ImportError:
+            self.logger.warning(
+                "sentence-transformers not installed. Semantic selection disabled."
+            )
+        except Exception as exc:
+            self.logger.warning(
+                f"Failed to load embedding model {self.model_name}: {exc}. "
+                f"Semantic selection disabled."
+            )
+        self._model_failed = True
+        return False
+
+    def expert_text(self, expert: ExpertDefinition) -> str:
+        """Text embedded for an expert."""
+        parts = [expert.name, expert.specialization, expert.description]
+        if expert.skills:
+            parts.append(f"Skills: {', '.join(expert.skills)}")
+
+        prompt = self.prompt_cache.get(expert)
+        if prompt.mtime_ns is not None:
+            # Only real prompt files; the fallback repeats name and description
+            parts.append(prompt.text[:PROMPT_EXCERPT_CHARS])
+
+        return "\n".join(parts)
+
+    def _fingerprint(self, text: str) -> str:
+        """Stable fingerprint of embedded text and model."""
+        return hashlib.sha1(f"{self.model_name}\n{text}".encode("utf-8")).hexdigest()
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts to L2-normalized float32 vectors."""
+        vectors = np.asarray(self.embedding_model.encode(texts), dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def sync(self, experts: Dict[str, ExpertDefinition]) -> int:
+        """
+        Make vectors match the expert catalog.
+
+        Loads persisted vectors on first use, embeds new or changed
+        experts and drops removed ones.
+
+        Args:
+            experts: Expert definitions keyed by expert_id
+
+        Returns:
+            Number of experts (re-)embedded
+        """
+        if not self._ensure_model():
+            return 0
+
+        if not experts:
+            self.expert_ids, self._fingerprints = [], {}
+            self.vectors = np.zeros((0, 0), dtype=np.float32)
+            return 0
+
+        if not self.expert_ids and self.embeddings_path:
+            self._load()
+
+        texts = {expert_id: self.expert_text(exp) for expert_id, exp in experts.items()}
+        fingerprints = {expert_id: self._fingerprint(t) for expert_id, t in texts.items()}
+
+        current = dict(zip(self.expert_ids, self.vectors)) if len(self.vectors) else {}
+        stale = [
+            expert_id for expert_id in experts
+            if self._fingerprints.get(expert_id) != fingerprints[expert_id]
+            or expert_id not in current
+        ]
+
+        if not stale and set(self.expert_ids) == set(experts):
+            return 0
+
+        if stale:
+            for expert_id, vector in zip(stale, self._encode([texts[e] for e in stale])):
+                current[expert_id] = vector
+
+        self.expert_ids = list(experts)
+        self.vectors = np.stack([current[e] for e in self.expert_ids]).astype(np.float32)
+        self._fingerprints = fingerprints
+
+        self.logger.info(
+            f"Expert embeddings synced: {len(stale)} embedded, {len(self.expert_ids)} total"
+        )
+        self._save()
+        return len(stale)
+
+    def top_k(
+        self,
+        task: str,
+        k: int = 3,
+        allowed: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Cosine top-k experts for task.
+
+        Args:
+            task: Task description
+            k: Number of candidates
+            allowed: Optional subset of expert_ids to consider
+
+        Returns:
+            List of (expert_id, cosine similarity), best first
+        """
+        if not self.expert_ids or not self._ensure_model():
+            return []
+
+        scores = self.vectors @ self._encode([task])[0]
+        if allowed is not None:
+            mask = np.array([e in allowed for e in self.expert_ids])
+            scores = np.where(mask, scores, -np.inf)
+
+        k = min(k, len(scores))
+        # Keep every expert tied with the k-th score, then order by score and catalog position
+        cutoff = -np.partition(-scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(scores >= cutoff)
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+
+        return [
+            (self.expert_ids[i], float(scores[i]))
+            for i in candidates
+            if np.isfinite(scores[i])
+        ]
+
+    def _load(self) -> None:
+        """Load persisted vectors if present and produced by same model."""
+        if not self.embeddings_path or not self.embeddings_path.exists():
+            return
+
+        try:
+            with np.load(self.embeddings_path, allow_pickle=False) as data:
+                if str(data["model"]) != self.model_name:
+                    self.logger.info("Persisted expert embeddings use another model, ignoring")
+                    return
+                self.expert_ids = [str(e) for e in data["expert_ids"]]
+                self.vectors = data["vectors"].astype(np.float32)
+                self._fingerprints = dict(
+                    zip(self.expert_ids, (str(f) for f in data["fingerprints"]))
+                )
+            self.logger.info(
+                f"Loaded {len(self.expert_ids)} expert embeddings from {self.embeddings_path}"
+            )
+        except Exception as exc:
+            self.logger.warning(f"Failed to load expert embeddings: {exc}")
+            self.expert_ids, self._fingerprints = [], {}
+            self.vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def _save(self) -> None:
+        """Persist vectors next to the catalog."""
+        if not self.embeddings_path:
+            return
+
+        try:
+            self.embeddings_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.embeddings_path, "wb") as f:
+                np.savez(
+                    f,
+                    model=np.array(self.model_name),
+                    expert_ids=np.array(self.expert_ids),
+                    fingerprints=np.array([self._fingerprints[e] for e in self.expert_ids]),
+                    vectors=self.vectors,
+                )
+        except Exception as exc:
+            self.logger.warning(f"Failed to persist expert embeddings: {exc}")
@@ -0,0 +1,222 @@
+"""
+Vectorized expert ranking over TF-IDF/BM25 term matrices.
+
+Precomputes a sparse term x expert weight matrix from each expert's
+description, triggers and focus areas at load time, so ranking a task
+is one sparse matrix-vector product plus ``argpartition`` for top-n.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from enum import Enum
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .expert_definition import ExpertDefinition
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "be", "this",
+    "that", "it", "its", "into", "all", "any", "via", "using", "need",
+    "needs", "requests", "request",
+})
+
+
+class RankingMode(Enum):
+    """Expert ranking mode."""
+    HEURISTIC = "heuristic"    # Trigger/substring heuristic (TriggerIndex)
+    BM25 = "bm25"              # Okapi BM25 over expert text
+    TFIDF = "tfidf"            # Cosine similarity of TF-IDF vectors
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words."""
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class ExpertRankingMatrix:
+    """
+    Sparse term x expert weight matrix for vectorized ranking.
+
+    Stored term-major (CSC-style ``indptr``/``indices``/``data`` arrays),
+    so a query touches only the postings of its own terms. Scores are
+    calibrated to [0, 1]:
+
+    - BM25: raw score divided by the sum of the query terms' IDF, i.e.
+      the score of an average-length expert containing every query term
+      once (clipped at 1.0)
+    - TF-IDF: cosine similarity
+
+    Example:
+        >>> matrix = ExpertRankingMatrix(expert_definitions, RankingMode.BM25)
+        >>> matrix.top("Design a REST API with caching", n=3)
+        [('backend-architect', 0.71), ...]
+    """
+
+    def __init__(
+        self,
+        experts: Dict[str, ExpertDefinition],
+        mode: RankingMode = RankingMode.BM25,
+        k1: float = 1.2,
+        b: float = 0.75
+    ):
+        """
+        Build ranking matrix.
+
+        Args:
+            experts: Expert definitions keyed by agent ID
+            mode: RankingMode.BM25 or RankingMode.TFIDF
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        if mode == RankingMode.HEURISTIC:
+            raise ValueError("ExpertRankingMatrix requires BM25 or TFIDF mode")
+
+        self.mode = mode
+        self.k1 = k1
+        self.b = b
+        self.agent_ids: List[str] = list(experts)
+        self.vocabulary: Dict[str, int] = {}
+
+        self._build(experts)
+
+    @staticmethod
+    def expert_text(expert: ExpertDefinition) -> str:
+        """Text indexed for an expert."""
+        return " ".join([expert.description, *expert.triggers, *expert.focus_areas])
+
+    def _build(self, experts: Dict[str, ExpertDefinition]) -> None:
+        """Compute per-term postings and weights."""
+        doc_counts = [Counter(tokenize(self.expert_text(e))) for e in experts.values()]
+        n_docs = len(doc_counts)
+        doc_lengths = np.array([sum(c.values()) for c in doc_counts], dtype=np.float32)
+        avg_length = float(doc_lengths.mean()) if n_docs and doc_lengths.sum() else 1.0
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for position, counts in enumerate(doc_counts):
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((position, tf))
+
+        self.vocabulary = {term: i for i, term in enumerate(postings)}
+        self.idf = np.zeros(len(postings), dtype=np.float32)
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for term_id, entries in enumerate(postings.values()):
+            df = len(entries)
+            if self.mode == RankingMode.BM25:
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            else:
+                idf = math.log((1 + n_docs) / (1 + df)) + 1
+            self.idf[term_id] = idf
+
+            for position, tf in entries:
+                if self.mode == RankingMode.BM25:
+                    norm = self.k1 * (1 - self.b + self.b * doc_lengths[position] / avg_length)
+                    weight = idf * tf * (self.k1 + 1) / (tf + norm)
+                else:
+                    weight = idf * tf
+                indices.append(position)
+                data.append(weight)
+            indptr.append(len(indices))
+
+        self._indptr = np.array(indptr, dtype=np.int64)
+        self._indices = np.array(indices, dtype=np.int32)
+        self._data = np.array(data, dtype=np.float32)
+
+        if self.mode == RankingMode.TFIDF and n_docs:
+            # L2-normalize each expert vector so scores are cosines
+            norms = np.sqrt(np.bincount(
+                self._indices, weights=self._data.astype(np.float64) ** 2,
+                minlength=n_docs,
+            ))
+            norms[norms == 0] = 1.0
+            self._data = (self._data / norms[self._indices]).astype(np.float32)
+
+        logger.info(
+            f"Built {self.mode.value} ranking matrix: {n_docs} experts, "
+            f"{len(self.vocabulary)} terms, {len(self._data)} non-zeros"
+        )
+
+    def scores(self, task: str) -> np.ndarray:
+        """
+        Calibrated scores for every expert.
+
+        Args:
+            task: Task description (plus optional context)
+
+        Returns:
+            float32 array aligned with ``agent_ids``
+        """
+        n_docs = len(self.agent_ids)
+        query = Counter(
+            self.vocabulary[t] for t in tokenize(task) if t in self.vocabulary
+        )
+        if not query or not n_docs:
+            return np.zeros(n_docs, dtype=np.float32)
+
+        term_ids = np.fromiter(query.keys(), dtype=np.int64, count=len(query))
+        if self.mode == RankingMode.BM25:
+            query_weights = np.ones(len(term_ids), dtype=np.float32)
+        else:
+            query_weights = self.idf[term_ids] * np.fromiter(
+                query.values(), dtype=np.float32, count=len(query)
+            )
+
+        # Sparse matrix-vector product over the query terms' postings
+        starts = self._indptr[term_ids]
+        ends = self._indptr[term_ids + 1]
+        lengths = ends - starts
+        slots = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        raw = np.bincount(
+            self._indices[slots],
+            weights=self._data[slots] * np.repeat(query_weights, lengths),
+            minlength=n_docs,
+        ).astype(np.float32)
+
+        if self.mode == RankingMode.BM25:
+            bound = float(self.idf[term_ids].sum())
+            return np.minimum(raw / bound, 1.0) if bound > 0 else raw
+        return raw / max(float(np.linalg.norm(query_weights)), 1e-12)
+
+    def top(self, task: str, n: int = 1) -> List[Tuple[str, float]]:
+        """
+        Best scoring experts.
+
+        Args:
+            task: Task description (plus optional context)
+            n: Number of experts to return
+
+        Returns:
+            List of (agent_id, calibrated score), best first (non-zero only)
+        """
+        scores = self.scores(task)
+        n = min(n, len(scores))
+        if n <= 0:
+            return []
+
+        if n < len(scores):
+            # Keep every expert tied with the n-th score so the cut is stable
+            cutoff = -np.partition(-scores, n - 1)[n - 1]
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(len(scores))
+
+        # Highest score first, ties by catalog order
+        order = candidates[np.lexsort((candidates, -scores[candidates]))][:n]
+        return [
+            (self.agent_ids[position], float(scores[position]))
+            for position in order
+            if scores[position] > 0
+        ]
@@ -1,14 +1,19 @@
 """
 Expert Selector - AI-based intelligent expert selection.
 
-Uses Claude to analyze tasks and select the most appropriate expert agent.
+Selects experts locally by cosine similarity against precomputed expert
+embeddings, asking an LLM reranker only when the top candidates are too
+close to call. Falls back to keyword heuristics without embeddings.
 """
 
+import asyncio
 import logging
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
 
 from .agent_pool import AgentPoolManager, ExpertDefinition
+from .expert_embeddings import ExpertEmbeddingIndex
+from .selection_cache import SelectionCache
 
 
 logger = logging.getLogger(__name__)
@@ -17,16 +22,43 @@ logger = logging.getLogger(__name__)
 class ExpertSelector:
     """AI-based expert selection system."""
 
-    def __init__(self, pool_manager: AgentPoolManager, logger_instance=None):
+    def __init__(
+        self,
+        pool_manager: AgentPoolManager,
+        logger_instance=None,
+        embedding_index: Optional[ExpertEmbeddingIndex] = None,
+        reranker: Optional[
+            Callable[[str, List[ExpertDefinition]], Awaitable[Optional[str]]]
+        ] = None,
+        rerank_margin: float = 0.05,
+        top_k: int = 3,
+        selection_cache: Optional[SelectionCache] = None,
+    ):
         """
         Initialize expert selector.
 
         Args:
             pool_manager: Agent pool manager instance
             logger_instance: Logger instance
+            embedding_index: Optional precomputed expert embeddings
+            reranker: Optional async (task, candidates) -> expert_id (LLM call)
+            rerank_margin: Rerank when top cosine scores differ by less than this
+            top_k: Candidates retrieved per task
+            selection_cache: Optional memo of selections by normalized task
         """
         self.pool_manager = pool_manager
         self.logger = logger_instance or logger
+        self.embedding_index = embedding_index
+        self.reranker = reranker
+        self.rerank_margin = rerank_margin
+        self.top_k = top_k
+        self.selection_cache = selection_cache
+
+        self.selection_stats = {"semantic": 0, "reranked": 0, "heuristic": 0}
+
+        # Catalog version the embeddings were last synced to (None = never)
+        self._synced_version: Optional[int] = None
+        self._sync_lock = asyncio.Lock()
 
     async def select_expert(
         self, task_description: str, available_experts: List[ExpertDefinition] = None
@@ -41,6 +73,28 @@ class ExpertSelector:
         Returns:
             expert_id (e.g., "BackendExpert") or None
         """
+        # Only whole-catalog selections are memoized; subsets are caller-specific
+        use_cache = self.selection_cache is not None and available_experts is None
+        if use_cache:
+            cached = self.selection_cache.get(
+                task_description, version=self.pool_manager.catalog_version
+            )
+            if cached:
+                self.logger.debug(f"Selection cache hit: {cached}")
+                return cached
+
+        selected = await self._select_uncached(task_description, available_experts)
+
+        if use_cache and selected:
+            self.selection_cache.put(
+                task_description, selected, version=self.pool_manager.catalog_version
+            )
+        return selected
+
+    async def _select_uncached(
+        self, task_description: str, available_experts: Optional[List[ExpertDefinition]]
+    ) -> Optional[str]:
+        """Run semantic/heuristic selection with fallback."""
         if available_experts is None:
             available_experts = list(self.pool_manager.expert_definitions.values())
 
@@ -48,16 +102,14 @@ class ExpertSelector:
             self.logger.warning("No experts available for selection")
             return None
 
-        # Build expert descriptions
-        experts_description = "\n".join(
-            [
-                f"- {exp.expert_id}: {exp.description}\n  Skills: {', '.join(exp.skills[:3])}"
-                for exp in available_experts
-            ]
-        )
+        # Semantic selection against precomputed expert embeddings
+        selected = await self._semantic_selection(task_description, available_experts)
 
-        # Simple heuristic-based selection (production would use Claude API)
-        selected = self._heuristic_selection(task_description, available_experts)
+        # Keyword heuristics when embeddings are unavailable
+        if not selected:
+            selected = self._heuristic_selection(task_description, available_experts)
+            if selected:
+                self.selection_stats["heuristic"] += 1
 
         if selected:
             self.logger.info(
@@ -70,6 +122,69 @@ class ExpertSelector:
         self.logger.warning(f"No specific expert found, using {fallback}")
         return fallback
 
+    async def _semantic_selection(
+        self, task_description: str, available_experts: List[ExpertDefinition]
+    ) -> Optional[str]:
+        """
+        Cosine top-k selection with margin-gated LLM rerank.
+
+        Args:
+            task_description: Task description
+            available_experts: Available experts
+
+        Returns:
+            Selected expert_id or None if embeddings are unavailable
+        """
+        if not self.embedding_index or not self.embedding_index.available:
+            return None
+
+        allowed = {exp.expert_id for exp in available_experts}
+        try:
+            await self._sync_embeddings()
+            # Encoding is CPU-bound: keep it off the event loop
+            candidates = await asyncio.to_thread(
+                self.embedding_index.top_k, task_description, self.top_k, allowed
+            )
+        except Exception as exc:
+            self.logger.warning(f"Semantic selection failed, using heuristics: {exc}")
+            return None
+        if not candidates:
+            return None
+
+        best_id, best_score = candidates[0]
+        close = [
+            expert_id for expert_id, score in candidates
+            if best_score - score < self.rerank_margin
+        ]
+
+        if self.reranker and len(close) > 1:
+            experts = [self.pool_manager.expert_definitions[e] for e in close]
+            try:
+                reranked = await self.reranker(task_description, experts)
+                if reranked in close:
+                    self.selection_stats["reranked"] += 1
+                    self.logger.info(
+                        f"Reranked {len(close)} close candidates -> {reranked}"
+                    )
+                    return reranked
+            except Exception as exc:
+                self.logger.warning(f"Expert rerank failed, using top candidate: {exc}")
+
+        self.selection_stats["semantic"] += 1
+        self.logger.debug(f"Semantic selection: {best_id} ({best_score:.3f})")
+        return best_id
+
+    async def _sync_embeddings(self) -> None:
+        """Embed catalog changes (e.g. create_expert_type) once per catalog version."""
+        async with self._sync_lock:
+            version = self.pool_manager.catalog_version
+            if version == self._synced_version:
+                return
+            await asyncio.to_thread(
+                self.embedding_index.sync, self.pool_manager.expert_definitions
+            )
+            self._synced_version = version
+
     def _heuristic_selection(
         self, task_description: str, available_experts: List[ExpertDefinition]
     ) -> Optional[str]:
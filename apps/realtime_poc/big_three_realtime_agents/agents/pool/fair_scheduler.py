@@ -0,0 +1,331 @@
+"""
+Fair Scheduler - Weighted deficit round-robin for pool work.
+
+Queues task executions per class (caller x expert type) and dispatches
+them with deficit round-robin, so one workflow flooding a single expert
+cannot starve other callers. Supports weights, strict priorities and
+in-flight limits per caller, per expert and globally.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Queue wait samples kept per class for percentiles
+WAIT_SAMPLES = 512
+
+ClassKey = Tuple[str, str]
+
+
+@dataclass(order=True)
+class _Request:
+    """Queued execution (ordered by priority, then arrival)."""
+    sort_key: Tuple[int, int]
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+@dataclass
+class _ClassState:
+    """Queue and accounting of one caller x expert class."""
+    queue: List[_Request] = field(default_factory=list)
+    deficit: float = 0.0
+    in_flight: int = 0
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    wait_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+    def head(self) -> Optional[_Request]:
+        """Oldest highest-priority live request (drops cancelled ones)."""
+        while self.queue and self.queue[0].future.done():
+            heapq.heappop(self.queue)
+        return self.queue[0] if self.queue else None
+
+
+class FairScheduler:
+    """
+    Weighted deficit round-robin scheduler.
+
+    Each class (caller, expert_id) has its own queue. Among classes whose
+    head request has the highest pending priority and whose caller and
+    expert are under their in-flight limits, classes are served round
+    robin; a class earns ``quantum * caller_weight * expert_weight``
+    credits per visit and each dispatch costs one credit.
+
+    Example:
+        >>> scheduler = FairScheduler(max_in_flight=8)
+        >>> scheduler.set_caller_weight("interactive", 4.0)
+        >>> result = await scheduler.submit(
+        ...     lambda: executor.execute_task(instance_id, task),
+        ...     caller="workflow-42", expert_id="BackendExpert",
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_in_flight_per_caller: Optional[int] = None,
+        max_in_flight_per_expert: Optional[int] = None,
+        quantum: float = 1.0,
+        logger_instance=None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_in_flight: Global limit of running executions (None = unlimited)
+            max_in_flight_per_caller: Default limit per caller
+            max_in_flight_per_expert: Default limit per expert type
+            quantum: Credits per round-robin visit at weight 1.0
+            logger_instance: Logger instance
+        """
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_caller = max_in_flight_per_caller
+        self.max_in_flight_per_expert = max_in_flight_per_expert
+        self.quantum = quantum
+        self.logger = logger_instance or logger
+
+        self.caller_weights: Dict[str, float] = {}
+        self.expert_weights: Dict[str, float] = {}
+        self.caller_limits: Dict[str, int] = {}
+        self.expert_limits: Dict[str, int] = {}
+
+        self._classes: Dict[ClassKey, _ClassState] = {}
+        self._ring: List[ClassKey] = []
+        self._position = 0
+        self._seq = itertools.count()
+
+        self._in_flight = 0
+        self._caller_in_flight: Dict[str, int] = {}
+        self._expert_in_flight: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def set_caller_weight(self, caller: str, weight: float) -> None:
+        """Relative share of a caller (default 1.0)."""
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.caller_weights[caller] = weight
+
+    def set_expert_weight(self, expert_id: str, weight: float) -> None:
+        """Relative share of an expert type (default 1.0)."""
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.expert_weights[expert_id] = weight
+
+    def set_caller_limit(self, caller: str, max_in_flight: int) -> None:
+        """Maximum concurrent executions for a caller."""
+        self.caller_limits[caller] = max_in_flight
+
+    def set_expert_limit(self, expert_id: str, max_in_flight: int) -> None:
+        """Maximum concurrent executions for an expert type."""
+        self.expert_limits[expert_id] = max_in_flight
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    async def submit(
+        self,
+        work: Callable[[], Awaitable[Any]],
+        caller: str = "default",
+        expert_id: str = "default",
+        priority: int = 0,
+    ) -> Any:
+        """
+        Queue work and run it when scheduled.
+
+        Args:
+            work: Zero-argument callable returning an awaitable
+            caller: Caller identity (workflow, session, user)
+            expert_id: Expert type the work runs on
+            priority: Higher runs first (strict across classes)
+
+        Returns:
+            Result of the awaited work
+        """
+        key = (caller, expert_id)
+        state = self._classes.get(key)
+        if state is None:
+            state = self._classes[key] = _ClassState()
+            self._ring.append(key)
+
+        request = _Request(
+            sort_key=(-priority, next(self._seq)),
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(state.queue, request)
+        state.submitted += 1
+        self._dispatch()
+
+        try:
+            await request.future
+        except asyncio.CancelledError:
+            if request.future.done() and not request.future.cancelled():
+                # Dispatched as we were cancelled: give the slot back
+                self._finish(key)
+            else:
+                request.future.cancel()
+                self._prune(key)
+            raise
+
+        waited = time.monotonic() - request.enqueued_at
+        state.started += 1
+        state.wait_total += waited
+        state.wait_max = max(state.wait_max, waited)
+        state.wait_samples.append(waited)
+
+        try:
+            return await work()
+        finally:
+            state.completed += 1
+            self._finish(key)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _weight(self, key: ClassKey) -> float:
+        """Combined caller x expert weight of class."""
+        caller, expert_id = key
+        return self.caller_weights.get(caller, 1.0) * self.expert_weights.get(expert_id, 1.0)
+
+    def _eligible(self, key: ClassKey) -> bool:
+        """Whether class is under its caller and expert limits."""
+        caller, expert_id = key
+        caller_limit = self.caller_limits.get(caller, self.max_in_flight_per_caller)
+        expert_limit = self.expert_limits.get(expert_id, self.max_in_flight_per_expert)
+        if caller_limit is not None and self._caller_in_flight.get(caller, 0) >= caller_limit:
+            return False
+        if expert_limit is not None and self._expert_in_flight.get(expert_id, 0) >= expert_limit:
+            return False
+        return True
+
+    def _pick(self) -> Optional[ClassKey]:
+        """Next class to serve by priority, then deficit round-robin."""
+        candidates = {}
+        for key in self._ring:
+            head = self._classes[key].head()
+            if head is None:
+                self._classes[key].deficit = 0.0
+            elif self._eligible(key):
+                candidates[key] = head.sort_key[0]
+        if not candidates:
+            return None
+
+        top = min(candidates.values())
+        candidates = {key for key, rank in candidates.items() if rank == top}
+
+        while True:
+            self._position %= len(self._ring)
+            key = self._ring[self._position]
+            if key in candidates:
+                state = self._classes[key]
+                if state.deficit >= 1.0:
+                    state.deficit -= 1.0
+                    return key
+            self._position += 1
+            next_key = self._ring[self._position % len(self._ring)]
+            if next_key in candidates:
+                self._classes[next_key].deficit += self.quantum * self._weight(next_key)
+
+    def _dispatch(self) -> None:
+        """Start queued requests while capacity allows."""
+        while self.max_in_flight is None or self._in_flight < self.max_in_flight:
+            key = self._pick()
+            if key is None:
+                return
+
+            state = self._classes[key]
+            request = heapq.heappop(state.queue)
+            caller, expert_id = key
+
+            self._in_flight += 1
+            state.in_flight += 1
+            self._caller_in_flight[caller] = self._caller_in_flight.get(caller, 0) + 1
+            self._expert_in_flight[expert_id] = self._expert_in_flight.get(expert_id, 0) + 1
+            request.future.set_result(None)
+
+    def _finish(self, key: ClassKey) -> None:
+        """Release in-flight slot and dispatch waiting work."""
+        caller, expert_id = key
+        self._in_flight -= 1
+        self._classes[key].in_flight -= 1
+        self._caller_in_flight[caller] -= 1
+        if not self._caller_in_flight[caller]:
+            del self._caller_in_flight[caller]
+        self._expert_in_flight[expert_id] -= 1
+        if not self._expert_in_flight[expert_id]:
+            del self._expert_in_flight[expert_id]
+        self._prune(key)
+        self._dispatch()
+
+    def _prune(self, key: ClassKey) -> None:
+        """Forget class once it has nothing queued or running."""
+        state = self._classes.get(key)
+        if state is None or state.in_flight or state.head() is not None:
+            return
+
+        index = self._ring.index(key)
+        del self._ring[index]
+        del self._classes[key]
+        if index < self._position:
+            self._position -= 1
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Global counters plus per-class queue depth, in-flight count and
+            queue wait (avg, p50, p95, max seconds) for classes with queued
+            or running work
+        """
+        classes = {}
+        for (caller, expert_id), state in self._classes.items():
+            samples = sorted(state.wait_samples)
+            classes[f"{caller}/{expert_id}"] = {
+                "weight": self._weight((caller, expert_id)),
+                "queued": sum(1 for r in state.queue if not r.future.done()),
+                "in_flight": state.in_flight,
+                "submitted": state.submitted,
+                "started": state.started,
+                "completed": state.completed,
+                "wait_avg_seconds": state.wait_total / state.started if state.started else 0.0,
+                "wait_p50_seconds": _percentile(samples, 0.50),
+                "wait_p95_seconds": _percentile(samples, 0.95),
+                "wait_max_seconds": state.wait_max,
+            }
+
+        return {
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queued": sum(c["queued"] for c in classes.values()),
+            "classes": classes,
+        }
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
@@ -6,10 +6,12 @@ Manages task execution, result handling, and context accumulation.
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional
-from pathlib import Path
+import re
+import time
+from typing import Dict, Any, Optional, Set
 
 from .agent_pool import AgentPoolManager, AgentInstance, AgentStatus
+from .prompt_cache import PromptCache
 
 
 logger = logging.getLogger(__name__)
@@ -18,7 +20,13 @@ logger = logging.getLogger(__name__)
 class InstanceExecutor:
     """Execute tasks on agent instances."""
 
-    def __init__(self, pool_manager: AgentPoolManager, claude_coder, logger_instance=None):
+    def __init__(
+        self,
+        pool_manager: AgentPoolManager,
+        claude_coder,
+        logger_instance=None,
+        prompt_cache: Optional[PromptCache] = None,
+    ):
         """
         Initialize instance executor.
 
@@ -26,10 +34,15 @@ class InstanceExecutor:
             pool_manager: Agent pool manager
             claude_coder: ClaudeCodeAgenticCoder instance for execution
             logger_instance: Logger instance
+            prompt_cache: Shared expert prompt cache
         """
         self.pool_manager = pool_manager
         self.claude_coder = claude_coder
         self.logger = logger_instance or logger
+        self.prompt_cache = prompt_cache or PromptCache()
+
+        # Claude Code agents known to exist (one per pool instance)
+        self._coder_agents: Set[str] = set()
 
     async def execute_task(
         self, instance_id: str, task: str, context: Optional[str] = None
@@ -53,6 +66,7 @@ class InstanceExecutor:
         if instance.status == AgentStatus.TERMINATED:
             return {"success": False, "error": f"Instance {instance_id} is terminated"}
 
+        started = time.monotonic()
         try:
             # Mark as working
             self.pool_manager.mark_working(instance_id)
@@ -65,6 +79,9 @@ class InstanceExecutor:
 
             # Update instance
             self._update_instance_after_execution(instance, task, result)
+            self.pool_manager.metrics.record_task(
+                instance.expert_id, time.monotonic() - started, success=True
+            )
 
             # Release instance
             task_summary = result.get("output", "")[:500]  # First 500 chars
@@ -80,12 +97,24 @@ class InstanceExecutor:
 
         except Exception as exc:
             self.logger.error(f"Task execution failed for {instance_id}: {exc}")
+            self.pool_manager.metrics.record_task(
+                instance.expert_id, time.monotonic() - started, success=False
+            )
 
             # Release instance even on error
             self.pool_manager.release_instance(instance_id, f"ERROR: {str(exc)}")
 
             return {"success": False, "error": str(exc), "instance_id": instance_id}
 
+        except asyncio.CancelledError:
+            # Caller gave up (hedge lost, deadline): free the instance, keep cancelling
+            self.logger.info(f"Task execution cancelled on {instance_id}")
+            self.pool_manager.metrics.record_task(
+                instance.expert_id, time.monotonic() - started, success=False
+            )
+            self.pool_manager.release_instance(instance_id)
+            raise
+
     def _build_task_with_context(
         self, instance: AgentInstance, task: str, additional_context: Optional[str]
     ) -> str:
@@ -108,27 +137,67 @@ class InstanceExecutor:
     async def _execute_via_claude(
         self, instance: AgentInstance, task: str
     ) -> Dict[str, Any]:
-        """Execute task using Claude Code agent."""
+        """
+        Execute task using Claude Code agent.
+
+        Each pool instance maps to one Claude Code agent named after its
+        session, created on first use and commanded for every later task,
+        so reused, affinity-routed and revived instances keep their session.
+
+        The coder is synchronous, so it runs in a worker thread; the event
+        loop stays free and callers can cancel the await (the thread then
+        finishes in the background).
+
+        Raises:
+            RuntimeError: The coder reported a failure
+        """
         expert_def = self.pool_manager.expert_definitions[instance.expert_id]
 
-        # Load system prompt
-        prompt_path = Path(expert_def.system_prompt_template)
-        if prompt_path.exists():
-            system_prompt = prompt_path.read_text(encoding="utf-8")
-        else:
-            system_prompt = f"You are {expert_def.name}. {expert_def.description}"
+        # System prompt rendered once per expert (re-read only if file changes)
+        system_prompt = self.prompt_cache.get(expert_def)
 
-        # Use Claude coder to execute
-        # This is a simplified version - production would use full Claude SDK
-        try:
-            working_dir = Path(expert_def.working_directory)
-            result = await self.claude_coder.execute_task(
-                task=f"{system_prompt}\n\n{task}", working_dir=working_dir
-            )
-            return result
-        except Exception as exc:
-            self.logger.error(f"Claude execution error: {exc}")
-            return {"output": f"Execution error: {str(exc)}", "files_modified": []}
+        agent_name = await asyncio.to_thread(self._ensure_coder_agent, instance.session_id)
+        instance.session_id = agent_name
+
+        result = await asyncio.to_thread(
+            self.claude_coder.execute_task, system_prompt.apply(task), agent_name=agent_name
+        )
+        if not result.get("ok"):
+            raise RuntimeError(result.get("error", "Claude execution failed"))
+
+        data = result.get("data") or {}
+        return {
+            "output": data.get("output") or data.get("message", ""),
+            "files_modified": data.get("files_modified", []),
+        }
+
+    def _ensure_coder_agent(self, session_id: str) -> str:
+        """
+        Name of the Claude Code agent backing a session (blocking).
+
+        Looks the agent up in the coder registry (it survives restarts) and
+        creates it if missing.
+
+        Returns:
+            Agent name to command (stored as the instance's session_id)
+
+        Raises:
+            RuntimeError: The agent could not be created
+        """
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", session_id)
+        if name in self._coder_agents:
+            return name
+
+        listed = self.claude_coder.list_agents()
+        if name not in {agent.get("name") for agent in listed.get("data", [])}:
+            created = self.claude_coder.create_agent(agent_name=name)
+            if not created.get("ok"):
+                raise RuntimeError(created.get("error", "Claude agent creation failed"))
+            name = created["data"]["name"]
+            self.logger.info(f"Created Claude Code agent {name} for session {session_id}")
+
+        self._coder_agents.add(name)
+        return name
 
     def _update_instance_after_execution(
         self, instance: AgentInstance, task: str, result: Dict[str, Any]
@@ -153,7 +222,7 @@ class InstanceExecutor:
         """Clear accumulated context for instance."""
         instance = self.pool_manager.get_instance(instance_id)
         if instance:
-            instance.accumulated_context = ""
+            instance.context_window.reset()
             self.logger.info(f"Cleared context for {instance_id}")
             return True
         return False
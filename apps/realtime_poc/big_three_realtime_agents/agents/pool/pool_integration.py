@@ -5,13 +5,23 @@ Coordinates agent pool with Claude Code agentic coder and provides
 unified interface for agent management based on refactoring.md design.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-from .agent_pool import AgentPoolManager
+from .agent_pool import AgentPoolManager, AgentStatus
 from .expert_selector import ExpertSelector
+from .expert_embeddings import ExpertEmbeddingIndex
+from .selection_cache import SelectionCache
+from .warm_pool import WarmPoolController
+from .pool_reaper import PoolReaper
+from .pool_snapshot import PoolSnapshotter
+from .coordination import PoolCoordinator, create_coordination_backend
+from .fair_scheduler import FairScheduler
 from .instance_executor import InstanceExecutor
+from .prompt_cache import PromptCache
+from ...timeouts import AGENT_ACQUIRE_TIMEOUT
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +44,8 @@ class PoolIntegrationManager:
         claude_coder,
         pool_definition_path: str = None,
         logger_instance=None,
+        expert_reranker=None,
+        context_summarizer=None,
     ):
         """
         Initialize pool integration manager.
@@ -43,19 +55,89 @@ class PoolIntegrationManager:
             claude_coder: ClaudeCodeAgenticCoder instance
             pool_definition_path: Optional path to expert_agents.json
             logger_instance: Logger instance
+            expert_reranker: Optional async (task, candidates) -> expert_id
+                used when semantic candidates are too close to call
+            context_summarizer: Optional async (texts) -> summary used to
+                condense older per-instance context
         """
         self.pool_dir = Path(pool_dir)
         self.claude_coder = claude_coder
         self.logger = logger_instance or logger
 
+        from ...config import (
+            AGENT_IDLE_TIMEOUT_MINUTES,
+            ENABLE_SEMANTIC_SELECTION,
+            EXPERT_EMBEDDING_MODEL,
+            EXPERT_RERANK_MARGIN,
+            INSTANCE_CONTEXT_MAX_ENTRIES,
+            INSTANCE_CONTEXT_TOKEN_BUDGET,
+            POOL_AFFINITY_MIN_SCORE,
+            POOL_AFFINITY_ROUTING,
+            POOL_COORDINATION_BACKEND,
+            POOL_COORDINATION_REDIS_URL,
+            POOL_COORDINATION_SQLITE_PATH,
+            POOL_MAX_IN_FLIGHT,
+            POOL_MAX_IN_FLIGHT_PER_CALLER,
+            POOL_MAX_MEMORY_MB,
+            POOL_NODE_ID,
+            POOL_REAPER_INTERVAL_SECONDS,
+            SELECTION_CACHE_MAX_ENTRIES,
+            SELECTION_CACHE_TTL_SECONDS,
+        )
+
+        # Shared lease table when several orchestrator processes share the pool
+        backend = create_coordination_backend(
+            POOL_COORDINATION_BACKEND,
+            sqlite_path=POOL_COORDINATION_SQLITE_PATH,
+            redis_url=POOL_COORDINATION_REDIS_URL,
+        )
+        self.coordinator: Optional[PoolCoordinator] = (
+            PoolCoordinator(backend, node_id=POOL_NODE_ID or None, logger_instance=self.logger)
+            if backend
+            else None
+        )
+
         # Initialize agent pool manager
         self.pool_manager = AgentPoolManager(
-            pool_definition_path=pool_definition_path, logger_instance=self.logger
+            pool_definition_path=pool_definition_path,
+            logger_instance=self.logger,
+            context_max_entries=INSTANCE_CONTEXT_MAX_ENTRIES,
+            context_token_budget=INSTANCE_CONTEXT_TOKEN_BUDGET,
+            context_summarizer=context_summarizer,
+            affinity_routing=POOL_AFFINITY_ROUTING,
+            affinity_min_score=POOL_AFFINITY_MIN_SCORE,
+            coordinator=self.coordinator,
         )
 
-        # Initialize expert selector
+        # Expert prompts cached by path + mtime (executor and embeddings)
+        self.prompt_cache = PromptCache()
+
+        # Initialize expert selector (embeddings persisted next to the catalog)
+        embedding_index = None
+        if ENABLE_SEMANTIC_SELECTION:
+            catalog_path = Path(pool_definition_path) if pool_definition_path else self.pool_dir
+            embeddings_path = (
+                catalog_path.with_suffix(".embeddings.npz")
+                if catalog_path.suffix
+                else catalog_path / ".expert_embeddings.npz"
+            )
+            embedding_index = ExpertEmbeddingIndex(
+                embeddings_path=embeddings_path,
+                model_name=EXPERT_EMBEDDING_MODEL,
+                prompt_cache=self.prompt_cache,
+                logger_instance=self.logger,
+            )
+
         self.selector = ExpertSelector(
-            pool_manager=self.pool_manager, logger_instance=self.logger
+            pool_manager=self.pool_manager,
+            logger_instance=self.logger,
+            embedding_index=embedding_index,
+            reranker=expert_reranker,
+            rerank_margin=EXPERT_RERANK_MARGIN,
+            selection_cache=SelectionCache(
+                ttl_seconds=SELECTION_CACHE_TTL_SECONDS,
+                max_entries=SELECTION_CACHE_MAX_ENTRIES,
+            ),
         )
 
         # Initialize instance executor
@@ -63,12 +145,91 @@ class PoolIntegrationManager:
             pool_manager=self.pool_manager,
             claude_coder=claude_coder,
             logger_instance=self.logger,
+            prompt_cache=self.prompt_cache,
+        )
+
+        # Weighted fair scheduling of task execution across callers/experts
+        self.scheduler = FairScheduler(
+            max_in_flight=POOL_MAX_IN_FLIGHT or None,
+            max_in_flight_per_caller=POOL_MAX_IN_FLIGHT_PER_CALLER or None,
+            logger_instance=self.logger,
+        )
+
+        # Background reclamation of terminated/idle instances (start() on a loop)
+        self.reaper = PoolReaper(
+            pool_manager=self.pool_manager,
+            interval_seconds=POOL_REAPER_INTERVAL_SECONDS,
+            idle_ttl_seconds=AGENT_IDLE_TIMEOUT_MINUTES * 60,
+            max_pool_bytes=int(POOL_MAX_MEMORY_MB * 1024 * 1024) or None,
+            logger_instance=self.logger,
         )
 
+        # Optional predictive pre-warming (see enable_prewarming)
+        self.warm_pool: Optional[WarmPoolController] = None
+
+        # Optional persistence of pool state across restarts (see enable_snapshots)
+        self.snapshots: Optional[PoolSnapshotter] = None
+
         self.logger.info(
             f"PoolIntegrationManager initialized with {len(self.pool_manager.expert_definitions)} experts"
         )
 
+    def enable_prewarming(self, outcome_tracker=None) -> WarmPoolController:
+        """
+        Create warm pool controller from configuration.
+
+        Args:
+            outcome_tracker: Optional OutcomeTracker to seed demand forecasts
+
+        Returns:
+            WarmPoolController (call ``start()`` on a running event loop)
+        """
+        from ...config import (
+            POOL_PREWARM_ALPHA,
+            POOL_PREWARM_INTERVAL_SECONDS,
+            POOL_PREWARM_MAX_PER_EXPERT,
+            POOL_PREWARM_MAX_TOTAL,
+        )
+
+        if self.warm_pool is None:
+            self.warm_pool = WarmPoolController(
+                pool_manager=self.pool_manager,
+                outcome_tracker=outcome_tracker,
+                interval_seconds=POOL_PREWARM_INTERVAL_SECONDS,
+                alpha=POOL_PREWARM_ALPHA,
+                max_warm_total=POOL_PREWARM_MAX_TOTAL,
+                max_warm_per_expert=POOL_PREWARM_MAX_PER_EXPERT,
+                logger_instance=self.logger,
+            )
+        return self.warm_pool
+
+    def enable_snapshots(self, path: Path) -> PoolSnapshotter:
+        """
+        Create pool snapshotter and load the previous snapshot (lazy restore).
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            PoolSnapshotter (call ``start()`` on a running event loop,
+            ``save()`` on shutdown)
+        """
+        from ...config import (
+            POOL_SNAPSHOT_INTERVAL_SECONDS,
+            POOL_SNAPSHOT_MAX_AGE_HOURS,
+        )
+
+        if self.snapshots is None:
+            self.snapshots = PoolSnapshotter(
+                pool_manager=self.pool_manager,
+                path=path,
+                interval_seconds=POOL_SNAPSHOT_INTERVAL_SECONDS,
+                max_age_seconds=POOL_SNAPSHOT_MAX_AGE_HOURS * 3600,
+                logger_instance=self.logger,
+            )
+            self.snapshots.load()
+        return self.snapshots
+
     def get_pool_status(self) -> Dict[str, Any]:
         """
         Get comprehensive pool status.
@@ -80,16 +241,57 @@ class PoolIntegrationManager:
         expert_types = self.pool_manager.list_expert_types()
         active_instances = self.pool_manager.list_active_instances()
 
-        return {
+        status = {
             "stats": stats,
             "expert_types_count": len(expert_types),
             "active_instances_count": len(active_instances),
             "expert_types": expert_types[:10],  # First 10
             "active_instances": active_instances,
+            "selection": {
+                **self.selector.selection_stats,
+                "cache": self.selector.selection_cache.get_stats(),
+            },
+        }
+
+        status["scheduler"] = self.scheduler.get_stats()
+        status["reaper"] = self.reaper.get_stats()
+        status["prompt_cache"] = self.prompt_cache.get_stats()
+        status["metrics"] = self.pool_manager.metrics.snapshot()
+        if self.warm_pool:
+            status["warm_pool"] = self.warm_pool.get_stats()
+        if self.snapshots:
+            status["snapshots"] = self.snapshots.get_stats()
+        if self.coordinator:
+            status["coordination"] = self.coordinator.get_stats()
+
+        return status
+
+    def get_pool_metrics(self, format: str = "json") -> Any:
+        """
+        Export pool instrumentation.
+
+        Args:
+            format: "json" for a snapshot dict, "prometheus" for exposition text
+
+        Returns:
+            Metrics snapshot dict or Prometheus text
+        """
+        if format == "prometheus":
+            return self.pool_manager.metrics.render_prometheus()
+        if format != "json":
+            raise ValueError(f"Unknown metrics format: {format}")
+
+        return {
+            **self.pool_manager.metrics.snapshot(),
+            "acquisitions": self.pool_manager.get_stats()["acquisitions"],
         }
 
     async def create_pool_agent(
-        self, task: str, agent_id: Optional[str] = None, prefer_reuse: bool = True
+        self,
+        task: str,
+        agent_id: Optional[str] = None,
+        prefer_reuse: bool = True,
+        acquire_timeout: Optional[float] = AGENT_ACQUIRE_TIMEOUT,
     ) -> Dict[str, Any]:
         """
         Create or reuse pool agent for task.
@@ -98,6 +300,8 @@ class PoolIntegrationManager:
             task: Task description
             agent_id: Optional specific expert ID
             prefer_reuse: Whether to prefer reusing idle instances
+            acquire_timeout: Seconds to queue when the expert is at capacity
+                (0 = fail immediately, None = wait indefinitely)
 
         Returns:
             Dict with instance info
@@ -112,7 +316,10 @@ class PoolIntegrationManager:
 
             # Acquire expert instance
             instance = await self.pool_manager.acquire_expert(
-                expert_id=agent_id, task_description=task, prefer_reuse=prefer_reuse
+                expert_id=agent_id,
+                task_description=task,
+                prefer_reuse=prefer_reuse,
+                timeout=acquire_timeout,
             )
 
             if not instance:
@@ -138,20 +345,44 @@ class PoolIntegrationManager:
             return {"ok": False, "error": str(exc)}
 
     async def execute_agent_task(
-        self, instance_id: str, task: str, context: Optional[str] = None
+        self,
+        instance_id: str,
+        task: str,
+        context: Optional[str] = None,
+        caller: str = "default",
+        priority: int = 0,
     ) -> Dict[str, Any]:
         """
         Execute task on agent instance.
 
+        Executions are queued by the fair scheduler per (caller, expert)
+        class, so a caller flooding one expert type cannot starve others.
+
         Args:
             instance_id: Instance ID (e.g., "BackendExpert#1")
             task: Task description
             context: Additional context
+            caller: Caller identity used for fair sharing (workflow, session)
+            priority: Higher priority work is dispatched first
 
         Returns:
             Execution result
         """
-        result = await self.executor.execute_task(instance_id, task, context)
+        instance = self.pool_manager.get_instance(instance_id)
+        expert_id = instance.expert_id if instance else "unknown"
+
+        try:
+            result = await self.scheduler.submit(
+                lambda: self.executor.execute_task(instance_id, task, context),
+                caller=caller,
+                expert_id=expert_id,
+                priority=priority,
+            )
+        except asyncio.CancelledError:
+            # Cancelled while queued: the executor never ran, so release here
+            if instance and instance.status == AgentStatus.RESERVED:
+                self.pool_manager.release_instance(instance_id)
+            raise
         return result
 
     def release_agent(self, instance_id: str, task_result: str = "") -> Dict[str, Any]:
@@ -243,7 +474,8 @@ class PoolIntegrationManager:
         )
 
         # Add to pool
-        self.pool_manager.expert_definitions[expert_id] = new_expert
+        self.pool_manager.register_expert(new_expert)
+        self.prompt_cache.invalidate(expert_id)
 
         self.logger.info(f"Created new expert type: {expert_id}")
 
@@ -0,0 +1,250 @@
+"""
+Pool Metrics - Utilization and latency instrumentation for the agent pool.
+
+Records time-in-state per instance, acquire wait and creation latency
+histograms, reuse vs create counts and task durations per expert, so
+MAX_INSTANCES_PER_EXPERT and idle timeouts can be sized from data.
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+STATE_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and max."""
+
+    def __init__(self, buckets: Iterable[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds (+Inf is implicit)
+        """
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, fraction: float) -> float:
+        """Approximate quantile (upper bound of the containing bucket)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Histogram summary and cumulative buckets."""
+        cumulative, buckets = 0, {}
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """
+    Thread-safe metrics recorder for AgentPoolManager.
+
+    Example:
+        >>> metrics = PoolMetrics()
+        >>> metrics.record_acquire("BackendExpert", wait_seconds=0.02, reused=True)
+        >>> metrics.snapshot()["per_expert"]["BackendExpert"]["reuse_ratio"]
+        1.0
+    """
+
+    def __init__(self):
+        """Initialize metrics."""
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+        self.acquire_wait = Histogram(LATENCY_BUCKETS)
+        self.creation_latency = Histogram(LATENCY_BUCKETS)
+        self.time_in_state: Dict[str, Histogram] = {}
+
+        self._per_expert: Dict[str, Dict[str, Any]] = {}
+        self._state_entered: Dict[str, Tuple[str, float]] = {}
+        self._instance_state_seconds: Dict[str, Dict[str, float]] = {}
+
+    def _expert(self, expert_id: str) -> Dict[str, Any]:
+        """Per-expert record (lock held)."""
+        record = self._per_expert.get(expert_id)
+        if record is None:
+            record = self._per_expert[expert_id] = {
+                "reused": 0,
+                "created": 0,
+                "failed": 0,
+                "task_duration": Histogram(DURATION_BUCKETS),
+                "task_failures": 0,
+            }
+        return record
+
+    def record_state(self, instance_id: str, state: str) -> None:
+        """Instance entered state; closes the previous state's interval."""
+        now = time.monotonic()
+        with self._lock:
+            previous = self._state_entered.get(instance_id)
+            if previous:
+                previous_state, since = previous
+                elapsed = now - since
+                self.time_in_state.setdefault(
+                    previous_state, Histogram(STATE_BUCKETS)
+                ).observe(elapsed)
+                totals = self._instance_state_seconds.setdefault(instance_id, {})
+                totals[previous_state] = totals.get(previous_state, 0.0) + elapsed
+            self._state_entered[instance_id] = (state, now)
+
+    def forget_instance(self, instance_id: str) -> None:
+        """Drop per-instance state of a removed instance."""
+        with self._lock:
+            self._state_entered.pop(instance_id, None)
+            self._instance_state_seconds.pop(instance_id, None)
+
+    def record_acquire(
+        self, expert_id: str, wait_seconds: float, reused: Optional[bool]
+    ) -> None:
+        """
+        Record acquire_expert outcome.
+
+        Args:
+            expert_id: Expert type
+            wait_seconds: Time from call to instance (or failure)
+            reused: True = existing instance, False = created, None = failed
+        """
+        with self._lock:
+            self.acquire_wait.observe(wait_seconds)
+            record = self._expert(expert_id)
+            if reused is None:
+                record["failed"] += 1
+            elif reused:
+                record["reused"] += 1
+            else:
+                record["created"] += 1
+
+    def record_creation(self, seconds: float) -> None:
+        """Record instance creation latency."""
+        with self._lock:
+            self.creation_latency.observe(seconds)
+
+    def record_task(self, expert_id: str, seconds: float, success: bool) -> None:
+        """Record task execution duration."""
+        with self._lock:
+            record = self._expert(expert_id)
+            record["task_duration"].observe(seconds)
+            if not success:
+                record["task_failures"] += 1
+
+    def instance_state_seconds(self, instance_id: str) -> Dict[str, float]:
+        """Seconds spent per state by instance (including current state)."""
+        with self._lock:
+            totals = dict(self._instance_state_seconds.get(instance_id, {}))
+            current = self._state_entered.get(instance_id)
+            if current:
+                state, since = current
+                totals[state] = totals.get(state, 0.0) + time.monotonic() - since
+            return {state: round(seconds, 3) for state, seconds in totals.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get metrics snapshot.
+
+        Returns:
+            Dict with acquire wait / creation latency histograms,
+            time-in-state histograms and per-expert reuse and task durations
+        """
+        with self._lock:
+            per_expert = {}
+            for expert_id, record in self._per_expert.items():
+                served = record["reused"] + record["created"]
+                per_expert[expert_id] = {
+                    "reused": record["reused"],
+                    "created": record["created"],
+                    "failed": record["failed"],
+                    "reuse_ratio": record["reused"] / served if served else 0.0,
+                    "task_failures": record["task_failures"],
+                    "task_duration": record["task_duration"].snapshot(),
+                }
+
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "acquire_wait": self.acquire_wait.snapshot(),
+                "creation_latency": self.creation_latency.snapshot(),
+                "time_in_state": {
+                    state: histogram.snapshot()
+                    for state, histogram in self.time_in_state.items()
+                },
+                "per_expert": per_expert,
+            }
+
+    def render_prometheus(self, prefix: str = "agent_pool") -> str:
+        """
+        Render metrics in Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        typed = set()
+
+        def histogram(name: str, data: Dict[str, Any], labels: str = "") -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+            sep = "," if labels else ""
+            for bound, count in data["buckets"].items():
+                lines.append(f'{prefix}_{name}_bucket{{{labels}{sep}le="{bound}"}} {count}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{prefix}_{name}_sum{suffix} {data['sum']}")
+            lines.append(f"{prefix}_{name}_count{suffix} {data['count']}")
+
+        histogram("acquire_wait_seconds", snapshot["acquire_wait"])
+        histogram("creation_latency_seconds", snapshot["creation_latency"])
+        for state, data in snapshot["time_in_state"].items():
+            histogram("time_in_state_seconds", data, f'state="{state}"')
+
+        lines.append(f"# TYPE {prefix}_acquisitions_total counter")
+        for expert_id, data in snapshot["per_expert"].items():
+            for outcome in ("reused", "created", "failed"):
+                lines.append(
+                    f'{prefix}_acquisitions_total{{expert="{expert_id}",outcome="{outcome}"}} '
+                    f"{data[outcome]}"
+                )
+        for expert_id, data in snapshot["per_expert"].items():
+            histogram("task_duration_seconds", data["task_duration"], f'expert="{expert_id}"')
+
+        return "\n".join(lines) + "\n"
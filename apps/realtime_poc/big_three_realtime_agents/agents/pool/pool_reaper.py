@@ -0,0 +1,117 @@
+"""
+Pool Reaper - Periodic reclamation of agent pool memory.
+
+Runs ``AgentPoolManager.reap`` on an interval so terminated instances are
+dropped, idle TTLs are enforced and pool memory stays under a cap without
+anyone having to call cleanup explicitly.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from .agent_pool import AgentPoolManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolReaper:
+    """
+    Background reaper for AgentPoolManager.
+
+    Example:
+        >>> reaper = PoolReaper(pool_manager, idle_ttl_seconds=1800)
+        >>> reaper.start()              # background loop on running event loop
+        >>> reaper.run_once()           # or reap synchronously
+        {'idle_expired': 2, 'memory_evicted': 0, 'terminated_removed': 3, ...}
+    """
+
+    def __init__(
+        self,
+        pool_manager: AgentPoolManager,
+        interval_seconds: float = 60.0,
+        idle_ttl_seconds: Optional[float] = 1800.0,
+        max_pool_bytes: Optional[int] = None,
+        logger_instance=None,
+    ):
+        """
+        Initialize pool reaper.
+
+        Args:
+            pool_manager: Agent pool manager instance
+            interval_seconds: Seconds between reaps
+            idle_ttl_seconds: Terminate instances idle longer than this (None = never)
+            max_pool_bytes: Memory cap for live instance context/history (None = no cap)
+            logger_instance: Logger instance
+        """
+        self.pool_manager = pool_manager
+        self.interval_seconds = interval_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_pool_bytes = max_pool_bytes
+        self.logger = logger_instance or logger
+
+        self.runs = 0
+        self.last_result: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Reap pool once.
+
+        Returns:
+            Counts reclaimed by this run
+        """
+        self.last_result = self.pool_manager.reap(
+            max_idle_time_seconds=self.idle_ttl_seconds,
+            max_pool_bytes=self.max_pool_bytes,
+        )
+        self.runs += 1
+        return self.last_result
+
+    async def run(self) -> None:
+        """Reap every ``interval_seconds`` until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                self.run_once()
+            except Exception as exc:
+                self.logger.warning(f"Pool reap failed: {exc}")
+
+    def start(self) -> bool:
+        """
+        Start background loop on the running event loop.
+
+        Returns:
+            True if started (False without a running loop or if already running)
+        """
+        if self._task and not self._task.done():
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop, pool reaper not started")
+            return False
+
+        self._task = loop.create_task(self.run())
+        self.logger.info(f"Pool reaper started (every {self.interval_seconds}s)")
+        return True
+
+    def stop(self) -> None:
+        """Cancel background loop."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reaper statistics (totals come from the pool)."""
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "runs": self.runs,
+            "interval_seconds": self.interval_seconds,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "max_pool_bytes": self.max_pool_bytes,
+            "last_result": dict(self.last_result),
+            "reclaimed_total": self.pool_manager.get_stats()["reclaimed"],
+        }
@@ -0,0 +1,149 @@
+"""
+Pool Snapshot - Persist and restore agent pool state across restarts.
+
+Periodically writes live instances (session id, task history, bounded
+context) to a JSON file in the storage directory, and loads it on startup
+so returning users get their warm expert sessions back. Restore is lazy:
+instances stay dormant until an acquire or lookup needs them.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .agent_pool import AgentPoolManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolSnapshotter:
+    """
+    Snapshot writer/loader for AgentPoolManager.
+
+    Example:
+        >>> snapshots = PoolSnapshotter(pool_manager, storage_dir / "pool" / "pool_state.json")
+        >>> snapshots.load()            # on startup (lazy restore)
+        3
+        >>> snapshots.start()           # periodic saves on running event loop
+        >>> snapshots.save()            # on shutdown
+        5
+    """
+
+    def __init__(
+        self,
+        pool_manager: AgentPoolManager,
+        path: Path,
+        interval_seconds: float = 300.0,
+        max_age_seconds: Optional[float] = 86400.0,
+        logger_instance=None,
+    ):
+        """
+        Initialize pool snapshotter.
+
+        Args:
+            pool_manager: Agent pool manager instance
+            path: Snapshot file path
+            interval_seconds: Seconds between periodic saves
+            max_age_seconds: Instances unused for longer are not restored (None = all)
+            logger_instance: Logger instance
+        """
+        self.pool_manager = pool_manager
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self.max_age_seconds = max_age_seconds
+        self.logger = logger_instance or logger
+
+        self.saves = 0
+        self.last_saved_instances = 0
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def save(self) -> int:
+        """
+        Write snapshot atomically (temp file + rename).
+
+        Returns:
+            Number of instances saved (-1 on failure)
+        """
+        state = self.pool_manager.export_state()
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except Exception as exc:
+            self.last_error = str(exc)
+            self.logger.error(f"Failed to save pool snapshot: {exc}")
+            return -1
+
+        self.saves += 1
+        self.last_saved_instances = len(state["instances"])
+        self.last_error = None
+        self.logger.debug(f"Saved pool snapshot ({self.last_saved_instances} instances)")
+        return self.last_saved_instances
+
+    def load(self) -> int:
+        """
+        Load snapshot into the pool for lazy restore.
+
+        Returns:
+            Number of instances available for revival
+        """
+        if not self.path.exists():
+            return 0
+
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            self.last_error = str(exc)
+            self.logger.error(f"Failed to load pool snapshot: {exc}")
+            return 0
+
+        return self.pool_manager.import_state(state, max_age_seconds=self.max_age_seconds)
+
+    async def run(self) -> None:
+        """Save every ``interval_seconds`` until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.save()
+
+    def start(self) -> bool:
+        """
+        Start periodic saves on the running event loop.
+
+        Returns:
+            True if started (False without a running loop or if already running)
+        """
+        if self._task and not self._task.done():
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop, pool snapshots not started")
+            return False
+
+        self._task = loop.create_task(self.run())
+        self.logger.info(f"Pool snapshots started (every {self.interval_seconds}s)")
+        return True
+
+    def stop(self) -> None:
+        """Cancel periodic saves."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics."""
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "path": str(self.path),
+            "saves": self.saves,
+            "last_saved_instances": self.last_saved_instances,
+            "last_error": self.last_error,
+            "restored": self.pool_manager.get_stats()["restored"],
+        }
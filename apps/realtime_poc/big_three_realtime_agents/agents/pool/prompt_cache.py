@@ -0,0 +1,177 @@
+"""
+Prompt Cache - Pre-rendered expert system prompts.
+
+Reads each expert's system prompt file once and re-reads it only when the
+file's mtime changes. Rendered prompts are immutable ``ExpertPrompt``
+objects shared by every instance and task of an expert.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from .agent_pool import ExpertDefinition
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExpertPrompt:
+    """Rendered system prompt of an expert."""
+    expert_id: str
+    path: str
+    mtime_ns: Optional[int]       # None when rendered from the fallback
+    text: str                     # Interned prompt text
+    prefix: str                   # Text plus separator, prepended to tasks
+
+    def apply(self, task: str) -> str:
+        """Prompt followed by task."""
+        return self.prefix + task
+
+
+class PromptCache:
+    """
+    Expert prompt cache keyed by path and mtime.
+
+    Files are re-checked with ``os.stat`` at most every
+    ``revalidate_seconds`` per expert, so the hot path normally does no
+    file system access at all.
+
+    Example:
+        >>> cache = PromptCache()
+        >>> prompt = cache.get(expert_def)
+        >>> full_task = prompt.apply(task)
+    """
+
+    def __init__(self, revalidate_seconds: float = 2.0):
+        """
+        Initialize prompt cache.
+
+        Args:
+            revalidate_seconds: Minimum interval between mtime checks per expert
+        """
+        self.revalidate_seconds = revalidate_seconds
+
+        self._prompts: Dict[str, ExpertPrompt] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.loads = 0
+
+    @staticmethod
+    def _fallback_text(expert: ExpertDefinition) -> str:
+        """Prompt used when the template file is missing."""
+        return f"You are {expert.name}. {expert.description}"
+
+    @staticmethod
+    def _stat(path: str) -> Optional[int]:
+        """File mtime in ns, or None if missing."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, expert: ExpertDefinition) -> ExpertPrompt:
+        """
+        Rendered prompt for expert.
+
+        Args:
+            expert: Expert definition
+
+        Returns:
+            Cached ExpertPrompt (re-rendered if the file changed)
+        """
+        expert_id = expert.expert_id
+        path = expert.system_prompt_template
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._prompts.get(expert_id)
+            if (
+                cached is not None
+                and cached.path == path
+                and now - self._checked_at.get(expert_id, 0.0) < self.revalidate_seconds
+            ):
+                self.hits += 1
+                return cached
+
+        mtime_ns = self._stat(path)
+
+        with self._lock:
+            cached = self._prompts.get(expert_id)
+            self._checked_at[expert_id] = now
+            if cached is not None and cached.path == path and cached.mtime_ns == mtime_ns:
+                self.hits += 1
+                return cached
+
+        prompt = self._render(expert, mtime_ns)
+
+        with self._lock:
+            self._prompts[expert_id] = prompt
+            self.loads += 1
+        return prompt
+
+    def _render(self, expert: ExpertDefinition, mtime_ns: Optional[int]) -> ExpertPrompt:
+        """Read and render prompt file."""
+        text = None
+        if mtime_ns is not None:
+            try:
+                with open(expert.system_prompt_template, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except OSError as exc:
+                logger.warning(f"Failed to read prompt for {expert.expert_id}: {exc}")
+                mtime_ns = None
+
+        if text is None:
+            text = self._fallback_text(expert)
+
+        text = sys.intern(text)
+        return ExpertPrompt(
+            expert_id=expert.expert_id,
+            path=expert.system_prompt_template,
+            mtime_ns=mtime_ns,
+            text=text,
+            prefix=sys.intern(f"{text}\n\n"),
+        )
+
+    def preload(self, experts: Dict[str, ExpertDefinition]) -> int:
+        """
+        Render prompts for all experts up front.
+
+        Args:
+            experts: Expert definitions keyed by expert_id
+
+        Returns:
+            Number of prompts cached
+        """
+        for expert in experts.values():
+            self.get(expert)
+        return len(self._prompts)
+
+    def invalidate(self, expert_id: Optional[str] = None) -> None:
+        """Drop one cached prompt (or all)."""
+        with self._lock:
+            if expert_id is None:
+                self._prompts.clear()
+                self._checked_at.clear()
+            else:
+                self._prompts.pop(expert_id, None)
+                self._checked_at.pop(expert_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.loads
+            return {
+                "prompts": len(self._prompts),
+                "bytes": sum(len(p.text.encode("utf-8")) for p in self._prompts.values()),
+                "hits": self.hits,
+                "loads": self.loads,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,178 @@
+"""
+Selection Cache - Memoized expert selection keyed by normalized task.
+
+Near-identical task phrasings ("Build the REST API" / "build a rest api")
+share one fingerprint, so repeated selections skip scoring, embedding
+lookups and history analysis.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "be", "this",
+    "that", "it", "please", "can", "you", "me", "my", "our", "we", "i",
+})
+
+
+def task_tokens(text: str) -> FrozenSet[str]:
+    """Lowercased content tokens of text (stop words and punctuation dropped)."""
+    return frozenset(
+        token for token in _WORD_PATTERN.findall(text.lower())
+        if token not in _STOP_WORDS
+    )
+
+
+def task_fingerprint(task: str) -> str:
+    """
+    Normalized fingerprint of a task description.
+
+    Lowercases, drops stop words and punctuation, sorts the remaining
+    tokens and hashes them.
+
+    Args:
+        task: Task description
+
+    Returns:
+        Hex digest identifying the normalized task
+    """
+    tokens = sorted(
+        token for token in _WORD_PATTERN.findall(task.lower())
+        if token not in _STOP_WORDS
+    )
+    return hashlib.sha1(" ".join(tokens).encode("utf-8")).hexdigest()[:20]
+
+
+class SelectionCache:
+    """
+    LRU + TTL cache for expert selection results.
+
+    Entries are tagged with a version token (e.g. catalog version); a
+    lookup with a different version clears the cache, so results never
+    outlive the catalog or statistics they were computed from.
+
+    Example:
+        >>> cache = SelectionCache(ttl_seconds=600, max_entries=1024)
+        >>> cache.put("Build REST API", "BackendExpert", version=3)
+        >>> cache.get("build a rest api", version=3)
+        'BackendExpert'
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 1024):
+        """
+        Initialize selection cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum cached selections (LRU eviction)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def _check_version(self, version: Optional[Hashable]) -> None:
+        """Clear entries when version token changed (lock held)."""
+        if version != self._version:
+            if self._entries:
+                self._invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, task: str, version: Optional[Hashable] = None) -> Optional[Any]:
+        """
+        Look up cached selection.
+
+        Args:
+            task: Task description
+            version: Version token the result must match
+
+        Returns:
+            Cached value or None
+        """
+        key = task_fingerprint(task)
+        now = time.monotonic()
+
+        with self._lock:
+            self._check_version(version)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, task: str, value: Any, version: Optional[Hashable] = None) -> None:
+        """
+        Cache selection result.
+
+        Args:
+            task: Task description
+            value: Selection result
+            version: Version token the result was computed against
+        """
+        key = task_fingerprint(task)
+
+        with self._lock:
+            self._check_version(version)
+
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop all cached selections."""
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+                self._entries.clear()
+
+        if reason:
+            logger.debug(f"Selection cache invalidated: {reason}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
@@ -0,0 +1,289 @@
+"""
+Inverted trigger index for expert scoring.
+
+Precomputes token/phrase -> expert postings from expert summaries so
+that scoring a task only touches experts sharing vocabulary with it.
+Matching keeps the substring semantics of the original heuristic:
+a trigger word "matches" when it occurs anywhere in the task text.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .expert_definition import ExpertDefinition
+
+logger = logging.getLogger(__name__)
+
+# Scoring weights (shared with IntelligentAgentSelector heuristics)
+TRIGGER_PHRASE_WEIGHT = 3.0
+TRIGGER_WORD_WEIGHT = 1.0
+DESCRIPTION_TOKEN_WEIGHT = 0.5
+CATEGORY_WEIGHT = 1.0
+FOCUS_AREA_WEIGHT = 2.0
+CONTEXT_TRIGGER_WEIGHT = 1.0
+
+
+class TriggerIndex:
+    """
+    Inverted index over expert triggers, focus areas, categories and
+    description tokens.
+
+    Every distinct phrase (trigger, focus area or category) is stored once
+    and anchored at its longest word. A task is scanned by looking up the
+    substrings of its whitespace tokens in the word vocabulary; matched
+    anchors yield candidate phrases, which are then verified with a
+    single substring check. Description overlap uses exact token postings.
+
+    Postings hold catalog positions repeated once per half point of
+    weight, so a task is scored with C-level ``Counter.update`` calls and
+    the sums stay exact (all weights are multiples of 0.5).
+
+    Example:
+        >>> index = TriggerIndex(expert_definitions)
+        >>> index.top("Design a REST API with caching", n=3)
+        [('backend-architect', 9.5), ...]
+    """
+
+    def __init__(self, experts: Dict[str, ExpertDefinition]):
+        """
+        Build index.
+
+        Args:
+            experts: Expert definitions keyed by agent ID
+        """
+        self.agent_ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+
+        self._patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+        self._triggers: List[List[int]] = []
+        self._areas: List[List[int]] = []
+        self._categories: List[List[int]] = []
+
+        # Weighted postings (position repeated per half point)
+        self._phrase_postings: List[List[int]] = []
+        self._word_postings: List[List[int]] = []
+        self._context_postings: List[List[int]] = []
+
+        self._anchors: Dict[str, List[int]] = defaultdict(list)
+        self._word_triggers: Dict[str, Set[int]] = defaultdict(set)
+        self._unanchored: List[int] = []
+        self._desc_tokens: Dict[str, List[int]] = defaultdict(list)
+        self._word_lengths: List[int] = []
+
+        self._build(experts)
+
+    def _build(self, experts: Dict[str, ExpertDefinition]) -> None:
+        """Populate postings from expert summaries."""
+        for position, (agent_id, expert) in enumerate(experts.items()):
+            self.agent_ids.append(agent_id)
+            self.positions[agent_id] = position
+
+            for trigger in expert.triggers:
+                pattern_id = self._add_pattern(trigger.lower())
+                self._triggers[pattern_id].append(position)
+                for word in trigger.lower().split():
+                    self._word_triggers[word].add(pattern_id)
+
+            for area in expert.focus_areas:
+                pattern_id = self._add_pattern(area.lower())
+                self._areas[pattern_id].append(position)
+
+            pattern_id = self._add_pattern(expert.category.lower())
+            self._categories[pattern_id].append(position)
+
+            for token in set(expert.description.lower().split()):
+                self._desc_tokens[token].append(position)
+
+        for triggers, areas, categories in zip(
+            self._triggers, self._areas, self._categories
+        ):
+            self._phrase_postings.append(
+                triggers * _half_points(TRIGGER_PHRASE_WEIGHT)
+                + areas * _half_points(FOCUS_AREA_WEIGHT)
+                + categories * _half_points(CATEGORY_WEIGHT)
+            )
+            self._word_postings.append(triggers * _half_points(TRIGGER_WORD_WEIGHT))
+            self._context_postings.append(
+                triggers * _half_points(CONTEXT_TRIGGER_WEIGHT)
+            )
+
+        for token, postings in self._desc_tokens.items():
+            self._desc_tokens[token] = postings * _half_points(DESCRIPTION_TOKEN_WEIGHT)
+
+        vocabulary = set(self._anchors) | set(self._word_triggers)
+        self._word_lengths = sorted({len(word) for word in vocabulary})
+
+        logger.info(
+            f"Built trigger index: {len(self.positions)} experts, "
+            f"{len(self._patterns)} phrases, {len(vocabulary)} words"
+        )
+
+    def _add_pattern(self, pattern: str) -> int:
+        """Register distinct phrase and return its ID."""
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is not None:
+            return pattern_id
+
+        pattern_id = len(self._patterns)
+        self._pattern_ids[pattern] = pattern_id
+        self._patterns.append(pattern)
+        self._triggers.append([])
+        self._areas.append([])
+        self._categories.append([])
+
+        words = pattern.split()
+        if words:
+            self._anchors[max(words, key=len)].append(pattern_id)
+        else:
+            # Empty/whitespace phrases are contained in any text
+            self._unanchored.append(pattern_id)
+
+        return pattern_id
+
+    def _matched_words(self, text_lower: str) -> Set[str]:
+        """Vocabulary words occurring as substrings of text."""
+        matched = set()
+        if not self._word_lengths:
+            return matched
+
+        anchors = self._anchors
+        word_triggers = self._word_triggers
+        lengths = self._word_lengths
+
+        for token in set(text_lower.split()):
+            token_len = len(token)
+            for start in range(token_len):
+                remaining = token_len - start
+                for length in lengths:
+                    if length > remaining:
+                        break
+                    sub = token[start:start + length]
+                    if sub in anchors or sub in word_triggers:
+                        matched.add(sub)
+
+        return matched
+
+    def _matched_patterns(self, text_lower: str, words: Set[str]) -> Set[int]:
+        """Phrase IDs contained in text (anchor lookup + verification)."""
+        matched = set()
+        for word in words:
+            for pattern_id in self._anchors.get(word, ()):
+                if self._patterns[pattern_id] in text_lower:
+                    matched.add(pattern_id)
+        for pattern_id in self._unanchored:
+            if self._patterns[pattern_id] in text_lower:
+                matched.add(pattern_id)
+        return matched
+
+    def _accumulate(self, task: str, context: Optional[str]) -> Counter:
+        """Half points per catalog position for experts touched by task."""
+        half_points: Counter = Counter()
+        task_lower = task.lower()
+
+        words = self._matched_words(task_lower)
+        phrase_hits = self._matched_patterns(task_lower, words)
+
+        # Trigger phrases, focus areas and categories contained in task
+        for pattern_id in phrase_hits:
+            half_points.update(self._phrase_postings[pattern_id])
+
+        # Triggers with at least one word in task (phrase not contained)
+        word_hits = set()
+        for word in words:
+            word_hits.update(self._word_triggers.get(word, ()))
+        for pattern_id in word_hits - phrase_hits:
+            half_points.update(self._word_postings[pattern_id])
+
+        # Description token overlap
+        for token in set(task_lower.split()):
+            half_points.update(self._desc_tokens.get(token, ()))
+
+        # Trigger phrases contained in context
+        if context:
+            context_lower = context.lower()
+            context_hits = self._matched_patterns(
+                context_lower, self._matched_words(context_lower)
+            )
+            for pattern_id in context_hits:
+                half_points.update(self._context_postings[pattern_id])
+
+        return half_points
+
+    def score(self, task: str, context: Optional[str] = None) -> Dict[str, float]:
+        """
+        Score experts sharing vocabulary with the task.
+
+        Args:
+            task: Task description
+            context: Optional additional context
+
+        Returns:
+            Dict of agent ID -> score for experts with a non-zero score;
+            experts not present scored 0
+        """
+        half_points = self._accumulate(task, context)
+        return {
+            self.agent_ids[position]: count * 0.5
+            for position, count in half_points.items()
+        }
+
+    def top(
+        self,
+        task: str,
+        n: int = 1,
+        context: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Best scoring experts, ties broken by catalog order.
+
+        Walks score levels from the highest down, so only the levels
+        needed to fill ``n`` slots are scanned and sorted.
+
+        Args:
+            task: Task description
+            n: Number of experts to return
+            context: Optional additional context
+
+        Returns:
+            List of (agent_id, score), best first (non-zero scores only)
+        """
+        half_points = self._accumulate(task, context)
+        if not half_points or n <= 0:
+            return []
+
+        if n == 1:
+            best = max(half_points.values())
+            position = min(p for p, c in half_points.items() if c == best)
+            return [(self.agent_ids[position], best * 0.5)]
+
+        selected: List[Tuple[str, float]] = []
+        for level in sorted(set(half_points.values()), reverse=True):
+            positions = sorted(p for p, c in half_points.items() if c == level)
+            for position in positions[:n - len(selected)]:
+                selected.append((self.agent_ids[position], level * 0.5))
+            if len(selected) >= n:
+                break
+
+        return selected
+
+    def rank(self, scores: Dict[str, float]) -> List[str]:
+        """
+        Rank scored experts by score, ties broken by catalog order.
+
+        Args:
+            scores: Sparse scores from ``score``
+
+        Returns:
+            Agent IDs, best first
+        """
+        return sorted(
+            scores,
+            key=lambda agent_id: (-scores[agent_id], self.positions.get(agent_id, 0))
+        )
+
+
+def _half_points(weight: float) -> int:
+    """Convert score weight to posting repetitions."""
+    return int(weight * 2)
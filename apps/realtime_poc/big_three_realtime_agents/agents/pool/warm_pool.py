@@ -0,0 +1,236 @@
+"""
+Warm Pool Controller - Predictive pre-warming of expert instances.
+
+Forecasts per-expert demand from recent acquisition rates (pool counters,
+seeded from OutcomeTracker history) with an exponentially weighted moving
+average, and keeps enough idle instances of hot experts that acquisitions
+do not pay instance creation on the critical path.
+"""
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from .agent_pool import AgentPoolManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class WarmPoolController:
+    """
+    Keep N idle instances per hot expert.
+
+    Every ``interval_seconds`` the controller reads how many acquisitions
+    each expert saw since the last tick, updates an EWMA forecast of
+    acquisitions per interval and tops idle instances up to
+    ``ceil(forecast)`` (bounded per expert, by ``max_instances`` and by a
+    global cap shared by the hottest experts first). Surplus idle
+    instances are left to ``cleanup_idle_instances``.
+
+    Example:
+        >>> controller = WarmPoolController(pool_manager, learning.tracker)
+        >>> controller.start()          # background loop on running event loop
+        >>> await controller.tick()     # or drive it manually
+        >>> controller.get_stats()["warm_hit_ratio"]
+        0.83
+    """
+
+    def __init__(
+        self,
+        pool_manager: AgentPoolManager,
+        outcome_tracker=None,
+        interval_seconds: float = 30.0,
+        alpha: float = 0.3,
+        max_warm_total: int = 8,
+        max_warm_per_expert: int = 2,
+        min_forecast: float = 0.5,
+        history_window_minutes: int = 60,
+        logger_instance=None,
+    ):
+        """
+        Initialize warm pool controller.
+
+        Args:
+            pool_manager: Agent pool manager instance
+            outcome_tracker: Optional OutcomeTracker used to seed forecasts
+            interval_seconds: Seconds between controller ticks
+            alpha: EWMA smoothing factor (weight of the newest interval)
+            max_warm_total: Global cap on idle instances kept warm
+            max_warm_per_expert: Cap on idle instances per expert
+            min_forecast: Experts forecast below this stay cold
+            history_window_minutes: OutcomeTracker history used for seeding
+            logger_instance: Logger instance
+        """
+        self.pool_manager = pool_manager
+        self.outcome_tracker = outcome_tracker
+        self.interval_seconds = interval_seconds
+        self.alpha = alpha
+        self.max_warm_total = max_warm_total
+        self.max_warm_per_expert = max_warm_per_expert
+        self.min_forecast = min_forecast
+        self.history_window_minutes = history_window_minutes
+        self.logger = logger_instance or logger
+
+        self.forecasts: Dict[str, float] = {}
+        self._last_counts: Dict[str, int] = {}
+        self._seeded = False
+        self._task: Optional[asyncio.Task] = None
+
+        self.ticks = 0
+        self.instances_warmed = 0
+
+    def _seed_from_history(self) -> None:
+        """Initialize forecasts from recent OutcomeTracker outcomes."""
+        self._seeded = True
+        self._last_counts = self.pool_manager.get_acquisition_counts()
+
+        if not self.outcome_tracker:
+            return
+
+        cutoff = datetime.now() - timedelta(minutes=self.history_window_minutes)
+        counts: Dict[str, int] = {}
+        for outcome in self.outcome_tracker.get_recent_outcomes(limit=1000):
+            agent_id = outcome.get("agent_id")
+            if agent_id not in self.pool_manager.expert_definitions:
+                continue
+            try:
+                if datetime.fromisoformat(outcome.get("timestamp", "")) < cutoff:
+                    continue
+            except ValueError:
+                continue
+            counts[agent_id] = counts.get(agent_id, 0) + 1
+
+        intervals = max(1.0, self.history_window_minutes * 60 / self.interval_seconds)
+        for expert_id, count in counts.items():
+            self.forecasts[expert_id] = count / intervals
+
+        if counts:
+            self.logger.info(f"Warm pool seeded from history for {len(counts)} experts")
+
+    def update_forecasts(self) -> Dict[str, float]:
+        """
+        Fold acquisitions since the last tick into the EWMA forecasts.
+
+        Returns:
+            Forecast acquisitions per interval by expert_id
+        """
+        if not self._seeded:
+            self._seed_from_history()
+            return dict(self.forecasts)
+
+        counts = self.pool_manager.get_acquisition_counts()
+        for expert_id in set(counts) | set(self.forecasts):
+            observed = counts.get(expert_id, 0) - self._last_counts.get(expert_id, 0)
+            previous = self.forecasts.get(expert_id, 0.0)
+            forecast = self.alpha * observed + (1 - self.alpha) * previous
+            if forecast < 0.01:
+                self.forecasts.pop(expert_id, None)
+            else:
+                self.forecasts[expert_id] = forecast
+
+        self._last_counts = counts
+        return dict(self.forecasts)
+
+    def warm_targets(self) -> Dict[str, int]:
+        """
+        Idle instances to keep per expert under the global cap.
+
+        Returns:
+            Target idle count by expert_id (hottest experts first)
+        """
+        targets: Dict[str, int] = {}
+        budget = self.max_warm_total
+
+        for expert_id, forecast in sorted(
+            self.forecasts.items(), key=lambda item: item[1], reverse=True
+        ):
+            if budget <= 0 or forecast < self.min_forecast:
+                break
+            if expert_id not in self.pool_manager.expert_definitions:
+                continue
+            target = min(math.ceil(forecast), self.max_warm_per_expert, budget)
+            targets[expert_id] = target
+            budget -= target
+
+        return targets
+
+    async def tick(self) -> Dict[str, int]:
+        """
+        Run one forecast + pre-warm step.
+
+        Returns:
+            Instances created by expert_id
+        """
+        self.ticks += 1
+        self.update_forecasts()
+
+        created: Dict[str, int] = {}
+        for expert_id, target in self.warm_targets().items():
+            missing = target - self.pool_manager.get_idle_count(expert_id)
+            if missing <= 0:
+                continue
+
+            warmed = await self.pool_manager.prewarm(expert_id, missing)
+            if warmed:
+                created[expert_id] = warmed
+                self.instances_warmed += warmed
+
+        if created:
+            self.logger.info(f"Pre-warmed instances: {created}")
+        return created
+
+    async def run(self) -> None:
+        """Tick every ``interval_seconds`` until cancelled."""
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.warning(f"Warm pool tick failed: {exc}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> bool:
+        """
+        Start background loop on the running event loop.
+
+        Returns:
+            True if started (False without a running loop or if already running)
+        """
+        if self._task and not self._task.done():
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.logger.debug("No running event loop, warm pool not started")
+            return False
+
+        self._task = loop.create_task(self.run())
+        self.logger.info(f"Warm pool controller started (every {self.interval_seconds}s)")
+        return True
+
+    def stop(self) -> None:
+        """Cancel background loop."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get controller statistics."""
+        acquisitions = self.pool_manager.get_stats()["acquisitions"]
+        hottest = sorted(self.forecasts.items(), key=lambda item: item[1], reverse=True)
+
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "ticks": self.ticks,
+            "instances_warmed": self.instances_warmed,
+            "warm_hit_ratio": acquisitions["warm_hit_ratio"],
+            "warm_hits": acquisitions["warm_hits"],
+            "cold_starts": acquisitions["cold_starts"],
+            "targets": self.warm_targets(),
+            "forecasts": {expert_id: round(f, 3) for expert_id, f in hottest[:10]},
+        }
@@ -144,9 +144,73 @@ AGENT_POOL_DIR = BASE_DIR.parent.parent / "agentpool"
 MAX_INSTANCES_PER_EXPERT = int(os.environ.get("MAX_INSTANCES_PER_EXPERT", "3"))
 AGENT_IDLE_TIMEOUT_MINUTES = int(os.environ.get("AGENT_IDLE_TIMEOUT_MINUTES", "30"))
 
+# Per-instance context carried between tasks
+INSTANCE_CONTEXT_MAX_ENTRIES = int(os.environ.get("INSTANCE_CONTEXT_MAX_ENTRIES", "8"))
+INSTANCE_CONTEXT_TOKEN_BUDGET = int(os.environ.get("INSTANCE_CONTEXT_TOKEN_BUDGET", "2000"))
+
+# Context-affinity routing of tasks to idle instances
+POOL_AFFINITY_ROUTING = os.environ.get("POOL_AFFINITY_ROUTING", "true").lower() == "true"
+POOL_AFFINITY_MIN_SCORE = float(os.environ.get("POOL_AFFINITY_MIN_SCORE", "0.2"))
+
+# Background pool reaper (idle TTL is AGENT_IDLE_TIMEOUT_MINUTES; memory cap 0 = unlimited)
+POOL_REAPER_INTERVAL_SECONDS = float(os.environ.get("POOL_REAPER_INTERVAL_SECONDS", "60"))
+POOL_MAX_MEMORY_MB = float(os.environ.get("POOL_MAX_MEMORY_MB", "64"))
+
+# Pool state snapshots (warm sessions survive restarts)
+ENABLE_POOL_SNAPSHOTS = os.environ.get("ENABLE_POOL_SNAPSHOTS", "true").lower() == "true"
+POOL_SNAPSHOT_INTERVAL_SECONDS = float(os.environ.get("POOL_SNAPSHOT_INTERVAL_SECONDS", "300"))
+POOL_SNAPSHOT_MAX_AGE_HOURS = float(os.environ.get("POOL_SNAPSHOT_MAX_AGE_HOURS", "24"))
+
+# Fair scheduling of pool task execution (0 = unlimited)
+POOL_MAX_IN_FLIGHT = int(os.environ.get("POOL_MAX_IN_FLIGHT", "16"))
+POOL_MAX_IN_FLIGHT_PER_CALLER = int(os.environ.get("POOL_MAX_IN_FLIGHT_PER_CALLER", "8"))
+
+# Semantic expert selection
+ENABLE_SEMANTIC_SELECTION = os.environ.get("ENABLE_SEMANTIC_SELECTION", "true").lower() == "true"
+EXPERT_EMBEDDING_MODEL = os.environ.get("EXPERT_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EXPERT_RERANK_MARGIN = float(os.environ.get("EXPERT_RERANK_MARGIN", "0.05"))
+
+# Expert selection memoization
+SELECTION_CACHE_TTL_SECONDS = float(os.environ.get("SELECTION_CACHE_TTL_SECONDS", "600"))
+SELECTION_CACHE_MAX_ENTRIES = int(os.environ.get("SELECTION_CACHE_MAX_ENTRIES", "1024"))
+
+# Predictive pre-warming of pool instances
+ENABLE_POOL_PREWARM = os.environ.get("ENABLE_POOL_PREWARM", "true").lower() == "true"
+POOL_PREWARM_INTERVAL_SECONDS = float(os.environ.get("POOL_PREWARM_INTERVAL_SECONDS", "30"))
+POOL_PREWARM_ALPHA = float(os.environ.get("POOL_PREWARM_ALPHA", "0.3"))
+POOL_PREWARM_MAX_TOTAL = int(os.environ.get("POOL_PREWARM_MAX_TOTAL", "8"))
+POOL_PREWARM_MAX_PER_EXPERT = int(os.environ.get("POOL_PREWARM_MAX_PER_EXPERT", "2"))
+
+# Workflow task concurrency limits (0 = unlimited)
+WORKFLOW_MAX_CONCURRENT_TASKS = int(os.environ.get("WORKFLOW_MAX_CONCURRENT_TASKS", "8"))
+WORKFLOW_MAX_CONCURRENT_PER_AGENT = int(os.environ.get("WORKFLOW_MAX_CONCURRENT_PER_AGENT", "3"))
+WORKFLOW_MAX_CONCURRENT_PER_PROVIDER = int(os.environ.get("WORKFLOW_MAX_CONCURRENT_PER_PROVIDER", "0"))
+
+# Workflow task result memoization (opt-in per task)
+ENABLE_WORKFLOW_RESULT_CACHE = os.environ.get("ENABLE_WORKFLOW_RESULT_CACHE", "false").lower() == "true"
+WORKFLOW_RESULT_CACHE_TTL_SECONDS = float(os.environ.get("WORKFLOW_RESULT_CACHE_TTL_SECONDS", "3600"))
+WORKFLOW_RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("WORKFLOW_RESULT_CACHE_MAX_ENTRIES", "512"))
+
+# Hedged execution of slow idempotent workflow tasks
+ENABLE_WORKFLOW_HEDGING = os.environ.get("ENABLE_WORKFLOW_HEDGING", "false").lower() == "true"
+WORKFLOW_HEDGE_PERCENTILE = float(os.environ.get("WORKFLOW_HEDGE_PERCENTILE", "0.9"))
+WORKFLOW_HEDGE_BUDGET = float(os.environ.get("WORKFLOW_HEDGE_BUDGET", "0.1"))
+WORKFLOW_HEDGE_MIN_SAMPLES = int(os.environ.get("WORKFLOW_HEDGE_MIN_SAMPLES", "5"))
+
+# Retries of idempotent workflow tasks that exceed their deadline
+WORKFLOW_TIMEOUT_RETRIES = int(os.environ.get("WORKFLOW_TIMEOUT_RETRIES", "1"))
+
 # Storage for advanced systems
 STORAGE_BASE_DIR = AGENT_WORKING_DIRECTORY / "storage"
 
+# Multi-node pool coordination ("" = process-local, "sqlite", "redis")
+POOL_COORDINATION_BACKEND = os.environ.get("POOL_COORDINATION_BACKEND", "")
+POOL_COORDINATION_SQLITE_PATH = Path(
+    os.environ.get("POOL_COORDINATION_SQLITE_PATH", str(STORAGE_BASE_DIR / "pool" / "leases.db"))
+)
+POOL_COORDINATION_REDIS_URL = os.environ.get("POOL_COORDINATION_REDIS_URL", "redis://localhost:6379/0")
+POOL_NODE_ID = os.environ.get("POOL_NODE_ID", "")
+
 
 # ================================================================
 # Helper Functions
@@ -53,6 +53,12 @@ class AgentSessionError(AgentError):
     pass
 
 
+class PoolCapacityError(AgentCreationError):
+    """Expert reached max_instances across coordinated pool nodes."""
+
+    pass
+
+
 # ============================================================================
 # Workflow Errors
 # ============================================================================
@@ -239,6 +245,12 @@ class InstanceError(PoolError):
     pass
 
 
+class PoolCoordinationError(PoolError):
+    """Shared lease table stayed contended through every transaction retry."""
+
+    pass
+
+
 # ============================================================================
 # RAG Errors
 # ============================================================================
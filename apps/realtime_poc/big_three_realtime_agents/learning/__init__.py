@@ -9,6 +9,7 @@ Modules:
     outcome_tracker: Track success/failure patterns
     pattern_analyzer: Analyze and extract patterns
     recommender: Suggest approaches based on history
+    duration_estimator: Historical task duration quantiles
 
 Example:
     >>> from .learning_manager import LearningManager
@@ -20,9 +21,11 @@ Example:
 from .learning_manager import LearningManager
 from .outcome_tracker import OutcomeTracker
 from .pattern_analyzer import PatternAnalyzer
+from .duration_estimator import DurationEstimator
 
 __all__ = [
     "LearningManager",
     "OutcomeTracker",
     "PatternAnalyzer",
+    "DurationEstimator",
 ]
@@ -0,0 +1,201 @@
+"""
+Duration estimator - Historical task duration model.
+
+Learns how long tasks take per agent and per task type from recorded
+outcomes, past workflow executions and every newly completed task, and
+answers with p50/p90 quantiles for planning, scheduling and hedging.
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Task type keywords, checked in order (first match wins)
+_TASK_TYPES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("testing", ("test", "tests", "pytest", "coverage", "qa")),
+    ("review", ("review", "audit", "inspect", "critique")),
+    ("research", ("research", "investigate", "explore", "survey", "compare")),
+    ("design", ("design", "architect", "architecture", "plan", "schema")),
+    ("documentation", ("document", "documentation", "docs", "readme", "write-up")),
+    ("analysis", ("analyze", "analyse", "analysis", "assess", "evaluate", "profile")),
+    ("implementation", ("implement", "build", "create", "add", "fix", "refactor", "write", "code")),
+]
+
+_WORD_PATTERN = re.compile(r"[a-z][a-z\-]*")
+
+# Outcomes recorded for whole workflows, not single tasks
+_WORKFLOW_AGENT = "workflow"
+
+
+def task_type(description: str) -> str:
+    """
+    Coarse task type of a description (e.g. "review", "implementation").
+
+    Returns:
+        Task type, or "general" if no keyword matches
+    """
+    words = set(_WORD_PATTERN.findall(description.lower()))
+    for name, keywords in _TASK_TYPES:
+        if words.intersection(keywords):
+            return name
+    return "general"
+
+
+def _quantile(samples: Iterable[float], q: float) -> float:
+    """Nearest-rank quantile of non-empty samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class DurationEstimator:
+    """
+    Per-agent and per-task-type duration quantiles.
+
+    Lookups use the most specific history with enough samples:
+    agent + task type, agent, task type, all tasks, then the default.
+
+    Example:
+        >>> estimator = DurationEstimator(default_seconds=120, min_samples=1)
+        >>> estimator.load_outcomes(learning.tracker)
+        >>> estimator.record("python-expert", "Implement login endpoint", 95.0)
+        >>> estimator.quantiles("python-expert", "Implement logout endpoint")
+        {'p50': 95.0, 'p90': 95.0, 'samples': 1, 'source': 'agent_type'}
+    """
+
+    def __init__(
+        self,
+        default_seconds: float = 120.0,
+        min_samples: int = 3,
+        history: int = 200,
+    ):
+        """
+        Initialize duration estimator.
+
+        Args:
+            default_seconds: Estimate without any usable history
+            min_samples: Samples a bucket needs before it is trusted
+            history: Durations kept per bucket (most recent)
+        """
+        self.default_seconds = default_seconds
+        self.min_samples = min_samples
+        self.history = history
+        self._buckets: Dict[Tuple[str, str], Deque[float]] = {}
+        self.recorded = 0
+
+    def _add(self, key: Tuple[str, str], seconds: float) -> None:
+        """Append duration to bucket."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = deque(maxlen=self.history)
+        bucket.append(seconds)
+
+    def record(self, agent_id: str, description: str, seconds: float) -> None:
+        """
+        Learn from one completed task.
+
+        Args:
+            agent_id: Agent that ran the task
+            description: Task description
+            seconds: Measured duration
+        """
+        if seconds <= 0 or agent_id == _WORKFLOW_AGENT:
+            return
+
+        kind = task_type(description)
+        self._add(("agent_type", f"{agent_id}|{kind}"), seconds)
+        self._add(("agent", agent_id), seconds)
+        self._add(("type", kind), seconds)
+        self._add(("all", ""), seconds)
+        self.recorded += 1
+
+    def load_outcomes(self, tracker) -> int:
+        """
+        Seed from OutcomeTracker successes that carry a duration.
+
+        Returns:
+            Number of durations loaded
+        """
+        before = self.recorded
+        for outcome in tracker.get_recent_outcomes(limit=self.history * 10):
+            if outcome.get("status") == "success" and outcome.get("duration"):
+                self.record(outcome.get("agent_id", ""), outcome.get("task", ""), outcome["duration"])
+        return self.recorded - before
+
+    def load_executions(self, workflow_memory, limit: int = 100) -> int:
+        """
+        Seed from task durations of recent stored workflow executions.
+
+        Returns:
+            Number of durations loaded
+        """
+        before = self.recorded
+        for entry in workflow_memory.get_recent(limit=limit):
+            try:
+                execution = workflow_memory.get_execution(entry["execution_id"])
+            except Exception:
+                continue
+            for stage in (execution or {}).get("stage_results", []):
+                for result in stage.get("task_results", []):
+                    if result.get("status") == "completed" and result.get("duration_seconds"):
+                        self.record(
+                            result.get("agent_id", ""),
+                            result.get("description", ""),
+                            result["duration_seconds"],
+                        )
+        return self.recorded - before
+
+    def quantiles(self, agent_id: str = "", description: str = "") -> Dict[str, Any]:
+        """
+        Duration quantiles for a task.
+
+        Args:
+            agent_id: Agent that will run the task
+            description: Task description
+
+        Returns:
+            Dict with p50, p90, samples and source (the bucket used)
+        """
+        kind = task_type(description) if description else None
+        candidates = []
+        if agent_id and kind:
+            candidates.append(("agent_type", f"{agent_id}|{kind}"))
+        if agent_id:
+            candidates.append(("agent", agent_id))
+        if kind:
+            candidates.append(("type", kind))
+        candidates.append(("all", ""))
+
+        for key in candidates:
+            bucket = self._buckets.get(key)
+            if bucket and len(bucket) >= self.min_samples:
+                return {
+                    "p50": _quantile(bucket, 0.5),
+                    "p90": _quantile(bucket, 0.9),
+                    "samples": len(bucket),
+                    "source": key[0],
+                }
+
+        return {
+            "p50": self.default_seconds,
+            "p90": self.default_seconds,
+            "samples": 0,
+            "source": "default",
+        }
+
+    def estimate(self, agent_id: str = "", description: str = "", quantile: str = "p50") -> float:
+        """Estimated duration in seconds ("p50" or "p90")."""
+        return self.quantiles(agent_id, description)[quantile]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get estimator statistics."""
+        overall = self._buckets.get(("all", ""))
+        return {
+            "recorded": self.recorded,
+            "agents": sum(1 for kind, _ in self._buckets if kind == "agent"),
+            "task_types": sum(1 for kind, _ in self._buckets if kind == "type"),
+            "overall": self.quantiles() if overall else None,
+        }
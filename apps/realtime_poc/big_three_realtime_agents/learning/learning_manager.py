@@ -11,6 +11,7 @@ from pathlib import Path
 
 from .outcome_tracker import OutcomeTracker
 from .pattern_analyzer import PatternAnalyzer
+from ..agents.pool.selection_cache import SelectionCache
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,9 @@ class LearningManager:
         self.tracker = OutcomeTracker(self.storage_dir)
         self.analyzer = PatternAnalyzer(self.tracker)
 
+        # Memoized suggest_agent_for_task results, reset when outcomes change
+        self.suggestion_cache = SelectionCache()
+
         self.logger = logger
         self.logger.info("Learning manager initialized")
 
@@ -119,10 +123,11 @@ class LearningManager:
         patterns = self.analyzer.analyze_agent_task_patterns()
 
         return {
-            "total_outcomes": len(self.tracker._outcomes),
+            "total_outcomes": self.tracker.outcome_count,
             "agents_tracked": len(patterns["agent_success_rates"]),
             "top_keywords": patterns["task_keywords"].most_common(10),
             "agent_performance": patterns["agent_success_rates"],
+            "suggestion_cache": self.suggestion_cache.get_stats(),
         }
 
     def suggest_agent_for_task(
@@ -135,11 +140,30 @@ class LearningManager:
 
         Args:
             task: Task description
-            pool_selector: IntelligentAgentSelector instance
+            pool_selector: ExpertSelector (or IntelligentAgentSelector) instance
 
         Returns:
             Recommended agent ID
         """
+        # Any new outcome or catalog change invalidates cached suggestions;
+        # a selector without a pool manager has a fixed catalog
+        pool_manager = getattr(pool_selector, "pool_manager", None)
+        version = (
+            self.tracker.outcome_count,
+            id(pool_selector),
+            getattr(pool_manager, "catalog_version", 0),
+        )
+        cached = self.suggestion_cache.get(task, version=version)
+        if cached:
+            return cached
+
+        suggestion = self._suggest_uncached(task, pool_selector)
+        if suggestion:
+            self.suggestion_cache.put(task, suggestion, version=version)
+        return suggestion
+
+    def _suggest_uncached(self, task: str, pool_selector) -> str:
+        """Combine historical and pool selection without memoization."""
         # Get historical recommendation
         best_from_history, confidence = self.analyzer.get_best_agent_for_task(task)
 
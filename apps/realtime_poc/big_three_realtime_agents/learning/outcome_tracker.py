@@ -104,6 +104,11 @@ class OutcomeTracker:
         """Get recent outcomes."""
         return self._outcomes[-limit:] if self._outcomes else []
 
+    @property
+    def outcome_count(self) -> int:
+        """Number of recorded outcomes (grows with every record, usable as a version)."""
+        return len(self._outcomes)
+
     def get_success_rate(self, agent_id: Optional[str] = None) -> float:
         """
         Calculate success rate.
@@ -6,6 +6,7 @@ Stores workflow execution records for learning and debugging.
 
 import json
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -38,6 +39,7 @@ class WorkflowMemory:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._index_file = self.storage_dir / "index.json"
+        self._checkpoint_dir = self.storage_dir / "checkpoints"
         self._index: List[Dict[str, Any]] = self._load_index()
 
     def _sanitize_execution_id(self, execution_id: str) -> str:
@@ -157,6 +159,89 @@ class WorkflowMemory:
             logger.error(f"Failed to load execution {safe_id}: {exc}")
             return None
 
+    def _checkpoint_path(self, execution_id: str) -> Path:
+        """Validated checkpoint file path for execution."""
+        safe_id = self._sanitize_execution_id(execution_id)
+        checkpoint_file = self._checkpoint_dir / f"{safe_id}.json"
+
+        # Verify path (defense in depth)
+        try:
+            if not checkpoint_file.resolve().is_relative_to(self._checkpoint_dir.resolve()):
+                raise ValidationError(f"Path traversal attempt: {execution_id}")
+        except ValueError as e:
+            raise ValidationError(f"Invalid path: {execution_id}") from e
+
+        return checkpoint_file
+
+    def store_checkpoint(self, execution_id: str, checkpoint: Dict[str, Any]) -> None:
+        """
+        Store in-progress execution state (atomic replace).
+
+        Args:
+            execution_id: Execution identifier
+            checkpoint: Plan state and partial results
+
+        Raises:
+            ValidationError: If execution_id is invalid
+            MemoryStoreError: If storage operation fails
+        """
+        checkpoint_file = self._checkpoint_path(execution_id)
+        tmp_file = checkpoint_file.with_suffix(".json.tmp")
+
+        try:
+            self._checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(checkpoint, default=str))
+            os.replace(tmp_file, checkpoint_file)
+        except Exception as exc:
+            logger.error(f"Failed to store checkpoint {execution_id}: {exc}")
+            raise MemoryStoreError(f"Cannot store checkpoint: {exc}") from exc
+
+    def get_checkpoint(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve execution checkpoint.
+
+        Returns:
+            Checkpoint data or None if not found
+
+        Raises:
+            ValidationError: If execution_id is invalid
+        """
+        checkpoint_file = self._checkpoint_path(execution_id)
+        if not checkpoint_file.exists():
+            return None
+
+        try:
+            return json.loads(checkpoint_file.read_text())
+        except Exception as exc:
+            logger.error(f"Failed to load checkpoint {execution_id}: {exc}")
+            return None
+
+    def delete_checkpoint(self, execution_id: str) -> None:
+        """Remove checkpoint of a finished execution."""
+        self._checkpoint_path(execution_id).unlink(missing_ok=True)
+
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        """Resumable executions (most recently updated first)."""
+        if not self._checkpoint_dir.exists():
+            return []
+
+        checkpoints = []
+        for checkpoint_file in self._checkpoint_dir.glob("*.json"):
+            try:
+                data = json.loads(checkpoint_file.read_text())
+            except Exception:
+                continue
+            checkpoints.append({
+                "execution_id": checkpoint_file.stem,
+                "plan_id": data.get("plan", {}).get("plan_id"),
+                "goal": data.get("plan", {}).get("goal", "")[:100],
+                "status": data.get("status", "unknown"),
+                "updated_at": data.get("updated_at"),
+            })
+
+        checkpoints.sort(key=lambda c: c["updated_at"] or "", reverse=True)
+        return checkpoints
+
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent workflow executions."""
         return self._index[-limit:] if self._index else []
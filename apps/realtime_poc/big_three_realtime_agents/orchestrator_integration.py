@@ -7,18 +7,22 @@ OpenAI realtime orchestrator.
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .agents.pool.pool_integration import PoolIntegrationManager
 from .memory.memory_manager import MemoryManager
 from .workflow.workflow_planner import WorkflowPlanner
 from .workflow.execution_engine import ExecutionEngine
+from .workflow.result_cache import TaskResultCache
+from .workflow.hedging import HedgePolicy
 from .workflow.workflow_validator import WorkflowValidator
 from .workflow.workflow_reflector import WorkflowReflector
 from .agents.openai.tools_pool import PoolTools
 from .agents.openai.tools_workflow import WorkflowTools
 from .learning.learning_manager import LearningManager
+from .learning.duration_estimator import DurationEstimator
 from .security.security_manager import SecurityManager
+from .profiles.workflow_templates import WorkflowTemplateRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -60,21 +64,89 @@ class OrchestratorIntegration:
         self.pool_integration = PoolIntegrationManager(pool_dir, claude_coder)
         self.memory = MemoryManager(storage_dir=self.storage_dir / "memory")
 
+        # Initialize learning system
+        self.learning = LearningManager(
+            storage_dir=self.storage_dir / "learning"
+        )
+
+        # Task durations from past outcomes and executions; learns online
+        self.duration_estimator = DurationEstimator()
+        seeded = self.duration_estimator.load_outcomes(self.learning.tracker)
+        seeded += self.duration_estimator.load_executions(self.memory.workflow)
+        logger.info(f"Duration estimator seeded with {seeded} task durations")
+
         # Initialize workflow system
         self.workflow_planner = WorkflowPlanner(
             self.pool_integration.pool_manager,
-            self.memory
+            self.memory,
+            duration_estimator=self.duration_estimator,
+        )
+        from .config import (
+            AGENT_WORKING_DIRECTORY,
+            ENABLE_WORKFLOW_HEDGING,
+            ENABLE_WORKFLOW_RESULT_CACHE,
+            WORKFLOW_HEDGE_BUDGET,
+            WORKFLOW_HEDGE_MIN_SAMPLES,
+            WORKFLOW_HEDGE_PERCENTILE,
+            WORKFLOW_MAX_CONCURRENT_TASKS,
+            WORKFLOW_MAX_CONCURRENT_PER_AGENT,
+            WORKFLOW_MAX_CONCURRENT_PER_PROVIDER,
+            WORKFLOW_RESULT_CACHE_TTL_SECONDS,
+            WORKFLOW_RESULT_CACHE_MAX_ENTRIES,
+            WORKFLOW_TIMEOUT_RETRIES,
+        )
+
+        # Working-tree state is part of every cache key; our own storage is not
+        self.result_cache = (
+            TaskResultCache(
+                ttl_seconds=WORKFLOW_RESULT_CACHE_TTL_SECONDS,
+                max_entries=WORKFLOW_RESULT_CACHE_MAX_ENTRIES,
+                file_root=AGENT_WORKING_DIRECTORY,
+                exclude_paths=[self.storage_dir],
+            )
+            if ENABLE_WORKFLOW_RESULT_CACHE
+            else None
+        )
+
+        self.hedge_policy = (
+            HedgePolicy(
+                percentile=WORKFLOW_HEDGE_PERCENTILE,
+                min_samples=WORKFLOW_HEDGE_MIN_SAMPLES,
+                budget_fraction=WORKFLOW_HEDGE_BUDGET,
+                duration_estimator=self.duration_estimator,
+            )
+            if ENABLE_WORKFLOW_HEDGING
+            else None
         )
+
         self.execution_engine = ExecutionEngine(
             self.pool_integration,
-            self.memory
+            self.memory,
+            max_concurrent_tasks=WORKFLOW_MAX_CONCURRENT_TASKS,
+            max_concurrent_per_agent=WORKFLOW_MAX_CONCURRENT_PER_AGENT,
+            max_concurrent_per_provider=WORKFLOW_MAX_CONCURRENT_PER_PROVIDER,
+            result_cache=self.result_cache,
+            hedge_policy=self.hedge_policy,
+            timeout_retries=WORKFLOW_TIMEOUT_RETRIES,
+            duration_estimator=self.duration_estimator,
         )
         self.workflow_validator = WorkflowValidator()
         self.workflow_reflector = WorkflowReflector()
 
-        # Initialize learning system
-        self.learning = LearningManager(
-            storage_dir=self.storage_dir / "learning"
+        # Pre-warm hot experts from pool and outcome history
+        from .config import ENABLE_POOL_PREWARM, ENABLE_POOL_SNAPSHOTS
+
+        self.warm_pool = (
+            self.pool_integration.enable_prewarming(self.learning.tracker)
+            if ENABLE_POOL_PREWARM
+            else None
+        )
+
+        # Restore warm instances from the last run (revived lazily on use)
+        self.pool_snapshots = (
+            self.pool_integration.enable_snapshots(self.storage_dir / "pool" / "pool_state.json")
+            if ENABLE_POOL_SNAPSHOTS
+            else None
         )
 
         # Initialize security system
@@ -88,7 +160,8 @@ class OrchestratorIntegration:
         self.workflow_tools = WorkflowTools(
             self.workflow_planner,
             self.execution_engine,
-            self.memory
+            self.memory,
+            template_registry=WorkflowTemplateRegistry(),
         )
 
         self.logger = logger
@@ -114,6 +187,15 @@ class OrchestratorIntegration:
             # Get security stats
             security_stats = self.security.get_security_summary()
 
+            # Start background pool tasks when called from a running event loop
+            self.pool_integration.reaper.start()
+            if self.warm_pool:
+                self.warm_pool.start()
+            if self.pool_snapshots:
+                self.pool_snapshots.start()
+            if self.pool_integration.coordinator:
+                self.pool_integration.coordinator.start()
+
             self.logger.info(
                 f"Initialized: {expert_count} experts, "
                 f"{mem_stats['session_keys']} session keys, "
@@ -151,17 +233,30 @@ class OrchestratorIntegration:
             "list_expert_pool": self.pool_tools.list_expert_pool,
             "create_pool_agent": self.pool_tools.create_pool_agent,
             "get_pool_status": self.pool_tools.get_pool_status,
+            "get_pool_metrics": self.pool_tools.get_pool_metrics,
             "search_experts": self.pool_tools.search_experts,
 
             # Workflow tools
             "plan_simple_workflow": self.workflow_tools.plan_simple_workflow,
             "plan_multi_task_workflow": self.workflow_tools.plan_multi_task_workflow,
+            "plan_template_workflow": self.workflow_tools.plan_template_workflow,
             "execute_workflow": self.workflow_tools.execute_workflow,
+            "resume_workflow": self.workflow_tools.resume_workflow,
             "get_workflow_status": self.workflow_tools.get_workflow_status,
         }
 
     def shutdown(self) -> None:
         """Cleanup and shutdown all subsystems."""
+        self.pool_integration.reaper.stop()
+        if self.warm_pool:
+            self.warm_pool.stop()
+
+        # Persist warm instances before idle cleanup terminates them
+        if self.pool_snapshots:
+            self.pool_snapshots.stop()
+            saved = self.pool_snapshots.save()
+            self.logger.info(f"Saved {saved} agent instances to pool snapshot")
+
         # Cleanup idle instances
         cleaned = self.pool_integration.pool_manager.cleanup_idle_instances()
         self.logger.info(f"Cleaned up {cleaned} idle agent instances")
@@ -174,6 +269,10 @@ class OrchestratorIntegration:
         # Clear session memory
         self.memory.clear_session()
 
+        # Hand this node's instance leases back to the shared pool
+        if self.pool_integration.coordinator:
+            self.pool_integration.coordinator.stop(release=True)
+
         self.logger.info("Orchestrator integration shutdown complete")
 
     def create_pool_agent_with_learning(
@@ -28,6 +28,16 @@ class WorkflowStepType(Enum):
     OUTPUT = "output"
 
 
+# Step types that only read inputs; their results can be memoized
+_CACHEABLE_STEP_TYPES = frozenset({
+    WorkflowStepType.RESEARCH,
+    WorkflowStepType.ANALYSIS,
+    WorkflowStepType.PLANNING,
+    WorkflowStepType.REVIEW,
+    WorkflowStepType.SYNTHESIS,
+})
+
+
 @dataclass
 class WorkflowStep:
     """Represents a single step in a workflow."""
@@ -42,6 +52,7 @@ class WorkflowStep:
     quality_gates: Dict[str, Any] = field(default_factory=dict)
     parallel: bool = False
     timeout_seconds: int = 300
+    cacheable: Optional[bool] = None  # None = decided by step_type
 
 
 @dataclass
@@ -55,6 +66,15 @@ class WorkflowTemplate:
     steps: List[WorkflowStep] = field(default_factory=list)
     estimated_duration_minutes: int = 30
     complexity: str = "medium"  # simple, medium, complex
+    cacheable: bool = True  # False disables result caching for every step
+
+    def is_step_cacheable(self, step: WorkflowStep) -> bool:
+        """Whether results of step may be served from the workflow result cache."""
+        if not self.cacheable:
+            return False
+        if step.cacheable is not None:
+            return step.cacheable
+        return step.step_type in _CACHEABLE_STEP_TYPES
 
     def get_all_required_agents(self) -> List[str]:
         """Get all unique required agents across all steps."""
@@ -33,6 +33,7 @@ GROQ_API_TIMEOUT = 20  # Groq API (fast inference)
 AGENT_CREATION_TIMEOUT = 60  # Agent initialization
 AGENT_EXECUTION_TIMEOUT = 300  # 5 minutes for task execution
 AGENT_CLEANUP_TIMEOUT = 10  # Cleanup operations
+AGENT_ACQUIRE_TIMEOUT = 120  # Wait for a pooled instance when at capacity
 
 # Browser automation timeouts
 BROWSER_STARTUP_TIMEOUT = 30  # Browser launch
@@ -45,6 +46,9 @@ CLAUDE_CODE_CREATE_TIMEOUT = 90  # Agent creation via API or Max
 CLAUDE_CODE_EXECUTE_TIMEOUT = 600  # 10 minutes for code execution
 CLAUDE_CODE_CLEANUP_TIMEOUT = 15  # Cleanup after execution
 
+# Workflow execution timeouts
+WORKFLOW_TASK_TIMEOUT = 600  # Per task attempt (WorkflowTask.timeout_seconds overrides)
+
 # ============================================================================
 # Database and Storage Timeouts
 # ============================================================================
@@ -143,6 +147,8 @@ def get_timeout(operation: str, default: float = 30.0) -> float:
         'agent_creation': AGENT_CREATION_TIMEOUT,
         'agent_execution': AGENT_EXECUTION_TIMEOUT,
         'agent_cleanup': AGENT_CLEANUP_TIMEOUT,
+        'agent_acquire': AGENT_ACQUIRE_TIMEOUT,
+        'workflow_task': WORKFLOW_TASK_TIMEOUT,
 
         # Browser
         'browser_startup': BROWSER_STARTUP_TIMEOUT,
@@ -7,6 +7,10 @@ for complex multi-agent tasks.
 Modules:
     workflow_planner: Task decomposition and planning
     execution_engine: Workflow execution with strategies
+    task_graph: Dependency validation and critical path
+    result_cache: Content-addressed memoization of task results
+    hedging: Speculative duplicate attempts for slow tasks
+    events: Progress events and subscriptions
     workflow_models: Data structures for workflows
 
 Example:
@@ -27,6 +31,10 @@ from .workflow_models import (
 )
 from .workflow_planner import WorkflowPlanner
 from .execution_engine import ExecutionEngine
+from .task_graph import TaskGraph
+from .result_cache import TaskResultCache
+from .hedging import HedgePolicy
+from .events import EventBus, EventSubscription, WorkflowEvent
 
 __all__ = [
     "ExecutionStrategy",
@@ -36,4 +44,10 @@ __all__ = [
     "WorkflowPlan",
     "WorkflowPlanner",
     "ExecutionEngine",
+    "TaskGraph",
+    "TaskResultCache",
+    "HedgePolicy",
+    "EventBus",
+    "EventSubscription",
+    "WorkflowEvent",
 ]
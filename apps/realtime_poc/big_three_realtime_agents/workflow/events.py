@@ -0,0 +1,215 @@
+"""
+Workflow events - Structured progress events and subscriptions.
+
+The execution engine publishes an event whenever a workflow, stage or task
+starts, makes progress or finishes. Consumers subscribe with a callback
+(pushed synchronously) or iterate a queue-backed subscription, so the UI,
+exporters and memory all see progress without polling.
+"""
+
+import asyncio
+import inspect
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Event types published by ExecutionEngine
+WORKFLOW_STARTED = "workflow_started"
+WORKFLOW_COMPLETED = "workflow_completed"
+STAGE_STARTED = "stage_started"
+STAGE_COMPLETED = "stage_completed"
+TASK_STARTED = "task_started"
+TASK_PROGRESS = "task_progress"
+TASK_COMPLETED = "task_completed"
+
+_sequence = itertools.count(1)
+
+
+@dataclass
+class WorkflowEvent:
+    """
+    One progress event of a workflow execution.
+
+    Attributes:
+        event_type: One of the event type constants of this module
+        execution_id: Execution the event belongs to
+        plan_id: Plan being executed
+        stage_id: Stage (stage events)
+        task_id: Task (task events)
+        data: Event details (status, agent_id, duration, error, ...)
+        timestamp: When the event happened
+        sequence: Process-wide increasing event number
+    """
+    event_type: str
+    execution_id: Optional[str] = None
+    plan_id: Optional[str] = None
+    stage_id: Optional[str] = None
+    task_id: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+    sequence: int = field(default_factory=lambda: next(_sequence))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        return {
+            "event_type": self.event_type,
+            "execution_id": self.execution_id,
+            "plan_id": self.plan_id,
+            "stage_id": self.stage_id,
+            "task_id": self.task_id,
+            "data": self.data,
+            "timestamp": self.timestamp.isoformat(),
+            "sequence": self.sequence,
+        }
+
+
+class EventSubscription:
+    """
+    Queue-backed event subscription, consumed with ``async for``.
+
+    A full queue drops its oldest event (counted in ``dropped``) so a slow
+    consumer never blocks workflow execution.
+    """
+
+    _CLOSED = object()
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        event_types: Optional[Iterable[str]] = None,
+        execution_id: Optional[str] = None,
+        max_queue: int = 1000,
+    ):
+        """
+        Initialize subscription.
+
+        Args:
+            bus: Event bus the subscription is registered with
+            event_types: Only receive these event types (None = all)
+            execution_id: Only receive events of this execution (None = all)
+            max_queue: Buffered events before the oldest is dropped (0 = unbounded)
+        """
+        self.bus = bus
+        self.event_types = set(event_types) if event_types else None
+        self.execution_id = execution_id
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+
+    def matches(self, event: WorkflowEvent) -> bool:
+        """Whether event passes this subscription's filters."""
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        return self.execution_id is None or event.execution_id == self.execution_id
+
+    def _push(self, item: Any) -> None:
+        """Enqueue without blocking, dropping the oldest event when full."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self.dropped += 1
+
+    def close(self) -> None:
+        """Stop the subscription; iteration ends after buffered events."""
+        if not self.closed:
+            self.closed = True
+            self.bus.unsubscribe(self)
+            self._push(self._CLOSED)
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> WorkflowEvent:
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        return item
+
+
+class EventBus:
+    """
+    Fan-out of workflow events to any number of subscribers.
+
+    Example:
+        >>> bus = EventBus()
+        >>> bus.subscribe(lambda event: print(event.event_type))
+        >>> subscription = bus.subscription(event_types=[TASK_COMPLETED])
+        >>> async for event in subscription:
+        ...     print(event.task_id, event.data["status"])
+    """
+
+    def __init__(self):
+        """Initialize event bus."""
+        self._callbacks: List[Callable[[WorkflowEvent], Any]] = []
+        self._subscriptions: List[EventSubscription] = []
+        self.published = 0
+
+    def subscribe(self, callback: Callable[[WorkflowEvent], Any]) -> Callable[[WorkflowEvent], Any]:
+        """
+        Register a callback for every event.
+
+        Callbacks run synchronously in the publisher; coroutine functions
+        are scheduled as tasks. Exceptions are logged and never reach the
+        workflow.
+
+        Returns:
+            The callback (pass to unsubscribe() to remove it)
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def subscription(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        execution_id: Optional[str] = None,
+        max_queue: int = 1000,
+    ) -> EventSubscription:
+        """
+        Create a subscription to iterate with ``async for``.
+
+        Args:
+            event_types: Only receive these event types (None = all)
+            execution_id: Only receive events of this execution (None = all)
+            max_queue: Buffered events before the oldest is dropped (0 = unbounded)
+
+        Returns:
+            EventSubscription (call close() when done)
+        """
+        subscription = EventSubscription(self, event_types, execution_id, max_queue)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscriber: Any) -> None:
+        """Remove a callback or subscription."""
+        if subscriber in self._callbacks:
+            self._callbacks.remove(subscriber)
+        elif subscriber in self._subscriptions:
+            self._subscriptions.remove(subscriber)
+
+    def publish(self, event: WorkflowEvent) -> None:
+        """Deliver event to all matching subscribers."""
+        self.published += 1
+
+        for callback in list(self._callbacks):
+            try:
+                outcome = callback(event)
+                if inspect.isawaitable(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception as exc:
+                logger.warning(f"Workflow event subscriber failed: {exc}")
+
+        for subscription in list(self._subscriptions):
+            if subscription.matches(event):
+                subscription._push(event)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active callbacks and subscriptions."""
+        return len(self._callbacks) + len(self._subscriptions)
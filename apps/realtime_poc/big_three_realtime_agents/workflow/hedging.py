@@ -0,0 +1,190 @@
+"""
+Hedging - Speculative duplicate attempts for straggling workflow tasks.
+
+Tracks task durations per agent type. When an idempotent task runs longer
+than a high percentile of its agent's history, the engine starts a second
+attempt on another pool instance and keeps whichever finishes first. A
+global budget caps hedges to a fraction of all tasks.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(samples: Iterable[float], q: float) -> Optional[float]:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Observed values
+        q: Quantile in [0, 1]
+
+    Returns:
+        Percentile value or None without samples
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class HedgePolicy:
+    """
+    When to hedge, within what budget, and how well it worked.
+
+    Example:
+        >>> policy = HedgePolicy(percentile=0.9, budget_fraction=0.1)
+        >>> policy.record_duration("python-expert", 42.0)
+        >>> policy.hedge_delay("python-expert")    # None until min_samples
+        >>> policy.get_stats()["hedge_rate"]
+        0.0
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        min_samples: int = 5,
+        history: int = 200,
+        budget_fraction: float = 0.1,
+        min_delay_seconds: float = 1.0,
+        duration_estimator=None,
+        logger_instance=None,
+    ):
+        """
+        Initialize hedge policy.
+
+        Args:
+            percentile: Duration percentile after which a task is hedged
+            min_samples: Durations needed for an agent before hedging it
+            history: Durations kept per agent
+            budget_fraction: Maximum share of tasks that may be hedged
+            min_delay_seconds: Never hedge earlier than this
+            duration_estimator: Historical p90 used while an agent has
+                fewer than min_samples local durations
+            logger_instance: Logger instance
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.history = history
+        self.budget_fraction = budget_fraction
+        self.min_delay_seconds = min_delay_seconds
+        self.duration_estimator = duration_estimator
+        self.logger = logger_instance or logger
+
+        self._durations: Dict[str, Deque[float]] = {}
+        self._completed: Dict[str, Deque[float]] = {}
+        self._latencies: Deque[float] = deque(maxlen=history * 4)
+        self._unhedged: Deque[float] = deque(maxlen=history * 4)
+
+        self.tasks = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    def _history(self, table: Dict[str, Deque[float]], agent_id: str) -> Deque[float]:
+        """Bounded duration history of agent in table."""
+        samples = table.get(agent_id)
+        if samples is None:
+            samples = table[agent_id] = deque(maxlen=self.history)
+        return samples
+
+    def record_duration(self, agent_id: str, seconds: float, completed: bool = True) -> None:
+        """
+        Record how long one attempt of an agent took.
+
+        Args:
+            agent_id: Agent type
+            seconds: Attempt duration (elapsed time if cancelled)
+            completed: False for attempts cancelled after losing a race;
+                their elapsed time only bounds the real duration from below
+        """
+        self._history(self._durations, agent_id).append(seconds)
+        if completed:
+            self._history(self._completed, agent_id).append(seconds)
+
+    def hedge_delay(self, agent_id: str, description: str = "") -> Optional[float]:
+        """
+        Seconds after which a task of agent_id should be hedged.
+
+        Args:
+            agent_id: Agent type
+            description: Task description (refines the historical fallback)
+
+        Returns:
+            Delay, or None while there is too little history
+        """
+        samples = self._durations.get(agent_id)
+        if samples and len(samples) >= self.min_samples:
+            return max(self.min_delay_seconds, percentile(samples, self.percentile))
+
+        if self.duration_estimator is not None:
+            estimate = self.duration_estimator.quantiles(agent_id, description)
+            if estimate["source"] != "default":
+                return max(self.min_delay_seconds, estimate["p90"])
+        return None
+
+    def try_reserve(self) -> bool:
+        """
+        Take a hedge from the global budget.
+
+        Returns:
+            True if hedging is allowed now
+        """
+        if self.hedged + 1 > self.budget_fraction * max(self.tasks, 1):
+            self.budget_denied += 1
+            return False
+        self.hedged += 1
+        return True
+
+    def record_task(self, agent_id: str, latency: float, hedge_won: bool = False) -> None:
+        """
+        Record end-to-end latency of a hedge-eligible task.
+
+        When the hedge won, the latency the task would have had without
+        hedging is estimated as the mean of completed attempts of the agent
+        that ran longer than the delivered latency (or the delivered latency
+        itself if none are known, so the estimate errs low).
+        """
+        self.tasks += 1
+        self._latencies.append(latency)
+
+        unhedged = latency
+        if hedge_won:
+            self.hedge_wins += 1
+            slower = [s for s in self._completed.get(agent_id, ()) if s > latency]
+            if slower:
+                unhedged = sum(slower) / len(slower)
+        self._unhedged.append(unhedged)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Hedge rate and tail latency with vs. (estimated) without hedging.
+
+        ``tail_latency_improvement_seconds`` is the estimated p99 without
+        hedging minus the delivered p99.
+        """
+        delivered_p99 = percentile(self._latencies, 0.99)
+        unhedged_p99 = percentile(self._unhedged, 0.99)
+        improvement = (
+            round(unhedged_p99 - delivered_p99, 3)
+            if delivered_p99 is not None and unhedged_p99 is not None
+            else None
+        )
+        return {
+            "tasks": self.tasks,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged / self.tasks if self.tasks else 0.0,
+            "budget_fraction": self.budget_fraction,
+            "budget_denied": self.budget_denied,
+            "p50_seconds": percentile(self._latencies, 0.5),
+            "p95_seconds": percentile(self._latencies, 0.95),
+            "p99_seconds": delivered_p99,
+            "unhedged_p95_seconds": percentile(self._unhedged, 0.95),
+            "unhedged_p99_seconds": unhedged_p99,
+            "tail_latency_improvement_seconds": improvement,
+        }
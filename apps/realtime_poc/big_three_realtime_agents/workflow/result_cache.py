@@ -0,0 +1,226 @@
+"""
+Result cache - Content-addressed memoization of workflow task results.
+
+A task result is keyed by a hash of everything that determines it: the
+agent, the normalized description, the outputs of upstream tasks and the
+state of the working tree. Re-running an identical task against unchanged
+inputs returns the stored result instead of starting an agent session.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Directories never part of the file-tree hash
+_IGNORED_DIRS = frozenset({
+    ".git", "__pycache__", "node_modules", ".venv", "venv", ".mypy_cache", ".pytest_cache",
+})
+
+
+def normalize_description(description: str) -> str:
+    """Lowercase description with runs of whitespace collapsed."""
+    return _WHITESPACE.sub(" ", description.strip().lower())
+
+
+def content_hash(text: Optional[str]) -> str:
+    """Short SHA-256 digest of text (None hashes like empty text)."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:32]
+
+
+class TaskResultCache:
+    """
+    LRU + TTL cache of completed task results.
+
+    Example:
+        >>> cache = TaskResultCache(ttl_seconds=3600, file_root=working_dir)
+        >>> key = cache.make_key("python-expert", "Review auth module", [upstream_hash])
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, result, agent_id="python-expert")
+        >>> cache.get(key)["output"]
+        '...'
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512,
+        file_root: Optional[Path] = None,
+        exclude_paths: Iterable[Path] = (),
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum cached results (LRU eviction)
+            file_root: Working tree whose state is part of every key
+                (None = file changes do not invalidate entries)
+            exclude_paths: Directories under file_root left out of the
+                tree hash (e.g. the storage directory)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.file_root = Path(file_root) if file_root else None
+        self.exclude_paths = {Path(p).resolve() for p in exclude_paths}
+
+        self._entries: "OrderedDict[str, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def tree_hash(self) -> str:
+        """
+        Hash of the working tree (relative path, size and mtime of every file).
+
+        Returns:
+            Hex digest ("" without file_root)
+        """
+        if self.file_root is None or not self.file_root.exists():
+            return ""
+
+        entries: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(self.file_root):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if d not in _IGNORED_DIRS and Path(dirpath, d).resolve() not in self.exclude_paths
+            )
+            for name in sorted(filenames):
+                path = Path(dirpath, name)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                relative = path.relative_to(self.file_root).as_posix()
+                entries.append(f"{relative}:{stat.st_size}:{stat.st_mtime_ns}")
+
+        return content_hash("\n".join(entries))
+
+    def make_key(
+        self,
+        agent_id: str,
+        description: str,
+        upstream_hashes: Iterable[str] = (),
+        tree_hash: Optional[str] = None,
+    ) -> str:
+        """
+        Cache key of a task.
+
+        Args:
+            agent_id: Expert agent running the task
+            description: Task description (normalized before hashing)
+            upstream_hashes: Content hashes of the task's inputs
+            tree_hash: Working tree hash (computed when None)
+
+        Returns:
+            Hex digest identifying the task and its inputs
+        """
+        if tree_hash is None:
+            tree_hash = self.tree_hash()
+        parts = [agent_id, normalize_description(description), *upstream_hashes, tree_hash]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Copy of the cached result (with "cached_at") or None
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, _, result = entry
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return {**result, "cached_at": stored_at}
+
+    def put(self, key: str, result: Dict[str, Any], agent_id: str = "") -> None:
+        """
+        Cache a completed task result.
+
+        Args:
+            key: Key from make_key()
+            result: Task result
+            agent_id: Agent that produced it (for targeted invalidation)
+        """
+        with self._lock:
+            self._entries[key] = (time.time(), agent_id, dict(result))
+            self._entries.move_to_end(key)
+            self._stores += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, agent_id: Optional[str] = None) -> int:
+        """
+        Drop cached results.
+
+        Args:
+            agent_id: Only drop results of this agent (None = everything)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if agent_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [k for k, (_, owner, _) in self._entries.items() if owner == agent_id]
+                for key in keys:
+                    del self._entries[key]
+                removed = len(keys)
+
+            self._invalidations += removed
+
+        if removed:
+            logger.info(f"Invalidated {removed} cached task results")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
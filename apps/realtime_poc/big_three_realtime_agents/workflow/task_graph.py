@@ -0,0 +1,156 @@
+"""
+Task graph - Dependency analysis for workflow plans.
+
+Builds the task dependency DAG of a plan, detects unknown dependencies
+and cycles, and computes topological order and critical path.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .workflow_models import WorkflowPlan, WorkflowTask
+from ..exceptions import WorkflowPlanningError
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """
+    Dependency DAG of a workflow plan.
+
+    Example:
+        >>> graph = TaskGraph.from_plan(plan)      # raises on cycles
+        >>> graph.topological_order()
+        ['task_1', 'task_2', 'task_3']
+        >>> graph.critical_path()
+        (['task_1', 'task_3'], 240.0)
+    """
+
+    def __init__(self, tasks: List[WorkflowTask]):
+        """
+        Build and validate graph.
+
+        Args:
+            tasks: All tasks of the plan
+
+        Raises:
+            WorkflowPlanningError: Duplicate IDs, unknown dependencies or cycles
+        """
+        self.tasks: Dict[str, WorkflowTask] = {}
+        for task in tasks:
+            if task.task_id in self.tasks:
+                raise WorkflowPlanningError(f"Duplicate task id: {task.task_id}")
+            self.tasks[task.task_id] = task
+
+        self.dependents: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+        for task in tasks:
+            for dep in task.dependencies:
+                if dep not in self.tasks:
+                    raise WorkflowPlanningError(
+                        f"Task {task.task_id} depends on unknown task: {dep}"
+                    )
+                self.dependents[dep].append(task.task_id)
+
+        self._order = self._topological_sort()
+
+    @classmethod
+    def from_plan(cls, plan: WorkflowPlan) -> "TaskGraph":
+        """Graph of all tasks in plan."""
+        return cls(plan.get_all_tasks())
+
+    def _topological_sort(self) -> List[str]:
+        """Kahn's algorithm (plan order among ready tasks); raises on cycles."""
+        remaining = {task_id: len(task.dependencies) for task_id, task in self.tasks.items()}
+        ready = [task_id for task_id, count in remaining.items() if count == 0]
+        order = []
+
+        while ready:
+            task_id = ready.pop(0)
+            order.append(task_id)
+            for dependent in self.dependents[task_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(self.tasks):
+            cycle = self._find_cycle({t for t, count in remaining.items() if count > 0})
+            raise WorkflowPlanningError(f"Dependency cycle: {' -> '.join(cycle)}")
+        return order
+
+    def _find_cycle(self, candidates) -> List[str]:
+        """One cycle among tasks left over by the topological sort."""
+        start = sorted(candidates)[0]
+        path, seen = [start], {start: 0}
+        while True:
+            deps = [d for d in self.tasks[path[-1]].dependencies if d in candidates]
+            nxt = deps[0]
+            if nxt in seen:
+                return path[seen[nxt]:] + [nxt]
+            seen[nxt] = len(path)
+            path.append(nxt)
+
+    def topological_order(self) -> List[str]:
+        """Task IDs with every task after its dependencies."""
+        return list(self._order)
+
+    def roots(self) -> List[str]:
+        """Tasks without dependencies."""
+        return [task_id for task_id in self._order if not self.tasks[task_id].dependencies]
+
+    def critical_path(
+        self, duration: Optional[Callable[[WorkflowTask], float]] = None
+    ) -> Tuple[List[str], float]:
+        """
+        Longest dependency chain.
+
+        Args:
+            duration: Task weight (default: estimated_duration)
+
+        Returns:
+            (task IDs on the critical path, total duration)
+        """
+        if not self.tasks:
+            return [], 0.0
+
+        duration = duration or (lambda task: float(task.estimated_duration))
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+
+        for task_id in self._order:
+            task = self.tasks[task_id]
+            start, previous = 0.0, None
+            for dep in task.dependencies:
+                if finish[dep] > start:
+                    start, previous = finish[dep], dep
+            finish[task_id] = start + duration(task)
+            via[task_id] = previous
+
+        end = max(finish, key=finish.get)
+        path = [end]
+        while via[path[-1]] is not None:
+            path.append(via[path[-1]])
+        path.reverse()
+        return path, finish[end]
+
+    def bottom_levels(
+        self, duration: Optional[Callable[[WorkflowTask], float]] = None
+    ) -> Dict[str, float]:
+        """
+        Longest remaining chain from each task to the end of the graph.
+
+        Starting ready tasks in descending bottom level keeps the critical
+        path moving when concurrency is limited.
+
+        Args:
+            duration: Task weight (default: estimated_duration)
+
+        Returns:
+            Task ID -> own duration plus the heaviest chain of dependents
+        """
+        duration = duration or (lambda task: float(task.estimated_duration))
+        levels: Dict[str, float] = {}
+
+        for task_id in reversed(self._order):
+            below = [levels[dependent] for dependent in self.dependents[task_id]]
+            levels[task_id] = duration(self.tasks[task_id]) + max(below, default=0.0)
+        return levels
@@ -24,6 +24,12 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    TIMED_OUT = "timed_out"
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse ISO timestamp (None passes through)."""
+    return datetime.fromisoformat(value) if value else None
 
 
 @dataclass
@@ -40,6 +46,11 @@ class WorkflowTask:
         status: Current status
         result: Task execution result
         error: Error message if failed
+        cacheable: Result may be reused for identical inputs (no side effects)
+        idempotent: Safe to run twice at once (eligible for hedging)
+        timeout_seconds: Deadline per attempt (None = engine default)
+        stream_chunks: In a pipeline stage, run once per upstream chunk
+            instead of once over the whole upstream output
     """
     task_id: str
     description: str
@@ -51,6 +62,10 @@ class WorkflowTask:
     error: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    cacheable: bool = False
+    idempotent: bool = False
+    timeout_seconds: Optional[float] = None
+    stream_chunks: bool = False
 
     def start(self) -> None:
         """Mark task as started."""
@@ -69,6 +84,59 @@ class WorkflowTask:
         self.error = error
         self.completed_at = datetime.now()
 
+    def time_out(self, error: str) -> None:
+        """Mark task as timed out (retryable, unlike a failure)."""
+        self.status = TaskStatus.TIMED_OUT
+        self.error = error
+        self.completed_at = datetime.now()
+
+    def reset(self) -> None:
+        """Return task to pending (for re-execution)."""
+        self.status = TaskStatus.PENDING
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.completed_at = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable task state."""
+        return {
+            "task_id": self.task_id,
+            "description": self.description,
+            "agent_id": self.agent_id,
+            "estimated_duration": self.estimated_duration,
+            "dependencies": list(self.dependencies),
+            "status": self.status.value,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "cacheable": self.cacheable,
+            "idempotent": self.idempotent,
+            "timeout_seconds": self.timeout_seconds,
+            "stream_chunks": self.stream_chunks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowTask":
+        """Rebuild task from to_dict() output."""
+        return cls(
+            task_id=data["task_id"],
+            description=data["description"],
+            agent_id=data["agent_id"],
+            estimated_duration=data.get("estimated_duration", 60),
+            dependencies=list(data.get("dependencies", [])),
+            status=TaskStatus(data.get("status", "pending")),
+            result=data.get("result"),
+            error=data.get("error"),
+            started_at=_parse_datetime(data.get("started_at")),
+            completed_at=_parse_datetime(data.get("completed_at")),
+            cacheable=data.get("cacheable", False),
+            idempotent=data.get("idempotent", False),
+            timeout_seconds=data.get("timeout_seconds"),
+            stream_chunks=data.get("stream_chunks", False),
+        )
+
 
 @dataclass
 class WorkflowStage:
@@ -88,6 +156,27 @@ class WorkflowStage:
     strategy: ExecutionStrategy = ExecutionStrategy.SEQUENTIAL
     continue_on_failure: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable stage state."""
+        return {
+            "stage_id": self.stage_id,
+            "name": self.name,
+            "tasks": [task.to_dict() for task in self.tasks],
+            "strategy": self.strategy.value,
+            "continue_on_failure": self.continue_on_failure,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowStage":
+        """Rebuild stage from to_dict() output."""
+        return cls(
+            stage_id=data["stage_id"],
+            name=data["name"],
+            tasks=[WorkflowTask.from_dict(task) for task in data["tasks"]],
+            strategy=ExecutionStrategy(data.get("strategy", "sequential")),
+            continue_on_failure=data.get("continue_on_failure", False),
+        )
+
 
 @dataclass
 class WorkflowPlan:
@@ -111,6 +200,31 @@ class WorkflowPlan:
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable plan state (including task progress)."""
+        return {
+            "plan_id": self.plan_id,
+            "goal": self.goal,
+            "stages": [stage.to_dict() for stage in self.stages],
+            "estimated_total_duration": self.estimated_total_duration,
+            "success_criteria": self.success_criteria,
+            "created_at": self.created_at.isoformat(),
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowPlan":
+        """Rebuild plan from to_dict() output."""
+        return cls(
+            plan_id=data["plan_id"],
+            goal=data["goal"],
+            stages=[WorkflowStage.from_dict(stage) for stage in data["stages"]],
+            estimated_total_duration=data.get("estimated_total_duration", 0),
+            success_criteria=data.get("success_criteria", "All tasks completed successfully"),
+            created_at=_parse_datetime(data.get("created_at")) or datetime.now(),
+            metadata=dict(data.get("metadata", {})),
+        )
+
     def get_all_tasks(self) -> List[WorkflowTask]:
         """Get all tasks across all stages."""
         tasks = []
@@ -140,8 +254,8 @@ class WorkflowPlan:
         )
 
     def has_failures(self) -> bool:
-        """Check if any task failed."""
+        """Check if any task failed or timed out."""
         return any(
-            task.status == TaskStatus.FAILED
+            task.status in (TaskStatus.FAILED, TaskStatus.TIMED_OUT)
             for task in self.get_all_tasks()
         )
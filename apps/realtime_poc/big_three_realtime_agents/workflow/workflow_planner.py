@@ -7,7 +7,7 @@ with intelligent agent assignment and execution strategies.
 
 import uuid
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from .workflow_models import (
     WorkflowPlan,
@@ -15,6 +15,8 @@ from .workflow_models import (
     WorkflowTask,
     ExecutionStrategy,
 )
+from .task_graph import TaskGraph
+from ..exceptions import WorkflowPlanningError
 
 logger = logging.getLogger(__name__)
 
@@ -31,18 +33,27 @@ class WorkflowPlanner:
         >>> plan = planner.create_simple_plan("Build blog API", "backend-architect")
     """
 
-    def __init__(self, pool_manager, memory_manager):
+    def __init__(self, pool_manager, memory_manager, duration_estimator=None):
         """
         Initialize workflow planner.
 
         Args:
             pool_manager: Agent pool manager
             memory_manager: Memory manager
+            duration_estimator: Historical duration model for task
+                estimates (None = fixed 120s per task)
         """
         self.pool_manager = pool_manager
         self.memory = memory_manager
+        self.duration_estimator = duration_estimator
         self.logger = logger
 
+    def _estimate(self, agent_id: str, description: str) -> Dict[str, Any]:
+        """Duration quantiles (p50, p90, samples, source) for a planned task."""
+        if self.duration_estimator is None:
+            return {"p50": 120, "p90": 120, "samples": 0, "source": "default"}
+        return self.duration_estimator.quantiles(agent_id, description)
+
     def create_simple_plan(
         self,
         task_description: str,
@@ -61,12 +72,13 @@ class WorkflowPlanner:
             WorkflowPlan with single stage and task
         """
         plan_id = f"plan_{uuid.uuid4().hex[:8]}"
+        estimate = self._estimate(agent_id, task_description)
 
         task = WorkflowTask(
             task_id=f"task_{uuid.uuid4().hex[:6]}",
             description=task_description,
             agent_id=agent_id,
-            estimated_duration=120,
+            estimated_duration=round(estimate["p50"]),
         )
 
         stage = WorkflowStage(
@@ -80,9 +92,10 @@ class WorkflowPlanner:
             plan_id=plan_id,
             goal=task_description,
             stages=[stage],
-            estimated_total_duration=120,
+            estimated_total_duration=task.estimated_duration,
             success_criteria="Task completed without errors",
         )
+        plan.metadata["duration_estimates"] = {task.task_id: estimate}
 
         self.logger.info(f"Created simple plan: {plan_id}")
         return plan
@@ -99,21 +112,37 @@ class WorkflowPlanner:
         Args:
             goal: Overall goal
             tasks: List of task dicts with description and agent_id
+                (optional: duration, dependencies, cacheable, idempotent, timeout,
+                stream_chunks)
             strategy: Execution strategy
 
         Returns:
             WorkflowPlan with tasks organized in stages
+
+        Raises:
+            WorkflowPlanningError: Unknown dependencies or dependency cycles
         """
         plan_id = f"plan_{uuid.uuid4().hex[:8]}"
 
         workflow_tasks = []
+        estimates: Dict[str, Dict[str, Any]] = {}
         for i, task_data in enumerate(tasks, 1):
+            estimate = self._estimate(task_data["agent_id"], task_data["description"])
+            if "duration" in task_data:
+                # Explicit duration from the caller wins over history
+                estimate = {**estimate, "p50": task_data["duration"], "source": "explicit"}
+            estimates[f"task_{i}"] = estimate
+
             task = WorkflowTask(
                 task_id=f"task_{i}",
                 description=task_data["description"],
                 agent_id=task_data["agent_id"],
-                estimated_duration=task_data.get("duration", 120),
+                estimated_duration=round(estimate["p50"]),
                 dependencies=task_data.get("dependencies", []),
+                cacheable=task_data.get("cacheable", False),
+                idempotent=task_data.get("idempotent", False),
+                timeout_seconds=task_data.get("timeout"),
+                stream_chunks=task_data.get("stream_chunks", False),
             )
             workflow_tasks.append(task)
 
@@ -138,11 +167,104 @@ class WorkflowPlanner:
             success_criteria="All tasks completed successfully",
         )
 
+        # Validate dependency graph and record its critical path (for DAG mode)
+        critical_path, critical_seconds = TaskGraph.from_plan(plan).critical_path()
+        plan.metadata["critical_path"] = critical_path
+        plan.metadata["critical_path_seconds"] = critical_seconds
+        plan.metadata["duration_estimates"] = estimates
+
         self.logger.info(
             f"Created multi-task plan: {plan_id} ({len(tasks)} tasks, {strategy.value})"
         )
         return plan
 
+    def create_template_plan(self, template, goal: Optional[str] = None) -> WorkflowPlan:
+        """
+        Create workflow from a WorkflowTemplate.
+
+        Each step becomes a task run by its first required agent; runs of
+        parallel steps share a parallel stage. A step depends on the earlier
+        steps producing its inputs. Result caching follows the template's
+        per-step cacheability; cacheable (side-effect free) steps are also
+        marked idempotent, so they may be hedged and retried. Each task is
+        cancelled after its step's ``timeout_seconds``.
+
+        Args:
+            template: WorkflowTemplate (see profiles.workflow_templates)
+            goal: What the workflow is for (default: template description)
+
+        Returns:
+            WorkflowPlan with one stage per step or group of parallel steps
+
+        Raises:
+            WorkflowPlanningError: A step names no agent
+        """
+        plan_id = f"plan_{uuid.uuid4().hex[:8]}"
+        goal = goal or template.description
+
+        stages: List[WorkflowStage] = []
+        estimates: Dict[str, Dict[str, Any]] = {}
+        producers: Dict[str, str] = {}
+        for i, step in enumerate(template.steps, 1):
+            agents = step.required_agents or step.optional_agents
+            if not agents:
+                raise WorkflowPlanningError(f"Template step '{step.name}' names no agent")
+            cacheable = template.is_step_cacheable(step)
+
+            description = f"{step.description} (goal: {goal})"
+            estimate = self._estimate(agents[0], description)
+            task = WorkflowTask(
+                task_id=f"task_{i}",
+                description=description,
+                agent_id=agents[0],
+                estimated_duration=round(estimate["p50"]),
+                dependencies=sorted({producers[name] for name in step.inputs if name in producers}),
+                cacheable=cacheable,
+                idempotent=cacheable,
+                timeout_seconds=step.timeout_seconds,
+            )
+            estimates[task.task_id] = estimate
+            for name in step.outputs:
+                producers[name] = task.task_id
+
+            previous = stages[-1] if stages else None
+            if (
+                step.parallel
+                and previous is not None
+                and previous.strategy == ExecutionStrategy.PARALLEL
+                and not set(task.dependencies) & {t.task_id for t in previous.tasks}
+            ):
+                previous.tasks.append(task)
+                continue
+
+            stages.append(WorkflowStage(
+                stage_id=f"stage_{len(stages) + 1}",
+                name=step.name,
+                tasks=[task],
+                strategy=ExecutionStrategy.PARALLEL if step.parallel else ExecutionStrategy.SEQUENTIAL,
+            ))
+
+        plan = WorkflowPlan(
+            plan_id=plan_id,
+            goal=goal,
+            stages=stages,
+            estimated_total_duration=sum(
+                max(t.estimated_duration for t in stage.tasks) for stage in stages
+            ),
+            success_criteria="All template steps completed successfully",
+        )
+
+        critical_path, critical_seconds = TaskGraph.from_plan(plan).critical_path()
+        plan.metadata["template"] = template.name
+        plan.metadata["critical_path"] = critical_path
+        plan.metadata["critical_path_seconds"] = critical_seconds
+        plan.metadata["duration_estimates"] = estimates
+
+        self.logger.info(
+            f"Created plan {plan_id} from template {template.name} ({len(template.steps)} steps)"
+        )
+        return plan
+
     def visualize_plan(self, plan: WorkflowPlan) -> str:
         """
         Create ASCII visualization of workflow plan.
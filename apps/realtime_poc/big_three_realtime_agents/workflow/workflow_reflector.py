@@ -88,7 +88,10 @@ class WorkflowReflector:
             for s in stage_results
         )
         failed = sum(
-            sum(1 for t in s.get("task_results", []) if t.get("status") == "failed")
+            sum(
+                1 for t in s.get("task_results", [])
+                if t.get("status") in ("failed", "timed_out")
+            )
             for s in stage_results
         )
 
@@ -85,7 +85,7 @@ class WorkflowValidator:
             )
 
         # Check 3: No critical failures
-        failed = sum(1 for r in task_results if r.get("status") == "failed")
+        failed = sum(1 for r in task_results if r.get("status") in ("failed", "timed_out"))
         if failed == 0:
             validation["checks"].append("No task failures")
             validation["score"] += 25